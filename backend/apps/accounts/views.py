@@ -12,7 +12,11 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from apps.utils.s3_presigner import create_presigned_url, s3_key_for_upload
+from apps.utils.s3_presigner import (
+    create_presigned_post,
+    create_presigned_url,
+    s3_key_for_upload,
+)
 from apps.utils.serializers import S3ImageUploadSerializer
 
 from .oauth import login_with_social
@@ -255,6 +259,7 @@ class UserInfoViewSet(viewsets.ViewSet):
         Response:
             "upload_url": S3 presigned URL
             "s3_key": S3 key of image inside the bucket
+            "fields": form fields of the presigned POST policy (upload_method "post" only)
         """
         try:
             user = User.objects.get(pk=pk)
@@ -280,9 +285,14 @@ class UserInfoViewSet(viewsets.ViewSet):
             if not bucket:
                 return JsonResponse({"error": "AWS_S3_PROFILE_BUCKET not configured"})
 
-            url, s3_key = create_presigned_url(
-                bucket=bucket, key=s3_key, content_type=serializer.validated_data["content_type"]
-            )
+            content_type = serializer.validated_data["content_type"]
+            if serializer.validated_data["upload_method"] == "post":
+                post = create_presigned_post(bucket=bucket, key=s3_key, content_type=content_type)
+                return Response(
+                    {"upload_url": post["url"], "s3_key": s3_key, "fields": post["fields"]},
+                    status=status.HTTP_200_OK,
+                )
+            url, s3_key = create_presigned_url(bucket=bucket, key=s3_key, content_type=content_type)
         except Exception as e:
             logger.error(f"Failed to generate presigned URL for user {user.id}: {str(e)}")
             raise ValidationError("Failed to generate upload URL")
@@ -347,5 +357,3 @@ class SocialLoginView(APIView):
         except Exception as e:
             logger.error(f"Social login failed: {str(e)}")
             raise ValidationError("Social login failed")
-
-    # TODO: Implement follow and unfollow funcitonality
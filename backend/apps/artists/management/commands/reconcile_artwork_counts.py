@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from apps.artists.models import Artist
+from apps.artworks.models import PUBLIC_LISTING, Artwork
+from apps.utils.counters import reconcile_counter
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute Artist.artwork_count (approved, public, non-deleted artworks) "
+        "in chunks and fix any drift."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Report drift without updating rows"
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        checked, fixed = reconcile_counter(
+            Artist,
+            "artwork_count",
+            Artwork,
+            "artist",
+            chunk_size=options["chunk_size"],
+            dry_run=dry_run,
+            related_filter=PUBLIC_LISTING,
+        )
+
+        action = "would fix" if dry_run else "fixed"
+        self.stdout.write(
+            self.style.SUCCESS(f"Checked {checked} artists, {action} {fixed} artwork counts")
+        )
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.4 on 2026-10-18 13:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("artists", "0004_remove_artist_main_image_artist_main_image_url"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="artist",
+            name="review_claimed_by",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="검수 담당자",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="artist",
+            name="review_claimed_until",
+            field=models.DateTimeField(blank=True, help_text="검수 점유 만료", null=True),
+        ),
+        migrations.AddIndex(
+            model_name="artist",
+            index=models.Index(
+                condition=models.Q(("approval_status", "PENDING")),
+                fields=["created_at", "id"],
+                name="artist_review_queue_idx",
+            ),
+        ),
+    ]
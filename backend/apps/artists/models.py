@@ -36,6 +36,17 @@ class Artist(TranslatableModel):
 
     is_featured = models.BooleanField(default=False, help_text="추천 작가 여부")
 
+    # 검수 큐 점유 정보 (apps.utils.moderation_queue, 만료 시 다시 큐로 반환)
+    review_claimed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        help_text="검수 담당자",
+    )
+    review_claimed_until = models.DateTimeField(null=True, blank=True, help_text="검수 점유 만료")
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -47,6 +58,12 @@ class Artist(TranslatableModel):
             models.Index(fields=["created_at"]),
             models.Index(fields=["follower_count"]),
             models.Index(fields=["is_featured"]),
+            # 검수 큐: 승인대기 행만 오래된 순으로 탐색
+            models.Index(
+                fields=["created_at", "id"],
+                name="artist_review_queue_idx",
+                condition=models.Q(approval_status="PENDING"),
+            ),
         ]
 
     def __str__(self):
@@ -67,13 +84,6 @@ class Artist(TranslatableModel):
         else:
             return True
 
-    def update_artwork_count(self):
-        if hasattr(self, "artworks"):
-            self.artwork_count = self.artworks.filter(
-                approval_status="approved", is_active=True
-            ).count()
-            self.save(update_fields=["artwork_count"])
-
     @classmethod
     def get_featured_artists(cls):
         """
@@ -100,7 +110,8 @@ class Artist(TranslatableModel):
         return self.followers.select_related("follower")
 
     def get_follower_count(self):
-        return self.followers.count()
+        # follow/unfollow 시 함께 갱신되는 비정규화 카운터 (reconcile_follower_counts 로 보정)
+        return self.follower_count
 
     def get_received_inquiries(self):
         return PurchaseInquiry.objects.filter(artwork__artist=self).select_related(
@@ -0,0 +1,44 @@
+from django.db import transaction
+from django.utils import timezone
+
+from apps.utils.bulk import bulk_set_fields
+from apps.utils.moderation_queue import claim_pending, release_claims
+
+from .models import Artist
+from .signals import artists_moderated
+
+
+def moderate_artists(artist_ids, approval_status: str) -> dict[int, str]:
+    """Set `approval_status` on many artists with one UPDATE.
+
+    Sends a single `artists_moderated` signal after commit for notification fan-out.
+
+    Returns:
+        dict[int, str]: outcome per id (updated / unchanged / not_found)
+    """
+    with transaction.atomic():
+        changed, outcomes = bulk_set_fields(
+            Artist,
+            artist_ids,
+            {"approval_status": approval_status},
+            {"review_claimed_by": None, "review_claimed_until": None, "updated_at": timezone.now()},
+        )
+        if changed:
+            transaction.on_commit(
+                lambda: artists_moderated.send(
+                    sender=Artist, artist_ids=changed, approval_status=approval_status
+                )
+            )
+    return outcomes
+
+
+def claim_artists(user, limit: int):
+    """Claim the oldest pending artist profiles for a moderator (see `claim_pending`)."""
+    pending = Artist.objects.filter(
+        approval_status=Artist.ApprovalStatus.PENDING, user__user_type="ARTIST"
+    )
+    return claim_pending(pending, user, limit)
+
+
+def release_artists(user, artist_ids) -> int:
+    return release_claims(Artist, artist_ids, user)
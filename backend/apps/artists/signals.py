@@ -0,0 +1,4 @@
+from django.dispatch import Signal
+
+# 일괄 승인/거절 후(커밋 이후) 1회 발송: artist_ids, approval_status
+artists_moderated = Signal()
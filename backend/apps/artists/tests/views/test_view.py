@@ -5,6 +5,8 @@ from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework import status
 
+from apps.interactions.models import Notification
+
 User = get_user_model()
 
 
@@ -34,6 +36,43 @@ class TestArtistProfileViewSet:
         response = admin_client.post(url)
         assert response.status_code == status.HTTP_200_OK
 
+    def test_bulk_approve_artists(self, admin_client, artist):
+        """artist bulk approval test"""
+        url = reverse("artists-admin-bulk-approve")
+        response = admin_client.post(url, {"ids": [artist.id, 99999]}, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["updated"] == 1
+        assert response.data["results"] == [
+            {"id": artist.id, "status": "updated"},
+            {"id": 99999, "status": "not_found"},
+        ]
+        artist.refresh_from_db()
+        assert artist.is_approved
+
+    def test_bulk_approve_notifies_artists(
+        self, admin_client, artist, django_capture_on_commit_callbacks
+    ):
+        """artists_moderated receiver creates one system notification per artist"""
+        with django_capture_on_commit_callbacks(execute=True):
+            admin_client.post(
+                reverse("artists-admin-bulk-approve"), {"ids": [artist.id]}, format="json"
+            )
+
+        notification = Notification.objects.get(recipient=artist.user)
+        assert notification.notification_type == "system"
+        assert notification.related_artist_id == artist.id
+
+    def test_claim_artist_review_queue(self, admin_client, artist):
+        """artist moderation queue claim test"""
+        url = reverse("artists-admin-queue-claim")
+        response = admin_client.post(url, {"limit": 5}, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data["results"]] == [artist.id]
+
+        # 점유 중인 작가는 다시 배정되지 않음
+        response = admin_client.post(url, {"limit": 5}, format="json")
+        assert response.data["results"] == []
+
     def test_update_artist_profile(self, artist_client, artist):
         """artist profile update test"""
         from django.utils import translation
@@ -9,10 +9,22 @@ from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 
 from apps.artists.models import Artist
+from apps.interactions.services import follow_artist, unfollow_artist
+from apps.utils.bulk import UPDATED
 from apps.utils.permissions import IsSelf
-from apps.utils.s3_presigner import create_presigned_url, s3_key_for_upload
-from apps.utils.serializers import S3ImageUploadSerializer
-
+from apps.utils.s3_presigner import (
+    create_presigned_post,
+    create_presigned_url,
+    s3_key_for_upload,
+)
+from apps.utils.serializers import (
+    BulkIdsSerializer,
+    ModerationClaimSerializer,
+    S3ImageUploadSerializer,
+)
+from apps.utils.translations import prefetch_translations
+
+from .moderation import claim_artists, moderate_artists, release_artists
 from .serializers import ArtistAdminSerializer, ArtistProfileSerializer
 
 logger = logging.getLogger(__name__)
@@ -28,13 +40,13 @@ class ArtistProfileViewSet(viewsets.ModelViewSet):
     serializer_class = ArtistProfileSerializer
 
     def get_queryset(self):
-        return (
-            Artist.objects.filter(
-                user__user_type="ARTIST",
-            )
-            .select_related("user")
-            .prefetch_related("artworks")
-        )
+        qs = Artist.objects.filter(
+            user__user_type="ARTIST",
+        ).select_related("user")
+        # 인기순: 비정규화된 follower_count 인덱스로 정렬 (팔로우 집계 없음)
+        if self.request.query_params.get("ordering") == "popular":
+            qs = qs.order_by("-follower_count", "-id")
+        return prefetch_translations(qs, all_languages=True)
 
     def get_permissions(self):
         if self.action in ["create", "update", "partial_update", "destroy"]:
@@ -51,6 +63,22 @@ class ArtistProfileViewSet(viewsets.ModelViewSet):
             raise ValidationError("Only artist can create main image.")
         serializer.save(user=self.request.user)
 
+    @action(detail=True, methods=["post", "delete"], url_path="follow", url_name="follow")
+    def follow(self, request, pk=None) -> Response:
+        """Follow (POST) or unfollow (DELETE) an artist."""
+        artist = self.get_object()
+        if request.method == "POST":
+            if artist.user_id == request.user.id:
+                raise ValidationError("Cannot follow yourself.")
+            follow_artist(request.user, artist)
+            following = True
+        else:
+            unfollow_artist(request.user, artist)
+            following = False
+
+        follower_count = Artist.objects.values_list("follower_count", flat=True).get(pk=artist.pk)
+        return Response({"following": following, "follower_count": follower_count})
+
     def get_artist_for_me(self, user):
         try:
             artist = Artist.objects.get(user=user)
@@ -101,6 +129,7 @@ class ArtistProfileViewSet(viewsets.ModelViewSet):
         Response:
             "upload_url": S3 presigned URL
             "s3_key": S3 key of image inside the bucket
+            "fields": form fields of the presigned POST policy (upload_method "post" only)
         """
         artist = self.get_artist_for_me(request.user)
 
@@ -124,12 +153,14 @@ class ArtistProfileViewSet(viewsets.ModelViewSet):
             logger.error(f"Failed to generate s3_key for {artist.user.id}: {str(e)}")
             raise ValidationError("Failed to generate s3_key")
 
+        content_type = serializer.validated_data["content_type"]
         try:
-            url, key = create_presigned_url(
-                bucket=bucket,
-                key=s3_key,
-                content_type=serializer.validated_data["content_type"],
-            )
+            if serializer.validated_data["upload_method"] == "post":
+                post = create_presigned_post(bucket=bucket, key=s3_key, content_type=content_type)
+                return Response(
+                    {"upload_url": post["url"], "s3_key": s3_key, "fields": post["fields"]}
+                )
+            url, key = create_presigned_url(bucket=bucket, key=s3_key, content_type=content_type)
         except ClientError as e:
             logger.error(f"AWS S3 error for artist {artist.id}: {e}")
             return Response(
@@ -170,19 +201,16 @@ class ArtistProfileViewSet(viewsets.ModelViewSet):
         return Response({"success": True})
 
 
-# TODO 알림이나 로그, 통계, 일괄 승인로직 추가
+# TODO 알림이나 로그, 통계 추가
 class ArtistsAdminViewSet(viewsets.ModelViewSet):
     serializer_class = ArtistAdminSerializer
     permission_classes = [IsAdminUser]
 
     def get_queryset(self):
-        return (
-            Artist.objects.filter(
-                user__user_type="ARTIST",
-            )
-            .select_related("user")
-            .prefetch_related("artworks")
-        )
+        qs = Artist.objects.filter(
+            user__user_type="ARTIST",
+        ).select_related("user")
+        return prefetch_translations(qs, all_languages=True)
 
     @action(detail=True, methods=["post"], permission_classes=[IsAdminUser])
     def approve(self, request, pk=None) -> Response:
@@ -210,3 +238,54 @@ class ArtistsAdminViewSet(viewsets.ModelViewSet):
             return Response({"detail": "Artist rejected successfully."})
         else:
             return Response({"detail": "Artist is already rejected."}, status=400)
+
+    def _bulk_moderate(self, request, approval_status: str) -> Response:
+        """
+        Approve or reject many artist profiles in one UPDATE.
+
+        request data: {"ids": [1, 2, 3]}
+        response: {"updated": 2, "results": [{"id": 1, "status": "updated"}, ...]}
+        """
+        serializer = BulkIdsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        outcomes = moderate_artists(serializer.validated_data["ids"], approval_status)
+        return Response(
+            {
+                "updated": sum(1 for outcome in outcomes.values() if outcome == UPDATED),
+                "results": [{"id": pk, "status": outcome} for pk, outcome in outcomes.items()],
+            }
+        )
+
+    @action(detail=False, methods=["post"], url_path="bulk-approve", url_name="bulk-approve")
+    def bulk_approve(self, request) -> Response:
+        return self._bulk_moderate(request, Artist.ApprovalStatus.APPROVED)
+
+    @action(detail=False, methods=["post"], url_path="bulk-reject", url_name="bulk-reject")
+    def bulk_reject(self, request) -> Response:
+        return self._bulk_moderate(request, Artist.ApprovalStatus.REJECTED)
+
+    @action(detail=False, methods=["post"], url_path="queue/claim", url_name="queue-claim")
+    def claim(self, request) -> Response:
+        """
+        Claim the next pending artist profiles for review (SKIP LOCKED + lease).
+
+        request data: {"limit": 10}
+        response: {"lease_expires_at": "...", "results": [ArtistAdminSerializer, ...]}
+        """
+        serializer = ModerationClaimSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        ids, lease_until = claim_artists(request.user, serializer.validated_data["limit"])
+        artists = self.get_queryset().in_bulk(ids)
+        results = self.get_serializer([artists[pk] for pk in ids], many=True).data
+        return Response({"lease_expires_at": lease_until, "results": results})
+
+    @action(detail=False, methods=["post"], url_path="queue/release", url_name="queue-release")
+    def release(self, request) -> Response:
+        """Return claimed artist profiles to the queue. request data: {"ids": [1, 2]}"""
+        serializer = BulkIdsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        released = release_artists(request.user, serializer.validated_data["ids"])
+        return Response({"released": released})
@@ -0,0 +1,55 @@
+from collections import Counter
+from contextlib import contextmanager
+
+from django.db.models import BooleanField, Case, ExpressionWrapper, F, When
+from django.db.models.functions import Greatest
+
+from apps.artists.models import Artist
+
+from .models import PUBLIC_LISTING, Artwork
+
+
+def _listing_state(artwork_ids, lock: bool = False) -> dict[int, tuple[int, bool]]:
+    qs = Artwork.objects.filter(id__in=artwork_ids).annotate(
+        listed=ExpressionWrapper(PUBLIC_LISTING, output_field=BooleanField())
+    )
+    if lock:
+        qs = qs.select_for_update(of=("self",)).order_by("id")
+    return {
+        pk: (artist_id, listed)
+        for pk, artist_id, listed in qs.values_list("id", "artist_id", "listed")
+    }
+
+
+def apply_artwork_count_deltas(deltas) -> None:
+    """Add per-artist deltas to `artwork_count` in one UPDATE (F() + CASE)."""
+    deltas = {artist_id: delta for artist_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    delta = Case(*(When(pk=artist_id, then=d) for artist_id, d in deltas.items()), default=0)
+    # 드리프트가 있어도 음수가 되지 않도록 0에서 멈춤 (reconcile_artwork_counts 로 보정)
+    Artist.objects.filter(pk__in=deltas).update(
+        artwork_count=Greatest(F("artwork_count") + delta, 0)
+    )
+
+
+@contextmanager
+def track_artist_artwork_counts(artwork_ids):
+    """Keep `Artist.artwork_count` in step with artworks changed inside the block.
+
+    The listing state (approved, public, not deleted) of the given artworks is
+    read with a row lock before the block and again after it; each artist's
+    counter then moves by the number of artworks that entered or left the
+    public listing (deleted rows count as leaving). Must run inside
+    `transaction.atomic()`.
+    """
+    artwork_ids = list(artwork_ids)
+    before = _listing_state(artwork_ids, lock=True)
+    yield
+    after = _listing_state(artwork_ids)
+
+    deltas = Counter()
+    for pk, (artist_id, listed) in before.items():
+        now_listed = after.get(pk, (artist_id, False))[1]
+        deltas[artist_id] += int(now_listed) - int(listed)
+    apply_artwork_count_deltas(deltas)
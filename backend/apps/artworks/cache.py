@@ -0,0 +1,63 @@
+import hashlib
+from urllib.parse import urlencode
+
+from django.db import transaction
+from django.utils.translation import get_language
+from django_redis import get_redis_connection
+
+# 버전 카운터: 값이 바뀌면 이전 버전의 캐시 키는 더 이상 조회되지 않고 TTL로 만료됨
+LIST_VERSION_KEY = "artworks:cache_version:list"
+
+
+def _artwork_version_key(artwork_id: int) -> str:
+    return f"artworks:cache_version:{artwork_id}"
+
+
+def get_list_version() -> int:
+    value = get_redis_connection("default").get(LIST_VERSION_KEY)
+    return int(value or 0)
+
+
+def get_artwork_version(artwork_id: int) -> int:
+    value = get_redis_connection("default").get(_artwork_version_key(artwork_id))
+    return int(value or 0)
+
+
+def _audience(request) -> str:
+    return "auth" if request.user.is_authenticated else "anon"
+
+
+def list_cache_key(request) -> str:
+    """Cache key for a public list response.
+
+    Includes path, language, audience, host and every query param
+    (filters, cursor, page size, search query), plus the global list version.
+    """
+    params = urlencode(sorted(request.query_params.lists()), doseq=True)
+    raw = f"{request.get_host()}|{request.path}|{get_language()}|{_audience(request)}|{params}"
+    digest = hashlib.sha1(raw.encode()).hexdigest()
+    return f"artworks:list:{get_list_version()}:{digest}"
+
+
+def detail_cache_key(request, artwork_id) -> str:
+    version = get_artwork_version(artwork_id)
+    return f"artworks:detail:{artwork_id}:{version}:{get_language()}:{_audience(request)}"
+
+
+def _bump_versions(artwork_ids) -> None:
+    pipe = get_redis_connection("default").pipeline()
+    pipe.incr(LIST_VERSION_KEY)
+    for artwork_id in artwork_ids:
+        pipe.incr(_artwork_version_key(artwork_id))
+    pipe.execute()
+
+
+def invalidate_artworks(artwork_ids) -> None:
+    """Invalidate cached list pages and the detail responses of the given artworks.
+
+    O(1) per artwork: only version counters are incremented, no key scan.
+    Runs after the surrounding transaction commits so a concurrent request
+    cannot cache pre-commit data under the new version.
+    """
+    artwork_ids = list(artwork_ids)
+    transaction.on_commit(lambda: _bump_versions(artwork_ids))
@@ -0,0 +1,116 @@
+from itertools import combinations
+
+from django.conf import settings
+
+from .models import ArtworkImage
+
+HASH_BITS = 64
+BAND_COUNT = 4
+BAND_BITS = HASH_BITS // BAND_COUNT
+BAND_MASK = (1 << BAND_BITS) - 1
+
+
+def to_signed(value: int) -> int:
+    """Unsigned 64-bit hash -> value storable in a bigint column."""
+    return value - (1 << HASH_BITS) if value >= 1 << (HASH_BITS - 1) else value
+
+
+def hamming(a: int, b: int) -> int:
+    return ((a ^ b) & ((1 << HASH_BITS) - 1)).bit_count()
+
+
+def hash_bands(phash: int) -> list[int]:
+    """Split a hash into 16-bit bands tagged with their position: (band << 16) | value."""
+    return [
+        (band << BAND_BITS) | ((phash >> (band * BAND_BITS)) & BAND_MASK)
+        for band in range(BAND_COUNT)
+    ]
+
+
+def _band_neighbors(value: int, radius: int):
+    """Every 16-bit value within `radius` bit flips of `value`."""
+    for distance in range(radius + 1):
+        for bits in combinations(range(BAND_BITS), distance):
+            flipped = value
+            for bit in bits:
+                flipped ^= 1 << bit
+            yield flipped
+
+
+def lookup_keys(phash: int, radius: int) -> set[int]:
+    """Band keys that any hash within `radius` must share with `phash`.
+
+    Multi-index hashing: if two hashes differ in at most r bits, at least one
+    of the 4 bands differs in at most r // 4 bits (pigeonhole), so probing the
+    neighbors of each band finds every candidate without a full scan.
+    """
+    band_radius = radius // BAND_COUNT
+    keys = set()
+    for band in range(BAND_COUNT):
+        value = (phash >> (band * BAND_BITS)) & BAND_MASK
+        keys.update((band << BAND_BITS) | n for n in _band_neighbors(value, band_radius))
+    return keys
+
+
+def find_near_duplicates(images, radius: int | None = None) -> dict:
+    """Near-duplicate images of other artworks for each of `images`.
+
+    All lookups share one GIN-indexed array overlap query; only the returned
+    candidates are compared bit by bit.
+
+    Returns:
+        dict: image id -> [{"image_id", "artwork_id", "distance"}, ...] (closest first)
+    """
+    radius = settings.ARTWORK_DUPLICATE_MAX_DISTANCE if radius is None else radius
+    images = [image for image in images if image.phash is not None]
+    if not images:
+        return {}
+
+    images_by_key = {}
+    for image in images:
+        for key in lookup_keys(image.phash, radius):
+            images_by_key.setdefault(key, []).append(image)
+    candidates = ArtworkImage.objects.filter(phash_bands__overlap=list(images_by_key)).values_list(
+        "id", "artwork_id", "phash", "phash_bands"
+    )
+
+    matches = {image.id: [] for image in images}
+    for candidate_id, artwork_id, phash, bands in candidates:
+        # 후보와 구간 키를 공유하는 이미지만 비교
+        probed = {image.id: image for key in bands for image in images_by_key.get(key, ())}
+        for image in probed.values():
+            if artwork_id == image.artwork_id:
+                continue
+            distance = hamming(image.phash, phash)
+            if distance <= radius:
+                matches[image.id].append(
+                    {"image_id": candidate_id, "artwork_id": artwork_id, "distance": distance}
+                )
+    for found in matches.values():
+        found.sort(key=lambda match: (match["distance"], match["image_id"]))
+    return matches
+
+
+def duplicates_by_artwork(artworks, radius: int | None = None) -> dict:
+    """Flag artworks whose images closely match images of other artworks.
+
+    Uses the prefetched `images` of each artwork (one extra query per call).
+
+    Returns:
+        dict: artwork id -> [{"image_id", "duplicate_image_id", "artwork_id", "distance"}, ...]
+    """
+    images = {image.id: image for artwork in artworks for image in artwork.images.all()}
+    flagged = {}
+    for image_id, found in find_near_duplicates(images.values(), radius).items():
+        if not found:
+            continue
+        flagged.setdefault(images[image_id].artwork_id, []).extend(
+            {
+                "image_id": image_id,
+                "duplicate_image_id": match["image_id"],
+                "artwork_id": match["artwork_id"],
+                "distance": match["distance"],
+            }
+            for match in found
+        )
+    return flagged
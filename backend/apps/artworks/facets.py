@@ -0,0 +1,44 @@
+from django.db import connections
+
+FACET_FIELDS = ("category", "sale_status", "year_created")
+
+
+def facet_counts(queryset) -> dict:
+    """Count artworks per category, sale status and year in a single query.
+
+    The filtered queryset becomes a subquery aggregated with
+    `GROUP BY GROUPING SETS ((category), (sale_status), (year_created), ())`,
+    so every facet (plus the total) comes from one scan instead of one COUNT per facet.
+
+    Returns:
+        {"total": int, "category": [{"value": ..., "count": ...}], ...}
+    """
+    inner = queryset.order_by().values(*FACET_FIELDS)
+    sql, params = inner.query.sql_with_params()
+
+    columns = ", ".join(FACET_FIELDS)
+    grouping = ", ".join(f"GROUPING({field})" for field in FACET_FIELDS)
+    sets = ", ".join(f"({field})" for field in FACET_FIELDS)
+    query = (
+        f"SELECT {columns}, {grouping}, COUNT(*) FROM ({sql}) AS filtered "
+        f"GROUP BY GROUPING SETS ({sets}, ())"
+    )
+
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+
+    n = len(FACET_FIELDS)
+    result = {"total": 0, **{field: [] for field in FACET_FIELDS}}
+    for row in rows:
+        values, grouped_out, count = row[:n], row[n : 2 * n], row[-1]
+        if all(grouped_out):
+            result["total"] = count
+            continue
+        for field, value, flag in zip(FACET_FIELDS, values, grouped_out):
+            if not flag:
+                result[field].append({"value": value, "count": count})
+
+    for field in FACET_FIELDS:
+        result[field].sort(key=lambda facet: (-facet["count"], str(facet["value"])))
+    return result
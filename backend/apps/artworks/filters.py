@@ -12,6 +12,23 @@ class ArtworkFilter(df.FilterSet):
     only_public = df.BooleanFilter(method="filter_only_public")
     exclude_sold = df.BooleanFilter(method="filter_exclude_sold")
 
+    approval_status = df.CharFilter(field_name="approval_status", lookup_expr="exact")
+
+    category = df.CharFilter(field_name="category", lookup_expr="exact")
+    category__in = df.BaseInFilter(
+        field_name="category", lookup_expr="in"
+    )  # CSV: painting,sculpture
+
+    # 범위 필터: ?price_krw_min=100000&price_krw_max=500000 (한쪽만 지정 가능)
+    price_krw = df.RangeFilter(field_name="price_krw")
+    price_usd = df.RangeFilter(field_name="price_usd")
+    year_created = df.RangeFilter(field_name="year_created")
+    like_count = df.RangeFilter(field_name="like_count")
+
+    # 크기 필터는 단위가 cm로 정규화된 컬럼 기준: ?width_cm_min=50&height_cm_max=100
+    width_cm = df.RangeFilter(field_name="width_cm")
+    height_cm = df.RangeFilter(field_name="height_cm")
+
     def filter_only_public(self, qs, name, value):
         if value:
             return qs.filter(display_status=Artwork.DisplayStatus.PUBLIC)
@@ -22,7 +39,21 @@ class ArtworkFilter(df.FilterSet):
             return qs.exclude(sale_status=Artwork.SaleStatus.SOLD)
         return qs
 
-    # TODO: 기간별 조회수 필터, 좋아요 수 필터 추가 필요, 가격 범위 필터 추가 필요
+    # TODO: 기간별 조회수 필터 추가 필요
     class Meta:
         model = Artwork
-        fields = ["sale_status", "sale_status__in", "only_public", "exclude_sold"]
+        fields = [
+            "sale_status",
+            "sale_status__in",
+            "only_public",
+            "exclude_sold",
+            "approval_status",
+            "category",
+            "category__in",
+            "price_krw",
+            "price_usd",
+            "year_created",
+            "like_count",
+            "width_cm",
+            "height_cm",
+        ]
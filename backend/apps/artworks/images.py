@@ -0,0 +1,218 @@
+import base64
+import io
+import logging
+import shutil
+import tempfile
+
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.db.models import Q
+from PIL import ExifTags, Image, ImageOps, UnidentifiedImageError
+
+from apps.utils.s3_client import get_s3_client
+
+from .cache import invalidate_artworks
+from .duplicates import hash_bands, to_signed
+from .models import ArtworkImage
+
+logger = logging.getLogger(__name__)
+
+DERIVATIVE_PREFIX = "derivatives/"
+# format -> (Pillow format, 확장자, Content-Type, 저장 옵션)
+DERIVATIVE_FORMATS = {
+    "webp": ("WEBP", "webp", "image/webp", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", "jpg", "image/jpeg", {"quality": 82, "optimize": True, "progressive": True}),
+}
+# 키가 원본 키로부터 결정되므로 내용이 바뀌지 않음 → 장기 캐시
+DERIVATIVE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 목록 응답에 인라인되는 미리보기: 긴 변 16px WebP (수백 바이트)
+PLACEHOLDER_SIZE = 16
+# 파이프라인 처리가 필요한 이미지 (신규 또는 필드 추가 이전에 처리된 이미지)
+# 디코딩에 실패한 원본은 다시 시도하지 않음 (백필마다 재큐잉 방지)
+MISSING_DERIVATIVES = (Q(derivatives={}) | Q(placeholder="") | Q(phash__isnull=True)) & Q(
+    decode_failed=False
+)
+# 회전/전치가 필요한 EXIF Orientation 값 (가로/세로가 뒤바뀜)
+TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
+
+
+def derivative_key(original_key: str, width: int, fmt: str) -> str:
+    """Deterministic key of a derivative: derivatives/{original key}/w{width}.{ext}"""
+    ext = DERIVATIVE_FORMATS[fmt][1]
+    return f"{DERIVATIVE_PREFIX}{original_key}/w{width}.{ext}"
+
+
+def original_key_from_derivative(key: str) -> str | None:
+    """Inverse of `derivative_key` (None if the key is not a derivative)."""
+    if not key.startswith(DERIVATIVE_PREFIX) or "/" not in key[len(DERIVATIVE_PREFIX) :]:
+        return None
+    return key[len(DERIVATIVE_PREFIX) :].rsplit("/", 1)[0]
+
+
+def _oriented_size(fp) -> tuple[int, int]:
+    """Displayed size from the header and EXIF orientation, without decoding pixels."""
+    with Image.open(fp) as image:
+        width, height = image.size
+        if image.getexif().get(ExifTags.Base.Orientation) in TRANSPOSED_ORIENTATIONS:
+            width, height = height, width
+    fp.seek(0)
+    return width, height
+
+
+def _open_image(fp, max_width: int) -> Image.Image:
+    image = Image.open(fp)
+    # JPEG은 필요한 최대 폭 이상으로만 축소 디코딩 (대형 스캔본 디코딩 비용 절감)
+    # EXIF 회전 전이므로 가로/세로 모두 max_width 이상 유지
+    image.draft("RGB", (max_width, max_width))
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+    return image
+
+
+def render_placeholder(image: Image.Image) -> str:
+    """Tiny blurred preview as a data URI; browsers upscale it while the real image loads."""
+    preview = image.copy()
+    preview.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), Image.Resampling.BOX)
+    buffer = io.BytesIO()
+    preview.save(buffer, "WEBP", quality=40)
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+
+def dominant_color(image: Image.Image) -> str:
+    """Most common color of a 5-color quantized 64px copy, as #rrggbb."""
+    sample = image.convert("RGB")
+    sample.thumbnail((64, 64))
+    quantized = sample.quantize(colors=5)
+    _, index = max(quantized.getcolors())
+    r, g, b = quantized.getpalette()[index * 3 : index * 3 + 3]
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def dhash(image: Image.Image) -> int:
+    """64-bit difference hash: brightness gradient of a 9x8 grayscale copy.
+
+    Robust to rescaling, recompression and small color shifts, so re-uploads of
+    the same work land within a few bits of each other.
+    """
+    pixels = list(image.convert("L").resize((9, 8), Image.Resampling.LANCZOS).getdata())
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            left, right = pixels[row * 9 + col], pixels[row * 9 + col + 1]
+            value = (value << 1) | (left > right)
+    return value
+
+
+def render_derivatives(fp, widths) -> tuple[tuple[int, int], dict, dict]:
+    """Resize one decoded original into every width (never upscaled) and format.
+
+    `fp` is a seekable file (bytes are accepted too). The original size comes
+    from the header, so only the draft-reduced decode touches pixel data.
+
+    Returns:
+        tuple: ((original width, original height), {(width, fmt): encoded bytes},
+            {"placeholder": data URI, "dominant_color": "#rrggbb", "phash": int})
+    """
+    if isinstance(fp, bytes):
+        fp = io.BytesIO(fp)
+    original_size = _oriented_size(fp)
+
+    image = _open_image(fp, max(widths))
+    targets = sorted({w for w in widths if w < original_size[0]} or {original_size[0]})
+
+    preview = {
+        "placeholder": render_placeholder(image),
+        "dominant_color": dominant_color(image),
+        "phash": dhash(image),
+    }
+    rendered = {}
+    for width in targets:
+        height = max(1, round(original_size[1] * width / original_size[0]))
+        resized = image.resize((width, height), Image.Resampling.LANCZOS)
+        for fmt, (pil_format, _, _, options) in DERIVATIVE_FORMATS.items():
+            out = resized.convert("RGB") if pil_format == "JPEG" else resized
+            buffer = io.BytesIO()
+            out.save(buffer, pil_format, **options)
+            rendered[(width, fmt)] = buffer.getvalue()
+    return original_size, rendered, preview
+
+
+def generate_derivatives(image_ids) -> int:
+    """Download each original once, render all derivatives and record them on the row.
+
+    Also stores the intrinsic size, a tiny placeholder and the dominant color so
+    list responses can lay out and paint the grid before images load, and the
+    perceptual hash used for duplicate detection.
+    Originals are streamed into a spooled temp file (memory up to
+    ARTWORK_IMAGE_SPOOL_BYTES, disk beyond), since multipart originals can be
+    hundreds of MB. Images that are already complete are skipped, so reruns are
+    cheap; originals that cannot be decoded are flagged and not retried.
+
+    Returns:
+        int: number of images processed
+    """
+    bucket = settings.AWS_S3_ARTWORK_BUCKET
+    s3 = get_s3_client()
+    widths = settings.ARTWORK_IMAGE_WIDTHS
+
+    images = ArtworkImage.objects.filter(id__in=list(image_ids), key__isnull=False).filter(
+        MISSING_DERIVATIVES
+    )
+    processed, artwork_ids = 0, set()
+    for image in images:
+        with tempfile.SpooledTemporaryFile(max_size=settings.ARTWORK_IMAGE_SPOOL_BYTES) as spool:
+            try:
+                body = s3.get_object(Bucket=bucket, Key=image.key)["Body"]
+                shutil.copyfileobj(body, spool, 1024 * 1024)
+            except ClientError as e:
+                logger.warning(f"Failed to download original {image.key}: {e}")
+                continue
+            spool.seek(0)
+            try:
+                (image.width, image.height), rendered, preview = render_derivatives(spool, widths)
+            except (UnidentifiedImageError, OSError, Image.DecompressionBombError) as e:
+                logger.warning(f"Failed to decode original {image.key}: {e}")
+                image.decode_failed = True
+                image.save(update_fields=["decode_failed"])
+                continue
+
+        image.placeholder = preview["placeholder"]
+        image.dominant_color = preview["dominant_color"]
+        image.phash = to_signed(preview["phash"])
+        image.phash_bands = hash_bands(preview["phash"])
+        derivatives = {}
+        try:
+            for (width, fmt), body in rendered.items():
+                key = derivative_key(image.key, width, fmt)
+                s3.put_object(
+                    Bucket=bucket,
+                    Key=key,
+                    Body=body,
+                    ContentType=DERIVATIVE_FORMATS[fmt][2],
+                    CacheControl=DERIVATIVE_CACHE_CONTROL,
+                )
+                derivatives.setdefault(fmt, {})[str(width)] = key
+        except ClientError as e:
+            # 행은 갱신하지 않고 다음 이미지로 진행 (다음 실행에서 다시 생성)
+            logger.warning(f"Failed to upload derivatives of {image.key}: {e}")
+            continue
+
+        image.derivatives = derivatives
+        image.save(
+            update_fields=[
+                "width",
+                "height",
+                "derivatives",
+                "placeholder",
+                "dominant_color",
+                "phash",
+                "phash_bands",
+            ]
+        )
+        processed += 1
+        artwork_ids.add(image.artwork_id)
+
+    if artwork_ids:
+        invalidate_artworks(artwork_ids)
+    return processed
@@ -0,0 +1,170 @@
+import json
+import logging
+import re
+from urllib.parse import unquote_plus
+
+from django.conf import settings
+from django.db import transaction
+
+from apps.utils.s3_client import get_s3_client, get_sqs_client
+
+from .cache import invalidate_artworks
+from .models import Artwork, ArtworkImage
+from .uploads import forget_completed_uploads, validate_uploaded_objects
+
+logger = logging.getLogger(__name__)
+
+# presigned_batch / multipart 가 발급하는 키 구조: artworks/{user_id}/images/{artwork_id}/{file}
+IMAGE_KEY_RE = re.compile(r"^artworks/(?P<user_id>\d+)/images/(?P<artwork_id>\d+)/[^/]+$")
+
+
+def parse_image_key(key: str) -> tuple[int, int] | None:
+    """Return (user_id, artwork_id) for an artwork image key, None for anything else."""
+    match = IMAGE_KEY_RE.match(key)
+    if match is None:
+        return None
+    return int(match["user_id"]), int(match["artwork_id"])
+
+
+def records_from_message(body: str) -> list[dict]:
+    """Extract ObjectCreated records from an SQS message body.
+
+    Accepts raw S3 notifications and SNS-wrapped ones; test events and other
+    event types yield nothing.
+
+    Returns:
+        list[dict]: [{"bucket", "key", "size"}, ...]
+    """
+    try:
+        payload = json.loads(body)
+        if "Message" in payload and "Records" not in payload:
+            payload = json.loads(payload["Message"])
+    except (TypeError, ValueError):
+        logger.warning("Ignoring malformed S3 event message")
+        return []
+
+    records = []
+    for record in payload.get("Records", []):
+        if not record.get("eventName", "").startswith("ObjectCreated:"):
+            continue
+        s3 = record.get("s3", {})
+        records.append(
+            {
+                "bucket": s3.get("bucket", {}).get("name"),
+                # 이벤트의 키는 URL 인코딩되어 전달됨
+                "key": unquote_plus(s3.get("object", {}).get("key", "")),
+                "size": s3.get("object", {}).get("size", 0),
+            }
+        )
+    return records
+
+
+def ingest_object_created(records) -> int:
+    """Create ArtworkImage rows for uploaded objects in one batch.
+
+    Objects are accepted only if the key layout matches and the artwork exists,
+    is not deleted and belongs to the user in the key; they then go through the
+    same probe as `confirm_batch` (`validate_uploaded_objects`: existence,
+    single-upload size limit unless a completed multipart original, sniffed
+    format and dimensions). Rows already created by `confirm_batch` are left
+    alone; a later confirm finalizes order/alt text.
+
+    Returns:
+        int: number of images created
+    """
+    bucket = settings.AWS_S3_ARTWORK_BUCKET
+    candidates = {}
+    for record in records:
+        parsed = parse_image_key(record["key"])
+        if record["bucket"] != bucket or parsed is None:
+            continue
+        if record["size"] > settings.AWS_S3_MULTIPART_MAX_FILE_SIZE:
+            logger.warning(f"Ignoring oversize upload {record['key']}")
+            continue
+        candidates[record["key"]] = parsed
+
+    if not candidates:
+        return 0
+
+    owners = dict(
+        Artwork.objects.filter(
+            id__in={artwork_id for _, artwork_id in candidates.values()}, is_deleted=False
+        ).values_list("id", "artist__user_id")
+    )
+    owned = {
+        key: artwork_id
+        for key, (user_id, artwork_id) in candidates.items()
+        if owners.get(artwork_id) == user_id
+    }
+    if not owned:
+        return 0
+
+    # 멀티파트 complete 이전(크기 검증 전)에 도착한 이벤트는 여기서 거절되고 confirm 에서 등록됨
+    accepted, rejected = validate_uploaded_objects(get_s3_client(), bucket, owned)
+    for key, reason in rejected.items():
+        logger.warning(f"Ignoring upload {key}: {reason}")
+    images = [ArtworkImage(artwork_id=owned[key], key=key) for key in accepted]
+
+    with transaction.atomic():
+        existing = set(
+            ArtworkImage.objects.filter(key__in=[img.key for img in images]).values_list(
+                "key", flat=True
+            )
+        )
+        images = [img for img in images if img.key not in existing]
+        ArtworkImage.objects.bulk_create(images, ignore_conflicts=True)
+        forget_completed_uploads(img.key for img in images)
+        if images:
+            invalidate_artworks({img.artwork_id for img in images})
+            # ignore_conflicts 에서는 pk가 채워지지 않으므로 키로 다시 조회
+            image_ids = list(
+                ArtworkImage.objects.filter(key__in=[img.key for img in images]).values_list(
+                    "id", flat=True
+                )
+            )
+            # tasks 모듈이 이 모듈을 import 하므로 순환 import 방지를 위해 지연 import
+            from .tasks import generate_artwork_image_derivatives
+
+            transaction.on_commit(lambda: generate_artwork_image_derivatives.delay(image_ids))
+
+    return len(images)
+
+
+def poll_upload_events(max_batches: int | None = None) -> int:
+    """Drain S3 ObjectCreated notifications from the SQS queue.
+
+    Each receive returns up to 10 messages; their records are ingested in one
+    batch and the messages are deleted afterwards, so a crash mid-batch only
+    causes redelivery (ingestion is idempotent on the object key).
+
+    Returns:
+        int: number of images created
+    """
+    queue_url = settings.AWS_S3_EVENTS_QUEUE_URL
+    if not queue_url:
+        return 0
+
+    sqs = get_sqs_client()
+    created = 0
+    for _ in range(max_batches or settings.AWS_S3_EVENTS_MAX_BATCHES):
+        messages = sqs.receive_message(
+            QueueUrl=queue_url,
+            MaxNumberOfMessages=10,
+            WaitTimeSeconds=settings.AWS_S3_EVENTS_WAIT_SECONDS,
+        ).get("Messages", [])
+        if not messages:
+            break
+
+        records = [record for m in messages for record in records_from_message(m["Body"])]
+        created += ingest_object_created(records)
+
+        sqs.delete_message_batch(
+            QueueUrl=queue_url,
+            Entries=[
+                {"Id": str(i), "ReceiptHandle": m["ReceiptHandle"]} for i, m in enumerate(messages)
+            ],
+        )
+
+    if created:
+        logger.info(f"Ingested {created} artwork images from S3 events")
+    return created
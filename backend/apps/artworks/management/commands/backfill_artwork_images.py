@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from apps.artworks.images import MISSING_DERIVATIVES
+from apps.artworks.models import ArtworkImage
+from apps.artworks.tasks import generate_artwork_image_derivatives
+
+
+class Command(BaseCommand):
+    help = (
+        "Queue the image pipeline for artwork images missing derivatives, "
+        "placeholder/dominant color or perceptual hash."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=100)
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+
+        last_id = 0
+        queued = 0
+        while True:
+            # id 기준 keyset 순회: 청크마다 작업 1개 (원본 다운로드는 작업 내에서 이미지당 1회)
+            ids = list(
+                ArtworkImage.objects.filter(MISSING_DERIVATIVES, id__gt=last_id, key__isnull=False)
+                .order_by("id")
+                .values_list("id", flat=True)[:chunk_size]
+            )
+            if not ids:
+                break
+            last_id = ids[-1]
+            queued += len(ids)
+            generate_artwork_image_derivatives.delay(ids)
+
+        self.stdout.write(self.style.SUCCESS(f"Queued {queued} artwork images"))
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+
+from apps.artworks.orphans import collect_orphaned_uploads
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete artwork/profile objects in S3 that no ArtworkImage, profile image or "
+        "artist main image references, once they are older than the grace period."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run", action="store_true", help="List orphans without deleting them"
+        )
+        parser.add_argument(
+            "--grace-seconds",
+            type=int,
+            default=None,
+            help="Override AWS_S3_ORPHAN_GRACE_SECONDS",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        reports = collect_orphaned_uploads(
+            dry_run=dry_run, grace_seconds=options["grace_seconds"], collect_keys=dry_run
+        )
+        if not reports:
+            self.stdout.write(self.style.WARNING("No S3 buckets configured"))
+            return
+
+        action = "would delete" if dry_run else "deleted"
+        for target, report in reports.items():
+            for key in report.keys:
+                self.stdout.write(f"  {key}")
+            count = report.orphaned if dry_run else report.deleted
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{target}: scanned {report.scanned}, {action} {count} orphans "
+                    f"({report.orphaned_bytes} bytes)"
+                )
+            )
+            for error in report.errors:
+                self.stderr.write(f"  failed {error['key']}: {error['code']}")
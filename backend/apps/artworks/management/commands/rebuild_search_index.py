@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from apps.artworks.models import Artwork
+from apps.artworks.search import update_search_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild Artwork.search_vector / search_text in chunks (e.g. after the search migration)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+
+        last_id = 0
+        total = 0
+        while True:
+            ids = list(
+                Artwork.objects.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:chunk_size]
+            )
+            if not ids:
+                break
+            last_id = ids[-1]
+            total += update_search_index(ids)
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt search index for {total} artworks"))
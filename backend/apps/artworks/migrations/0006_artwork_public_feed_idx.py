@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-10-18 13:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("artworks", "0005_alter_artwork_year_created"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="artwork",
+            index=models.Index(
+                condition=models.Q(("approval_status", "approved"), ("display_status", "public")),
+                fields=["-created_at", "-id"],
+                name="artwork_public_feed_idx",
+            ),
+        ),
+    ]
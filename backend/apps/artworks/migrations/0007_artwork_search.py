@@ -0,0 +1,71 @@
+# Generated by Django 5.2.4 on 2026-10-18 14:02
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+# 기존 작품의 검색 컬럼 채우기 (apps.artworks.search.update_search_index 와 같은 식)
+BACKFILL_SEARCH_SQL = """
+UPDATE artworks_artwork AS a
+SET search_vector =
+        setweight(to_tsvector('simple', s.title), 'A')
+        || setweight(to_tsvector('simple', s.artist_name), 'A')
+        || setweight(to_tsvector('simple', s.description), 'B')
+        || setweight(to_tsvector('simple', s.materials), 'C'),
+    search_text = lower(
+        s.title || ' ' || s.artist_name || ' ' || s.description || ' ' || s.materials
+    )
+FROM (
+    SELECT
+        w.id,
+        COALESCE(
+            (SELECT string_agg(t.title, ' ') FROM artworks_artwork_translation t
+             WHERE t.master_id = w.id), ''
+        ) AS title,
+        COALESCE(
+            (SELECT string_agg(t.description, ' ') FROM artworks_artwork_translation t
+             WHERE t.master_id = w.id), ''
+        ) AS description,
+        COALESCE(
+            (SELECT string_agg(n.artist_name, ' ') FROM artists_artist_translation n
+             WHERE n.master_id = w.artist_id), ''
+        ) AS artist_name,
+        COALESCE(w.materials, '') AS materials
+    FROM artworks_artwork w
+) AS s
+WHERE s.id = a.id
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("artworks", "0006_artwork_public_feed_idx"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="artwork",
+            name="search_text",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddField(
+            model_name="artwork",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(BACKFILL_SEARCH_SQL, migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name="artwork",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="artwork_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="artwork",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_text"], name="artwork_search_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+    ]
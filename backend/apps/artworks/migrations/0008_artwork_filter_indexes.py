@@ -0,0 +1,110 @@
+# Generated by Django 5.2.4 on 2026-10-18 13:35
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_cm_dimensions(apps, schema_editor):
+    Artwork = apps.get_model("artworks", "Artwork")
+    Artwork.objects.filter(dimension_unit="inch").update(
+        width_cm=F("width") * 2.54, height_cm=F("height") * 2.54
+    )
+    Artwork.objects.exclude(dimension_unit="inch").update(
+        width_cm=F("width"), height_cm=F("height")
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("artworks", "0007_artwork_search"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="artwork",
+            name="height_cm",
+            field=models.FloatField(
+                blank=True, editable=False, null=True, verbose_name="세로(cm 환산)"
+            ),
+        ),
+        migrations.AddField(
+            model_name="artwork",
+            name="width_cm",
+            field=models.FloatField(
+                blank=True, editable=False, null=True, verbose_name="가로(cm 환산)"
+            ),
+        ),
+        migrations.RunPython(backfill_cm_dimensions, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="artwork",
+            index=models.Index(
+                condition=models.Q(
+                    ("approval_status", "approved"),
+                    ("display_status", "public"),
+                    ("is_deleted", False),
+                ),
+                fields=["category", "-created_at"],
+                name="artwork_public_category_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="artwork",
+            index=models.Index(
+                condition=models.Q(
+                    ("approval_status", "approved"),
+                    ("display_status", "public"),
+                    ("is_deleted", False),
+                ),
+                fields=["price_krw"],
+                name="artwork_public_price_krw_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="artwork",
+            index=models.Index(
+                condition=models.Q(
+                    ("approval_status", "approved"),
+                    ("display_status", "public"),
+                    ("is_deleted", False),
+                ),
+                fields=["price_usd"],
+                name="artwork_public_price_usd_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="artwork",
+            index=models.Index(
+                condition=models.Q(
+                    ("approval_status", "approved"),
+                    ("display_status", "public"),
+                    ("is_deleted", False),
+                ),
+                fields=["year_created"],
+                name="artwork_public_year_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="artwork",
+            index=models.Index(
+                condition=models.Q(
+                    ("approval_status", "approved"),
+                    ("display_status", "public"),
+                    ("is_deleted", False),
+                ),
+                fields=["-like_count"],
+                name="artwork_public_likes_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="artwork",
+            index=models.Index(
+                condition=models.Q(
+                    ("approval_status", "approved"),
+                    ("display_status", "public"),
+                    ("is_deleted", False),
+                ),
+                fields=["width_cm", "height_cm"],
+                name="artwork_public_size_idx",
+            ),
+        ),
+    ]
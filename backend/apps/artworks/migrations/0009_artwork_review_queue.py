@@ -0,0 +1,40 @@
+# Generated by Django 5.2.4 on 2026-10-18 13:41
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("artworks", "0008_artwork_filter_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="artwork",
+            name="review_claimed_by",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="검수 담당자",
+            ),
+        ),
+        migrations.AddField(
+            model_name="artwork",
+            name="review_claimed_until",
+            field=models.DateTimeField(blank=True, null=True, verbose_name="검수 점유 만료"),
+        ),
+        migrations.AddIndex(
+            model_name="artwork",
+            index=models.Index(
+                condition=models.Q(("approval_status", "pending")),
+                fields=["created_at", "id"],
+                name="artwork_review_queue_idx",
+            ),
+        ),
+    ]
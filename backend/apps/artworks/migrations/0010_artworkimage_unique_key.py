@@ -0,0 +1,38 @@
+# Generated by Django 5.2.4 on 2026-10-18 13:52
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def merge_duplicate_keys(apps, schema_editor):
+    """Keep the oldest row per key before UNIQUE(key); covers point at the kept row."""
+    Artwork = apps.get_model("artworks", "Artwork")
+    ArtworkImage = apps.get_model("artworks", "ArtworkImage")
+
+    # 빈 문자열 키는 "키 없음"이므로 NULL 로 통일 (NULL 은 유니크 제약에서 중복 허용)
+    ArtworkImage.objects.filter(key="").update(key=None)
+
+    duplicates = (
+        ArtworkImage.objects.exclude(key__isnull=True)
+        .values("key")
+        .annotate(n=Count("id"), keep=Min("id"))
+        .filter(n__gt=1)
+    )
+    for row in duplicates.iterator():
+        extra = ArtworkImage.objects.filter(key=row["key"]).exclude(id=row["keep"])
+        Artwork.objects.filter(cover_image__in=extra).update(cover_image_id=row["keep"])
+        extra.delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("artworks", "0009_artwork_review_queue"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_keys, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="artworkimage",
+            constraint=models.UniqueConstraint(fields=("key",), name="artworkimage_unique_key"),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.4 on 2026-10-18 13:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("artworks", "0010_artworkimage_unique_key"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="artworkimage",
+            name="derivatives",
+            field=models.JSONField(blank=True, default=dict, verbose_name="파생 이미지"),
+        ),
+        migrations.AddField(
+            model_name="artworkimage",
+            name="height",
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name="원본 세로(px)"),
+        ),
+        migrations.AddField(
+            model_name="artworkimage",
+            name="width",
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name="원본 가로(px)"),
+        ),
+    ]
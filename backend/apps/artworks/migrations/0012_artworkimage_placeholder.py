@@ -0,0 +1,22 @@
+# Generated by Django 5.2.4 on 2026-10-18 14:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("artworks", "0011_artworkimage_derivatives"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="artworkimage",
+            name="dominant_color",
+            field=models.CharField(blank=True, default="", max_length=7, verbose_name="대표 색상"),
+        ),
+        migrations.AddField(
+            model_name="artworkimage",
+            name="placeholder",
+            field=models.TextField(blank=True, default="", verbose_name="미리보기 이미지"),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.4 on 2026-10-18 14:12
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("artworks", "0012_artworkimage_placeholder"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="artworkimage",
+            name="phash",
+            field=models.BigIntegerField(blank=True, null=True, verbose_name="지각 해시"),
+        ),
+        migrations.AddField(
+            model_name="artworkimage",
+            name="phash_bands",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.IntegerField(),
+                blank=True,
+                default=list,
+                size=None,
+                verbose_name="지각 해시 구간",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="artworkimage",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["phash_bands"], name="artworkimage_phash_bands_gin"
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-10-18 14:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("artworks", "0013_artworkimage_phash"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="artwork",
+            name="artwork_review_queue_idx",
+        ),
+        migrations.AddIndex(
+            model_name="artwork",
+            index=models.Index(
+                condition=models.Q(("approval_status", "pending"), ("is_deleted", False)),
+                fields=["created_at", "id"],
+                name="artwork_review_queue_idx",
+            ),
+        ),
+    ]
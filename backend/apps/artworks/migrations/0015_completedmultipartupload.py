@@ -0,0 +1,30 @@
+# Generated by Django 5.2.4 on 2026-10-18 14:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("artworks", "0014_review_queue_excludes_deleted"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CompletedMultipartUpload",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("key", models.CharField(unique=True, verbose_name="이미지 키")),
+                ("size", models.BigIntegerField(verbose_name="파일 크기")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="완료일시")),
+            ],
+            options={
+                "verbose_name": "멀티파트 업로드 완료 기록",
+                "verbose_name_plural": "멀티파트 업로드 완료 기록들",
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-18 14:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("artworks", "0015_completedmultipartupload"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="artworkimage",
+            name="decode_failed",
+            field=models.BooleanField(default=False, verbose_name="디코딩 실패"),
+        ),
+    ]
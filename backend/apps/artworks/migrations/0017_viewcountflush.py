@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-18 15:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("artworks", "0016_artworkimage_decode_failed"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ViewCountFlush",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("batch_id", models.CharField(max_length=32, unique=True, verbose_name="배치 ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="적용일시")),
+            ],
+            options={
+                "verbose_name": "조회수 반영 기록",
+                "verbose_name_plural": "조회수 반영 기록들",
+            },
+        ),
+    ]
@@ -1,9 +1,20 @@
+from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models import F
 from django.utils import timezone
 from parler.models import TranslatableModel, TranslatedFields
 
 from apps.artists.models import Artist
+from apps.utils.s3_client import public_object_url
+
+INCH_TO_CM = 2.54
+
+# 공개 목록 노출 조건 (승인, 공개, 미삭제)
+PUBLIC_LISTING = models.Q(approval_status="approved", display_status="public", is_deleted=False)
 
 
 def get_current_year():
@@ -84,6 +95,14 @@ class Artwork(TranslatableModel):
         verbose_name="크기 단위",
     )
 
+    # 단위가 섞인 width/height를 cm로 정규화한 값 (save()에서 갱신, 크기 필터용)
+    width_cm = models.FloatField(
+        null=True, blank=True, editable=False, verbose_name="가로(cm 환산)"
+    )
+    height_cm = models.FloatField(
+        null=True, blank=True, editable=False, verbose_name="세로(cm 환산)"
+    )
+
     CATEGORY_CHOICES = [
         ("painting", "회화"),
         ("oriental_painting", "동양화"),
@@ -160,12 +179,82 @@ class Artwork(TranslatableModel):
 
     deleted_at = models.DateTimeField(null=True, blank=True, verbose_name="삭제일시")
 
+    # 검수 큐 점유 정보 (apps.utils.moderation_queue, 만료 시 다시 큐로 반환)
+    review_claimed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="검수 담당자",
+    )
+    review_claimed_until = models.DateTimeField(
+        null=True, blank=True, verbose_name="검수 점유 만료"
+    )
+
+    # 검색용 비정규화 컬럼 (apps.artworks.search.update_search_index 로 갱신)
+    search_vector = SearchVectorField(null=True, editable=False)
+    search_text = models.TextField(blank=True, default="", editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # 공개 피드 keyset 페이지네이션: (created_at, id) 역순 탐색
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="artwork_public_feed_idx",
+                condition=models.Q(approval_status="approved", display_status="public"),
+            ),
+            # 필터 조합용 부분 인덱스: 공개 목록에 노출되는 행만 포함
+            models.Index(
+                fields=["category", "-created_at"],
+                name="artwork_public_category_idx",
+                condition=PUBLIC_LISTING,
+            ),
+            models.Index(
+                fields=["price_krw"], name="artwork_public_price_krw_idx", condition=PUBLIC_LISTING
+            ),
+            models.Index(
+                fields=["price_usd"], name="artwork_public_price_usd_idx", condition=PUBLIC_LISTING
+            ),
+            models.Index(
+                fields=["year_created"], name="artwork_public_year_idx", condition=PUBLIC_LISTING
+            ),
+            models.Index(
+                fields=["-like_count"], name="artwork_public_likes_idx", condition=PUBLIC_LISTING
+            ),
+            models.Index(
+                fields=["width_cm", "height_cm"],
+                name="artwork_public_size_idx",
+                condition=PUBLIC_LISTING,
+            ),
+            # 검수 큐: 삭제되지 않은 승인대기 행만 오래된 순으로 탐색
+            models.Index(
+                fields=["created_at", "id"],
+                name="artwork_review_queue_idx",
+                condition=models.Q(approval_status="pending", is_deleted=False),
+            ),
+            GinIndex(fields=["search_vector"], name="artwork_search_vector_idx"),
+            GinIndex(
+                fields=["search_text"], name="artwork_search_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ]
+
     def __str__(self):
         return f"{self.safe_translation_getter('title', any_language=True)} by {self.artist.name}"
 
+    def save(self, *args, **kwargs):
+        factor = INCH_TO_CM if self.dimension_unit == "inch" else 1
+        self.width_cm = self.width * factor if self.width is not None else None
+        self.height_cm = self.height * factor if self.height is not None else None
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"width", "height", "dimension_unit"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "width_cm", "height_cm"}
+        super().save(*args, **kwargs)
+
     @property
     def dimensions_display(self):
         """크기 표시용 프로퍼티"""
@@ -173,10 +262,9 @@ class Artwork(TranslatableModel):
             return f"{self.width} × {self.height} × {self.depth} {self.dimension_unit}"
         return f"{self.width} × {self.height} {self.dimension_unit}"
 
-    def increment_view_count(self):
-        """조회수 증가"""
-        self.view_count += 1
-        self.save(update_fields=["view_count"])
+    def increment_view_count(self, amount=1):
+        """조회수 증가 (F() 기반 원자적 UPDATE, 일반 조회는 view_counter 버퍼 사용)"""
+        Artwork.objects.filter(pk=self.pk).update(view_count=F("view_count") + amount)
 
     def get_price_display(self, currency="KRW"):
         """통화별 가격 표시"""
@@ -206,12 +294,38 @@ class ArtworkImage(models.Model):
         help_text="접근성을 위한 이미지 설명",
     )
 
+    # 원본 크기와 리사이즈 파생 이미지 키 (apps.artworks.images.generate_derivatives 로 갱신)
+    # {"webp": {"320": "derivatives/<key>/w320.webp", ...}, "jpeg": {...}}
+    width = models.PositiveIntegerField(null=True, blank=True, verbose_name="원본 가로(px)")
+    height = models.PositiveIntegerField(null=True, blank=True, verbose_name="원본 세로(px)")
+    derivatives = models.JSONField(default=dict, blank=True, verbose_name="파생 이미지")
+    # 로딩 전 자리표시용: 수백 바이트 크기의 흐린 미리보기(data URI)와 대표 색상(#rrggbb)
+    placeholder = models.TextField(blank=True, default="", verbose_name="미리보기 이미지")
+    dominant_color = models.CharField(
+        max_length=7, blank=True, default="", verbose_name="대표 색상"
+    )
+    # 중복 업로드 탐지용 64비트 dHash (부호 있는 bigint로 저장)와
+    # 16비트 4구간 값 (구간번호 << 16 | 값) → GIN 인덱스로 해밍 거리 후보 조회 (apps.artworks.duplicates)
+    phash = models.BigIntegerField(null=True, blank=True, verbose_name="지각 해시")
+    phash_bands = ArrayField(
+        models.IntegerField(), default=list, blank=True, verbose_name="지각 해시 구간"
+    )
+    # 원본을 디코딩할 수 없어 파생 이미지 생성이 불가능한 경우 (재처리 대상에서 제외)
+    decode_failed = models.BooleanField(default=False, verbose_name="디코딩 실패")
+
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="업로드일시")
 
     class Meta:
         verbose_name = "작품 이미지"
         verbose_name_plural = "작품 이미지들"
         ordering = ["order", "id"]
+        constraints = [
+            # S3 이벤트 수집과 클라이언트 confirm이 같은 객체를 중복 등록하지 않도록 보장
+            models.UniqueConstraint(fields=["key"], name="artworkimage_unique_key"),
+        ]
+        indexes = [
+            GinIndex(fields=["phash_bands"], name="artworkimage_phash_bands_gin"),
+        ]
 
     def __str__(self):
         return f"{self.artwork.safe_translation_getter('title', any_language=True)} - Image {self.order}"
@@ -222,4 +336,61 @@ class ArtworkImage(models.Model):
     def has_pending_inquiries(self):
         return self.purchase_inquiries.filter(status="pending").exists()
 
-    # TODO: thumnnail 관련 속성 추가 필요
+    @property
+    def original_url(self):
+        """원본 이미지 URL (url 필드가 없으면 key로 생성)"""
+        return self.url or (public_object_url(self.key) if self.key else None)
+
+    def derivative_url(self, width: int, fmt: str = "webp"):
+        """요청 폭 이상인 가장 작은 파생 이미지 URL, 없으면 가장 큰 파생 이미지
+
+        파생 이미지가 아직 없거나 만들 수 없으면 None (대용량 원본을 썸네일로 내보내지 않음)
+        """
+        sizes = sorted((int(w), key) for w, key in self.derivatives.get(fmt, {}).items())
+        if not sizes:
+            return None
+        key = next((key for w, key in sizes if w >= width), sizes[-1][1])
+        return public_object_url(key)
+
+    def srcset(self, fmt: str = "webp") -> str:
+        """<img srcset> 값: "url 320w, url 640w, ..." """
+        sizes = sorted((int(w), key) for w, key in self.derivatives.get(fmt, {}).items())
+        return ", ".join(f"{public_object_url(key)} {w}w" for w, key in sizes)
+
+
+class CompletedMultipartUpload(models.Model):
+    """크기 검증을 마친 멀티파트 업로드 원본 기록
+
+    멀티파트 원본은 단일 업로드 크기 제한(AWS_S3_MAX_FILE_SIZE)을 넘을 수 있으므로,
+    complete 시 검증한 크기를 남겨 두고 confirm/S3 이벤트 수집에서 이 기록으로 크기 제한을 대신함.
+    ArtworkImage 행이 생성되면 삭제되고, 확인되지 않은 기록은 고아 객체 GC 가 유예 시간 후 정리함.
+    """
+
+    key = models.CharField(unique=True, verbose_name="이미지 키")
+    size = models.BigIntegerField(verbose_name="파일 크기")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="완료일시")
+
+    class Meta:
+        verbose_name = "멀티파트 업로드 완료 기록"
+        verbose_name_plural = "멀티파트 업로드 완료 기록들"
+
+    def __str__(self):
+        return self.key
+
+
+class ViewCountFlush(models.Model):
+    """적용이 끝난 조회수 flush 배치 기록
+
+    조회수 UPDATE 와 같은 트랜잭션에서 기록되므로, Redis 버퍼 삭제 전에 중단되거나
+    락 만료 후 겹친 실행이 같은 배치를 다시 읽어도 두 번 적용되지 않음.
+    """
+
+    batch_id = models.CharField(max_length=32, unique=True, verbose_name="배치 ID")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="적용일시")
+
+    class Meta:
+        verbose_name = "조회수 반영 기록"
+        verbose_name_plural = "조회수 반영 기록들"
+
+    def __str__(self):
+        return self.batch_id
@@ -0,0 +1,73 @@
+from contextlib import nullcontext
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.utils.bulk import bulk_set_fields
+from apps.utils.moderation_queue import claim_pending, release_claims
+
+from .artist_counts import track_artist_artwork_counts
+from .cache import invalidate_artworks
+from .models import Artwork
+from .signals import artworks_moderated
+
+APPROVE = "approve"
+REJECT = "reject"
+FEATURE = "feature"
+UNFEATURE = "unfeature"
+ACTIONS = (APPROVE, REJECT, FEATURE, UNFEATURE)
+
+
+def _changes(action: str) -> tuple[dict, dict]:
+    now = timezone.now()
+    # 승인/거절 시 검수 큐 점유도 함께 해제
+    reviewed = {"review_claimed_by": None, "review_claimed_until": None, "updated_at": now}
+    if action == APPROVE:
+        return {"approval_status": Artwork.ApprovalStatus.APPROVED}, reviewed
+    if action == REJECT:
+        return {"approval_status": Artwork.ApprovalStatus.REJECTED}, reviewed
+    if action == FEATURE:
+        return {"is_featured": True}, {"featured_at": now, "updated_at": now}
+    if action == UNFEATURE:
+        return {"is_featured": False}, {"featured_at": None, "updated_at": now}
+    raise ValueError(f"Unknown moderation action: {action}")
+
+
+def moderate_artworks(artwork_ids, action: str) -> dict[int, str]:
+    """Apply a moderation action to many artworks at once.
+
+    One locking SELECT + one UPDATE for the whole batch, then a single cache
+    invalidation and a single `artworks_moderated` signal (notification fan-out)
+    after commit, instead of one round trip per artwork. Approve/reject also
+    move the artists' `artwork_count` for artworks entering/leaving the listing.
+
+    Returns:
+        dict[int, str]: outcome per id (updated / unchanged / not_found)
+    """
+    values, extra = _changes(action)
+
+    artwork_ids = list(artwork_ids)
+    # 추천 여부는 공개 목록 노출 조건과 무관하므로 작가 작품 수 추적 생략
+    affects_listing = action in (APPROVE, REJECT)
+    tracking = track_artist_artwork_counts(artwork_ids) if affects_listing else nullcontext()
+
+    with transaction.atomic(), tracking:
+        changed, outcomes = bulk_set_fields(Artwork, artwork_ids, values, extra)
+        if changed:
+            invalidate_artworks(changed)
+            transaction.on_commit(
+                lambda: artworks_moderated.send(sender=Artwork, artwork_ids=changed, action=action)
+            )
+    return outcomes
+
+
+def claim_artworks(user, limit: int):
+    """Claim the oldest pending artworks for a moderator (see `claim_pending`)."""
+    pending = Artwork.objects.filter(
+        approval_status=Artwork.ApprovalStatus.PENDING, is_deleted=False
+    )
+    return claim_pending(pending, user, limit)
+
+
+def release_artworks(user, artwork_ids) -> int:
+    return release_claims(Artwork, artwork_ids, user)
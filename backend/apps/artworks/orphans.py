@@ -0,0 +1,98 @@
+import re
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.artists.models import Artist
+from apps.utils.s3_gc import collect_orphans
+
+from .images import DERIVATIVE_PREFIX, original_key_from_derivative
+from .models import ArtworkImage
+from .uploads import prune_completed_uploads
+
+User = get_user_model()
+
+ARTWORK_PREFIX = "artworks/"
+PROFILE_PREFIX = "profiles/"
+PROFILE_KEY_RE = re.compile(r"^profiles/(?P<user_id>\d+)/")
+
+
+def referenced_artwork_keys(keys) -> set[str]:
+    """Keys of the page still stored on an ArtworkImage (one indexed IN query).
+
+    Images of a soft-deleted artwork stay referenced until
+    ARTWORK_DELETED_IMAGE_RETENTION_SECONDS after `deleted_at`, so the artwork
+    can still be restored; after that they are reclaimable.
+    """
+    retained_since = timezone.now() - timedelta(
+        seconds=settings.ARTWORK_DELETED_IMAGE_RETENTION_SECONDS
+    )
+    live = (
+        Q(artwork__is_deleted=False)
+        | Q(artwork__deleted_at__isnull=True)
+        | Q(artwork__deleted_at__gt=retained_since)
+    )
+    return set(ArtworkImage.objects.filter(live, key__in=keys).values_list("key", flat=True))
+
+
+def referenced_derivative_keys(keys) -> set[str]:
+    """Derivative keys of the page whose original is still stored on an ArtworkImage."""
+    originals = {key: original_key_from_derivative(key) for key in keys}
+    in_use = referenced_artwork_keys({original for original in originals.values() if original})
+    return {key for key, original in originals.items() if original in in_use}
+
+
+def referenced_profile_keys(keys) -> set[str]:
+    """Keys of the page still used as a user profile image or artist main image.
+
+    Profile keys are laid out as profiles/{user_id}/..., so only the users that
+    appear in the page are loaded. URLs are stored as "<base>/<key>".
+    """
+    user_ids = set()
+    for key in keys:
+        match = PROFILE_KEY_RE.match(key)
+        if match:
+            user_ids.add(int(match["user_id"]))
+    if not user_ids:
+        return set()
+
+    urls = list(
+        User.objects.filter(id__in=user_ids)
+        .exclude(Q(profile_image_url__isnull=True) | Q(profile_image_url=""))
+        .values_list("profile_image_url", flat=True)
+    )
+    urls += Artist.objects.filter(user_id__in=user_ids, main_image_url__isnull=False).values_list(
+        "main_image_url", flat=True
+    )
+    return {key for key in keys if any(url.endswith(f"/{key}") for url in urls)}
+
+
+def collect_orphaned_uploads(
+    dry_run: bool = False, grace_seconds: int | None = None, collect_keys: bool = False
+) -> dict:
+    """Run the orphan GC over the artwork and profile buckets.
+
+    Multipart completion records older than the grace period are pruned too
+    (skipped on dry runs).
+
+    Returns:
+        dict: "<bucket>/<prefix>" -> OrphanReport
+    """
+    grace_seconds = grace_seconds or settings.AWS_S3_ORPHAN_GRACE_SECONDS
+    if not dry_run:
+        prune_completed_uploads(grace_seconds)
+    targets = [
+        (settings.AWS_S3_ARTWORK_BUCKET, ARTWORK_PREFIX, referenced_artwork_keys),
+        (settings.AWS_S3_ARTWORK_BUCKET, DERIVATIVE_PREFIX, referenced_derivative_keys),
+        (settings.AWS_S3_PROFILE_BUCKET, PROFILE_PREFIX, referenced_profile_keys),
+    ]
+    return {
+        f"{bucket}/{prefix}": collect_orphans(
+            bucket, prefix, referenced, grace_seconds, dry_run=dry_run, collect_keys=collect_keys
+        )
+        for bucket, prefix, referenced in targets
+        if bucket
+    }
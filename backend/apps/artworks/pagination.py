@@ -0,0 +1,119 @@
+from base64 import b64decode, b64encode
+from urllib import parse
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.utils.urls import replace_query_param
+
+
+class ArtworkPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class ArtworkCursorPagination(CursorPagination):
+    """Keyset pagination over the stable `(created_at, id)` tuple.
+
+    Unlike PageNumberPagination there is no COUNT(*) and no OFFSET scan:
+    every page is a `WHERE (created_at, id) < (...) ORDER BY created_at DESC, id DESC
+    LIMIT n`, so deep pages of the archive cost the same as the first one.
+
+    Cursors are opaque base64 tokens:
+        t: created_at (ISO 8601) of the boundary row
+        i: id of the boundary row
+        r: "1" when paging backwards
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+
+        if self.cursor is None:
+            reverse, boundary = False, None
+        else:
+            reverse, boundary = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by("created_at", "id")
+            if boundary is not None:
+                created_at, pk = boundary
+                queryset = queryset.filter(
+                    Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+                )
+        else:
+            queryset = queryset.order_by("-created_at", "-id")
+            if boundary is not None:
+                created_at, pk = boundary
+                queryset = queryset.filter(
+                    Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+                )
+
+        # Fetch one extra row to know whether another page exists in this direction.
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = boundary is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = boundary is not None
+
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        last = self.page[-1]
+        return self.encode_cursor((False, (last.created_at, last.pk)))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        first = self.page[0]
+        return self.encode_cursor((True, (first.created_at, first.pk)))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            querystring = b64decode(encoded.encode("ascii")).decode("ascii")
+            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+
+            reverse = bool(int(tokens.get("r", ["0"])[0]))
+            created_at = parse_datetime(tokens["t"][0])
+            pk = int(tokens["i"][0])
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if created_at is None:
+            raise NotFound(self.invalid_cursor_message)
+
+        return reverse, (created_at, pk)
+
+    def encode_cursor(self, cursor):
+        reverse, (created_at, pk) = cursor
+        tokens = {"t": created_at.isoformat(), "i": str(pk)}
+        if reverse:
+            tokens["r"] = "1"
+
+        querystring = parse.urlencode(tokens, doseq=True)
+        encoded = b64encode(querystring.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
@@ -0,0 +1,88 @@
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db.models import F, OuterRef, Q, Subquery, TextField, Value
+from django.db.models.functions import Coalesce, Concat, Lower
+
+from apps.artists.models import Artist
+
+from .models import Artwork
+
+# 한국어 형태소 분석 설정이 없으므로 'simple' 설정 + pg_trgm 부분 일치로 보완
+SEARCH_CONFIG = "simple"
+
+
+def _translations(model, master_ref, field):
+    """Subquery aggregating `field` over every translation of the referenced row."""
+    translation_model = model._parler_meta.root_model
+    return Coalesce(
+        Subquery(
+            translation_model.objects.filter(master=OuterRef(master_ref))
+            .order_by()
+            .values("master")
+            .annotate(text=StringAgg(field, " ", output_field=TextField()))
+            .values("text")
+        ),
+        Value(""),
+        output_field=TextField(),
+    )
+
+
+def update_search_index(artwork_ids=None) -> int:
+    """Recompute `search_vector` and `search_text` for the given artworks in one UPDATE.
+
+    Covers every translation of title/description, materials and the artist's
+    translated names. Pass None to rebuild every artwork.
+
+    Returns:
+        int: number of rows updated
+    """
+    title = _translations(Artwork, "pk", "title")
+    description = _translations(Artwork, "pk", "description")
+    artist_name = _translations(Artist, "artist_id", "artist_name")
+
+    qs = Artwork.objects.all()
+    if artwork_ids is not None:
+        qs = qs.filter(id__in=list(artwork_ids))
+
+    return qs.update(
+        search_vector=(
+            SearchVector(title, weight="A", config=SEARCH_CONFIG)
+            + SearchVector(artist_name, weight="A", config=SEARCH_CONFIG)
+            + SearchVector(description, weight="B", config=SEARCH_CONFIG)
+            + SearchVector("materials", weight="C", config=SEARCH_CONFIG)
+        ),
+        search_text=Lower(
+            Concat(
+                title,
+                Value(" "),
+                artist_name,
+                Value(" "),
+                description,
+                Value(" "),
+                "materials",
+                output_field=TextField(),
+            )
+        ),
+    )
+
+
+def search_artworks(queryset, q: str):
+    """Filter and rank a queryset by a search string.
+
+    Whole words hit the GIN-indexed tsvector; substrings (e.g. Korean words
+    inside compounds) hit the pg_trgm GIN index on `search_text`.
+    """
+    query = SearchQuery(q, config=SEARCH_CONFIG, search_type="websearch")
+    return (
+        queryset.filter(Q(search_vector=query) | Q(search_text__contains=q.lower()))
+        .annotate(
+            rank=SearchRank(F("search_vector"), query)
+            + TrigramWordSimilarity(q.lower(), "search_text")
+        )
+        .order_by("-rank", "-id")
+    )
@@ -1,14 +1,58 @@
+from django.conf import settings
 from parler_rest.fields import TranslatedFieldsField
 from parler_rest.serializers import TranslatableModelSerializer
 from rest_framework import serializers
 
-from .models import Artwork
+from apps.utils.serializers import BulkIdsSerializer
+
+from .models import Artwork, ArtworkImage
+
+
+class ArtworkImageSerializer(serializers.ModelSerializer):
+    url = serializers.CharField(source="original_url", read_only=True)
+    thumbnail_url = serializers.SerializerMethodField()
+    srcset = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ArtworkImage
+        fields = [
+            "id",
+            "url",
+            "thumbnail_url",
+            "srcset",
+            "alt_text",
+            "order",
+            "width",
+            "height",
+            "placeholder",
+            "dominant_color",
+        ]
+        read_only_fields = fields
+
+    def get_thumbnail_url(self, obj) -> str | None:
+        return obj.derivative_url(settings.ARTWORK_LIST_THUMBNAIL_WIDTH)
+
+    def get_srcset(self, obj) -> dict:
+        return {"webp": obj.srcset("webp"), "jpeg": obj.srcset("jpeg")}
+
+
+def _cover_image(artwork):
+    """대표 이미지, 없으면 첫 번째 이미지 (prefetch 된 images에서 선택해 추가 쿼리 없음)"""
+    images = list(artwork.images.all())
+    cover = next((img for img in images if img.id == artwork.cover_image_id), None)
+    return cover or (images[0] if images else None)
 
 
 class ArtworkListSerializer(TranslatableModelSerializer):
     title = serializers.SerializerMethodField()
     artist_name = serializers.SerializerMethodField()
-    # thumbnail_url = serializers.SerializerMethodField()
+    thumbnail_url = serializers.SerializerMethodField()
+    thumbnail_srcset = serializers.SerializerMethodField()
+    # 이미지 로딩 전 레이아웃(비율)과 자리표시를 그리기 위한 대표 이미지 메타데이터
+    thumbnail_width = serializers.SerializerMethodField()
+    thumbnail_height = serializers.SerializerMethodField()
+    placeholder = serializers.SerializerMethodField()
+    dominant_color = serializers.SerializerMethodField()
 
     class Meta:
         model = Artwork
@@ -23,6 +67,12 @@ class ArtworkListSerializer(TranslatableModelSerializer):
             "like_count",
             "view_count",
             "is_featured",
+            "thumbnail_url",
+            "thumbnail_srcset",
+            "thumbnail_width",
+            "thumbnail_height",
+            "placeholder",
+            "dominant_color",
         ]
         read_only_fields = [
             "id",
@@ -40,26 +90,36 @@ class ArtworkListSerializer(TranslatableModelSerializer):
             return getter("artist_name", any_language=True)
         return getattr(obj.artist, "name", None)
 
-    # TODO: 썸네일 이미지 추가 필요
-    # def get_thumbnail_url(self, obj):
-    #     return obj.primary_image.image.url
+    def get_thumbnail_url(self, obj) -> str | None:
+        cover = _cover_image(obj)
+        return cover.derivative_url(settings.ARTWORK_LIST_THUMBNAIL_WIDTH) if cover else None
+
+    def get_thumbnail_srcset(self, obj) -> str:
+        cover = _cover_image(obj)
+        return cover.srcset() if cover else ""
+
+    def get_thumbnail_width(self, obj) -> int | None:
+        cover = _cover_image(obj)
+        return cover.width if cover else None
+
+    def get_thumbnail_height(self, obj) -> int | None:
+        cover = _cover_image(obj)
+        return cover.height if cover else None
+
+    def get_placeholder(self, obj) -> str:
+        cover = _cover_image(obj)
+        return cover.placeholder if cover else ""
+
+    def get_dominant_color(self, obj) -> str:
+        cover = _cover_image(obj)
+        return cover.dominant_color if cover else ""
 
 
 class ArtworkDetailSerializer(TranslatableModelSerializer):
     translations = TranslatedFieldsField(shared_model=Artwork)
     # artist_name = serializers.SerializerMethodField()
 
-    # images = serializers.SerializerMethodField()
-
-    # def get_images(self, obj) -> list[dict]:
-    #     return [
-    #         {
-    #             'url': img.url,
-    #             'alt_text': img.alt_text,
-    #             'order': img.order
-    #         }
-    #         for img in obj.images.all().order_by('order')
-    #     ]
+    images = ArtworkImageSerializer(many=True, read_only=True)
 
     class Meta:
         model = Artwork
@@ -79,6 +139,7 @@ class ArtworkDetailSerializer(TranslatableModelSerializer):
             "view_count",
             "like_count",
             "is_featured",
+            "images",
             # "artist_name",
         ]
         read_only_fields = [
@@ -136,6 +197,8 @@ class MyArtworkSerializer(TranslatableModelSerializer):
 
 class ArtworkAdminSerializer(TranslatableModelSerializer):
     translations = TranslatedFieldsField(shared_model=Artwork)
+    # 다른 작품 이미지와 지각 해시가 가까운 이미지 (뷰에서 페이지 단위로 일괄 조회해 context로 전달)
+    possible_duplicates = serializers.SerializerMethodField()
 
     class Meta:
         model = Artwork
@@ -162,6 +225,7 @@ class ArtworkAdminSerializer(TranslatableModelSerializer):
             "deleted_at",
             "created_at",
             "updated_at",
+            "possible_duplicates",
         ]
         read_only_fields = [
             "id",
@@ -173,3 +237,29 @@ class ArtworkAdminSerializer(TranslatableModelSerializer):
             "created_at",
             "updated_at",
         ]
+
+    def get_possible_duplicates(self, obj) -> list:
+        return self.context.get("duplicates", {}).get(obj.id, [])
+
+
+class ImageDuplicateQuerySerializer(serializers.Serializer):
+    radius = serializers.IntegerField(
+        required=False,
+        min_value=0,
+        max_value=settings.ARTWORK_DUPLICATE_SEARCH_MAX_DISTANCE,
+    )
+
+
+class ArtworkBulkModerationSerializer(BulkIdsSerializer):
+    """Target artworks by explicit `ids` or by ArtworkFilter params in `filters`."""
+
+    filters = serializers.DictField(required=False)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["ids"].required = False
+
+    def validate(self, attrs):
+        if bool(attrs.get("ids")) == bool(attrs.get("filters")):
+            raise serializers.ValidationError("Provide either ids or filters.")
+        return attrs
@@ -0,0 +1,38 @@
+from django.db.models.signals import post_save
+from django.dispatch import Signal, receiver
+
+from apps.artists.models import Artist
+
+from .models import Artwork
+from .search import update_search_index
+
+ArtworkTranslation = Artwork._parler_meta.root_model
+ArtistTranslation = Artist._parler_meta.root_model
+
+# 일괄/단건 모더레이션 후(커밋 이후) 1회 발송: artwork_ids, action
+artworks_moderated = Signal()
+
+
+@receiver(post_save, sender=Artwork)
+def artwork_saved(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    # 번역 필드는 번역 모델 저장 시 갱신되므로, 공유 필드 중 materials 변경만 반영
+    if update_fields is not None and "materials" not in update_fields:
+        return
+    update_search_index([instance.pk])
+
+
+@receiver(post_save, sender=ArtworkTranslation)
+def artwork_translation_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    update_search_index([instance.master_id])
+
+
+@receiver(post_save, sender=ArtistTranslation)
+def artist_translation_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    artwork_ids = Artwork.objects.filter(artist_id=instance.master_id).values_list("id", flat=True)
+    update_search_index(artwork_ids)
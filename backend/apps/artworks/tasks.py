@@ -0,0 +1,38 @@
+from celery import shared_task
+from django.conf import settings
+
+from apps.utils.s3_multipart import abort_stale_multipart_uploads
+
+from .images import generate_derivatives
+from .ingestion import poll_upload_events
+from .orphans import collect_orphaned_uploads
+from .view_counter import flush_view_counts
+
+
+@shared_task
+def flush_artwork_view_counts() -> int:
+    return flush_view_counts()
+
+
+@shared_task
+def abort_stale_artwork_multipart_uploads() -> int:
+    bucket = settings.AWS_S3_ARTWORK_BUCKET
+    if not bucket:
+        return 0
+    return abort_stale_multipart_uploads(bucket, prefix="artworks/")
+
+
+@shared_task
+def ingest_artwork_upload_events() -> int:
+    return poll_upload_events()
+
+
+@shared_task
+def collect_orphaned_uploads_task() -> dict:
+    reports = collect_orphaned_uploads()
+    return {target: report.deleted for target, report in reports.items()}
+
+
+@shared_task
+def generate_artwork_image_derivatives(image_ids) -> int:
+    return generate_derivatives(image_ids)
@@ -0,0 +1,81 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+
+from apps.artists.models import Artist
+from apps.artworks.models import Artwork
+
+
+def _count(artist):
+    return Artist.objects.values_list("artwork_count", flat=True).get(pk=artist.pk)
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestArtistArtworkCount:
+    def test_moderation_moves_counter(self, admin_client, artist, artwork_factory):
+        pending = [
+            artwork_factory(artist, approval_status=Artwork.ApprovalStatus.PENDING)
+            for _ in range(3)
+        ]
+        hidden = artwork_factory(
+            artist,
+            approval_status=Artwork.ApprovalStatus.PENDING,
+            display_status=Artwork.DisplayStatus.HIDDEN,
+        )
+        ids = [a.id for a in pending] + [hidden.id]
+
+        admin_client.post(reverse("admin-artwork-bulk-approve"), {"ids": ids}, format="json")
+        # 비공개 작품은 승인되어도 집계 제외
+        assert _count(artist) == 3
+
+        admin_client.post(reverse("admin-artwork-reject", args=[pending[0].id]))
+        assert _count(artist) == 2
+
+        # 이미 거절된 작품을 다시 거절해도 변화 없음
+        admin_client.post(reverse("admin-artwork-bulk-reject"), {"ids": [pending[0].id]})
+        admin_client.post(reverse("admin-artwork-bulk-feature"), {"ids": ids})
+        assert _count(artist) == 2
+
+    def test_owner_soft_delete(self, artist_client, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        Artist.objects.filter(pk=artist.pk).update(artwork_count=1)
+        url = reverse("my-artwork-detail", args=[artwork.id])
+
+        # 작가는 공개 상태를 직접 바꿀 수 없음
+        response = artist_client.patch(url, {"display_status": "hidden"}, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        artwork.refresh_from_db()
+        assert artwork.display_status == Artwork.DisplayStatus.PUBLIC
+        assert _count(artist) == 1
+
+        response = artist_client.delete(url)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        artwork.refresh_from_db()
+        assert artwork.is_deleted and artwork.deleted_at is not None
+        assert _count(artist) == 0
+        assert artist_client.get(url).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_admin_hard_delete(self, admin_client, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        Artist.objects.filter(pk=artist.pk).update(artwork_count=1)
+
+        admin_client.delete(reverse("admin-artwork-detail", args=[artwork.id]))
+        assert _count(artist) == 0
+
+    def test_reconcile_command(self, artist, artwork_factory):
+        artwork_factory(artist)
+        artwork_factory(artist, is_deleted=True)
+        artwork_factory(artist, approval_status=Artwork.ApprovalStatus.PENDING)
+        Artist.objects.filter(pk=artist.pk).update(artwork_count=5)
+
+        out = StringIO()
+        call_command("reconcile_artwork_counts", "--dry-run", stdout=out)
+        assert _count(artist) == 5
+
+        call_command("reconcile_artwork_counts", stdout=out)
+        assert _count(artist) == 1
+        assert "fixed 1" in out.getvalue()
@@ -0,0 +1,75 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from apps.artworks.models import Artwork
+
+
+@pytest.fixture(autouse=True)
+def clear_redis():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestArtworkResponseCache:
+    def test_list_is_served_from_cache(self, api_client, artist, artwork_factory):
+        artwork_factory(artist, is_featured=True)
+        url = reverse("artworks-list")
+
+        first = api_client.get(url)
+        with CaptureQueriesContext(connection) as ctx:
+            second = api_client.get(url)
+
+        assert second.status_code == status.HTTP_200_OK
+        assert second.data == first.data
+        assert len(ctx.captured_queries) == 0
+
+    def test_query_params_are_part_of_key(self, api_client, artist, artwork_factory):
+        artwork_factory(artist, is_featured=True, sale_status="available")
+        url = reverse("artworks-list")
+
+        assert len(api_client.get(url).data["results"]) == 1
+        assert len(api_client.get(url + "?sale_status=sold").data["results"]) == 0
+
+    def test_admin_moderation_invalidates_list(
+        self, api_client, admin_client, artist, artwork_factory, django_capture_on_commit_callbacks
+    ):
+        artwork_factory(artist, is_featured=True, title="featured")
+        pending = artwork_factory(artist, approval_status=Artwork.ApprovalStatus.PENDING)
+        Artwork.objects.filter(pk=pending.pk).update(is_featured=True)
+        url = reverse("artworks-list")
+
+        assert len(api_client.get(url).data["results"]) == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_client.post(
+                reverse("admin-artwork-approve", kwargs={"pk": pending.id})
+            )
+        assert response.status_code == status.HTTP_200_OK
+
+        api_client.credentials()
+        assert len(api_client.get(url).data["results"]) == 2
+
+    def test_owner_edit_invalidates_detail(
+        self, api_client, artist_client, artist, artwork_factory, django_capture_on_commit_callbacks
+    ):
+        artwork = artwork_factory(artist, is_featured=True, price_krw=1000)
+        detail_url = reverse("artworks-detail", kwargs={"pk": artwork.id})
+
+        assert artist_client.get(detail_url).data["price_krw"] == "1000"
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = artist_client.patch(
+                reverse("my-artwork-detail", kwargs={"pk": artwork.id}),
+                {"price_krw": 2000},
+                format="json",
+            )
+        assert response.status_code == status.HTTP_200_OK
+
+        assert artist_client.get(detail_url).data["price_krw"] == "2000"
@@ -0,0 +1,273 @@
+import base64
+import io
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from moto import mock_aws
+from PIL import Image
+from rest_framework import status
+
+from apps.artworks.models import ArtworkImage
+from apps.utils import s3_client
+from apps.utils.image_sniff import ImageInfo, sniff_image
+
+HEAD_LATENCY = 0.2
+# 320x200 GIF 헤더
+GIF_HEADER = b"GIF89a" + (320).to_bytes(2, "little") + (200).to_bytes(2, "little") + b"\0" * 6
+
+
+def jpeg_header(width, height, app_size=0):
+    """SOI + optional APP1 padding segment + SOF0 frame header."""
+    app = b""
+    if app_size:
+        app = b"\xff\xe1" + (app_size + 2).to_bytes(2, "big") + b"\0" * app_size
+    sof = b"\xff\xc0\x00\x11\x08" + height.to_bytes(2, "big") + width.to_bytes(2, "big")
+    return b"\xff\xd8" + app + sof + b"\0" * 64
+
+
+class FakeS3:
+    """Ranged GetObject stub with fixed latency; records peak concurrency and bytes read."""
+
+    def __init__(self, missing=(), bodies=None, default=None):
+        self.missing = set(missing)
+        self.bodies = bodies or {}
+        self.default = default if default is not None else jpeg_header(800, 600)
+        self.active = self.peak = self.bytes_read = self.calls = 0
+        self.lock = threading.Lock()
+
+    def get_object(self, Bucket, Key, Range):
+        with self.lock:
+            self.active += 1
+            self.calls += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(HEAD_LATENCY)
+            if Key in self.missing:
+                raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+            body = self.bodies.get(Key, self.default)
+            start, end = (int(n) for n in Range.removeprefix("bytes=").split("-"))
+            chunk = body[start : end + 1]
+            with self.lock:
+                self.bytes_read += len(chunk)
+            return {
+                "Body": io.BytesIO(chunk),
+                "ContentLength": len(chunk),
+                "ContentRange": f"bytes {start}-{start + len(chunk) - 1}/{len(body)}",
+            }
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+@pytest.mark.unit
+class TestSniffImage:
+    @pytest.mark.parametrize(
+        "pil_format, options, expected",
+        [
+            ("JPEG", {}, "jpeg"),
+            ("PNG", {}, "png"),
+            ("GIF", {}, "gif"),
+            ("WEBP", {"quality": 80}, "webp"),
+            ("WEBP", {"lossless": True}, "webp"),
+        ],
+    )
+    def test_reads_format_and_size_from_header(self, pil_format, options, expected):
+        buffer = io.BytesIO()
+        Image.new("RGB", (321, 123), (10, 20, 30)).save(buffer, pil_format, **options)
+        assert sniff_image(buffer.getvalue()[:1024]) == ImageInfo(expected, 321, 123)
+
+    def test_unknown_bytes(self):
+        assert sniff_image(b"<svg xmlns='http://www.w3.org/2000/svg'/>") is None
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestConfirmBatch:
+    @pytest.fixture(autouse=True)
+    def bucket(self, settings):
+        settings.AWS_S3_ARTWORK_BUCKET = "test-bucket"
+
+    def _keys(self, artwork, n):
+        prefix = f"artworks/{artwork.artist.user.id}/images/{artwork.id}/"
+        return [f"{prefix}{i}.jpg" for i in range(n)]
+
+    def test_heads_run_concurrently_and_insert_once(self, artist_client, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        keys = self._keys(artwork, 10)
+        s3 = FakeS3(missing={keys[-1]})
+
+        url = reverse("my-artwork-images-batch", args=[artwork.id])
+        payload = {"upload_id": "u1", "items": [{"key": k, "order": i} for i, k in enumerate(keys)]}
+
+        with patch("apps.artworks.views.MyArtworkViewSet._get_s3_client", return_value=s3):
+            with CaptureQueriesContext(connection) as ctx:
+                started = time.monotonic()
+                response = artist_client.post(url, payload, format="json")
+                elapsed = time.monotonic() - started
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["created"]) == 9
+        assert response.data["failed"][0]["key"] == keys[-1]
+        assert ArtworkImage.objects.filter(artwork=artwork).count() == 9
+
+        # 10건 직렬이면 2초, 병렬이면 약 1회 왕복
+        assert s3.peak > 1
+        assert elapsed < HEAD_LATENCY * 5
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+        assert len(inserts) == 1
+
+    def test_rejects_mismatched_or_oversized_images(
+        self, settings, artist_client, artist, artwork_factory
+    ):
+        settings.ARTWORK_IMAGE_MAX_PIXELS = 1_000_000
+        artwork = artwork_factory(artist)
+        prefix = f"artworks/{artist.user.id}/images/{artwork.id}/"
+        bodies = {
+            f"{prefix}ok.gif": GIF_HEADER,
+            f"{prefix}fake.jpg": GIF_HEADER,
+            f"{prefix}page.png": b"<html>" + b"\0" * 64,
+            f"{prefix}huge.jpg": jpeg_header(4000, 3000),
+            # SOF가 첫 Range 밖에 있는 JPEG (대형 EXIF) → 추가 Range 1회
+            f"{prefix}exif.jpg": jpeg_header(1200, 800, app_size=40_000) + b"\0" * 100_000,
+        }
+        s3 = FakeS3(bodies=bodies)
+
+        with patch("apps.artworks.views.MyArtworkViewSet._get_s3_client", return_value=s3):
+            response = artist_client.post(
+                reverse("my-artwork-images-batch", args=[artwork.id]),
+                {"upload_id": "u1", "items": [{"key": k} for k in bodies]},
+                format="json",
+            )
+
+        assert {c["key"] for c in response.data["created"]} == {
+            f"{prefix}ok.gif",
+            f"{prefix}exif.jpg",
+        }
+        assert {f["key"]: f["reason"] for f in response.data["failed"]} == {
+            f"{prefix}fake.jpg": "format_mismatch",
+            f"{prefix}page.png": "unsupported_format",
+            f"{prefix}huge.jpg": "dimensions_too_large",
+        }
+        exif = next(c for c in response.data["created"] if c["key"].endswith("exif.jpg"))
+        assert exif["file_size"] == len(bodies[f"{prefix}exif.jpg"])
+        # 전체 다운로드 없이 선두 바이트만 읽음
+        assert s3.calls == len(bodies) + 1
+        assert s3.bytes_read < sum(len(b) for b in bodies.values())
+        assert s3.bytes_read < 40_000 + 16384 * 6
+
+    def test_sets_cover_and_alt_text(self, artist_client, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        first, second = self._keys(artwork, 2)
+        url = reverse("my-artwork-images-batch", args=[artwork.id])
+
+        with patch("apps.artworks.views.MyArtworkViewSet._get_s3_client", return_value=FakeS3()):
+            response = artist_client.post(
+                url,
+                {
+                    "upload_id": "u1",
+                    "items": [{"key": first, "alt_text": "정면"}, {"key": second, "order": 1}],
+                    "set_cover": second,
+                },
+                format="json",
+            )
+            assert response.status_code == status.HTTP_200_OK
+            # 대체 텍스트 없이 다시 확인해도 기존 값 유지
+            artist_client.post(
+                url, {"upload_id": "u2", "items": [{"key": first, "order": 2}]}, format="json"
+            )
+
+        artwork.refresh_from_db()
+        assert artwork.cover_image_id == ArtworkImage.objects.get(key=second).id
+        image = ArtworkImage.objects.get(key=first)
+        assert (image.alt_text, image.order) == ("정면", 2)
+
+    def test_invalid_prefix_skips_s3(self, artist_client, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        s3 = FakeS3()
+        url = reverse("my-artwork-images-batch", args=[artwork.id])
+
+        with patch("apps.artworks.views.MyArtworkViewSet._get_s3_client", return_value=s3):
+            response = artist_client.post(
+                url, {"upload_id": "u1", "items": [{"key": "other/1.jpg"}]}, format="json"
+            )
+
+        assert response.data == {
+            "created": [],
+            "failed": [{"key": "other/1.jpg", "reason": "invalid_prefix"}],
+        }
+        assert s3.peak == 0
+
+    def test_duplicate_keys_are_rejected(self, artist_client, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        (key,) = self._keys(artwork, 1)
+        s3 = FakeS3()
+
+        with patch("apps.artworks.views.MyArtworkViewSet._get_s3_client", return_value=s3):
+            response = artist_client.post(
+                reverse("my-artwork-images-batch", args=[artwork.id]),
+                {"upload_id": "u1", "items": [{"key": key}, {"key": key, "order": 1}]},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert s3.calls == 0
+        assert not ArtworkImage.objects.exists()
+
+    @mock_aws
+    def test_post_policy_upload_is_still_verified(self, artist_client, artist, artwork_factory):
+        s3_client.reset_s3_clients()
+        client = s3_client.get_s3_client()
+        client.create_bucket(
+            Bucket="test-bucket",
+            CreateBucketConfiguration={"LocationConstraint": settings.AWS_REGION},
+        )
+        artwork = artwork_factory(artist)
+        presign_url = reverse("my-artwork-images-presigned-batch", args=[artwork.id])
+
+        response = artist_client.post(
+            presign_url,
+            {
+                "upload_method": "post",
+                "files": [
+                    {"filename": "a.jpg", "content_type": "image/jpeg"},
+                    {"filename": "b.jpg", "content_type": "image/jpeg"},
+                ],
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        uploaded, never_uploaded = response.data["items"]
+        assert uploaded["method"] == "POST"
+
+        policy = json.loads(base64.b64decode(uploaded["fields"]["policy"]))
+        assert ["content-length-range", 1, settings.AWS_S3_MAX_FILE_SIZE] in policy["conditions"]
+        assert {"Content-Type": "image/jpeg"} in policy["conditions"]
+        assert {"key": uploaded["key"]} in policy["conditions"]
+
+        # 정책은 선언된 Content-Type만 강제하므로 실제 바이트는 확인 시 검사
+        client.put_object(
+            Bucket="test-bucket", Key=uploaded["key"], Body=GIF_HEADER, ContentType="image/jpeg"
+        )
+        response = artist_client.post(
+            reverse("my-artwork-images-batch", args=[artwork.id]),
+            {
+                "upload_id": "u1",
+                "items": [{"key": uploaded["key"]}, {"key": never_uploaded["key"]}],
+            },
+            format="json",
+        )
+
+        failed = {f["key"]: f["reason"] for f in response.data["failed"]}
+        assert failed[uploaded["key"]] == "format_mismatch"
+        # 정책 발급만으로는 객체 존재가 보장되지 않음
+        assert failed[never_uploaded["key"]].startswith("not_found")
+        assert response.data["created"] == []
+        assert not ArtworkImage.objects.filter(artwork=artwork).exists()
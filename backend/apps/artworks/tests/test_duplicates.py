@@ -0,0 +1,103 @@
+import io
+import random
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from PIL import Image, ImageFilter
+
+from apps.artworks.duplicates import hamming, hash_bands, lookup_keys, to_signed
+from apps.artworks.images import dhash
+from apps.artworks.models import ArtworkImage
+
+
+def _flip(value, bits):
+    for bit in bits:
+        value ^= 1 << bit
+    return value
+
+
+def _image(artwork, phash, key):
+    return ArtworkImage.objects.create(
+        artwork=artwork, key=key, phash=to_signed(phash), phash_bands=hash_bands(phash)
+    )
+
+
+@pytest.mark.unit
+class TestPerceptualHash:
+    def test_lookup_keys_cover_every_hash_within_radius(self):
+        rng = random.Random(7)
+        for radius in (3, 6, 12):
+            for _ in range(50):
+                value = rng.getrandbits(64)
+                near = _flip(value, rng.sample(range(64), radius))
+                assert hamming(value, near) == radius
+                assert lookup_keys(value, radius) & set(hash_bands(near))
+
+    def test_signed_storage_roundtrip(self):
+        value = (1 << 64) - 5
+        assert to_signed(value) < 0
+        assert hamming(to_signed(value), value) == 0
+        assert hash_bands(to_signed(value)) == hash_bands(value)
+
+    def test_dhash_survives_resize_and_recompression(self):
+        base = Image.radial_gradient("L").convert("RGB").resize((800, 600))
+        base.paste((20, 120, 200), (100, 100, 400, 300))
+        buffer = io.BytesIO()
+        base.resize((400, 300)).save(buffer, "JPEG", quality=60)
+        reupload = Image.open(io.BytesIO(buffer.getvalue()))
+
+        assert hamming(dhash(base), dhash(reupload)) <= 4
+        other = Image.linear_gradient("L").rotate(90).convert("RGB").resize((800, 600))
+        other.paste((200, 40, 40), (450, 250, 750, 550))
+        assert hamming(dhash(base), dhash(other.filter(ImageFilter.BLUR))) > 12
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestDuplicateEndpoints:
+    def test_image_duplicates_within_radius(self, admin_client, artist, artwork_factory):
+        original, copy, unrelated = (artwork_factory(artist) for _ in range(3))
+        value = 0x0123_4567_89AB_CDEF
+        image = _image(original, value, "a/1.jpg")
+        _image(original, _flip(value, [0]), "a/2.jpg")  # 같은 작품의 다른 이미지는 제외
+        dup = _image(copy, _flip(value, [1, 20, 40]), "b/1.jpg")
+        _image(unrelated, _flip(value, range(0, 64, 4)), "c/1.jpg")
+
+        url = reverse("admin-artwork-image-duplicates", args=[image.id])
+        response = admin_client.get(url)
+
+        assert response.data["results"] == [
+            {"image_id": dup.id, "artwork_id": copy.id, "distance": 3}
+        ]
+        assert admin_client.get(url, {"radius": 2}).data["results"] == []
+        assert admin_client.get(url, {"radius": 99}).status_code == 400
+
+    def test_moderation_list_flags_duplicates_in_one_query(
+        self, admin_client, artist, artwork_factory
+    ):
+        artworks = [artwork_factory(artist) for _ in range(4)]
+        value = 0xFEDC_BA98_7654_3210
+        first = _image(artworks[0], value, "a/1.jpg")
+        second = _image(artworks[1], _flip(value, [5, 33]), "b/1.jpg")
+        _image(artworks[2], value ^ ((1 << 64) - 1), "c/1.jpg")
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = admin_client.get(reverse("admin-artwork-list"))
+        results = {item["id"]: item["possible_duplicates"] for item in response.data["results"]}
+
+        assert results[artworks[0].id] == [
+            {
+                "image_id": first.id,
+                "duplicate_image_id": second.id,
+                "artwork_id": artworks[1].id,
+                "distance": 2,
+            }
+        ]
+        assert results[artworks[1].id][0]["duplicate_image_id"] == first.id
+        assert results[artworks[2].id] == results[artworks[3].id] == []
+        overlap = [
+            q for q in ctx.captured_queries if "phash_bands" in q["sql"] and "&&" in q["sql"]
+        ]
+        assert len(overlap) == 1
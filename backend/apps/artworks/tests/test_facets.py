@@ -0,0 +1,50 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+
+@pytest.fixture(autouse=True)
+def clear_redis():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestArtworkFacets:
+    def test_counts_every_facet_in_one_query(self, api_client, artist, artwork_factory):
+        artwork_factory(artist, is_featured=True, category="painting", year_created=2023)
+        artwork_factory(artist, is_featured=True, category="painting", sale_status="available")
+        artwork_factory(artist, is_featured=True, category="sculpture", sale_status="available")
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.get(reverse("artworks-facets"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(ctx.captured_queries) == 1
+        assert response.data["total"] == 3
+        assert response.data["category"] == [
+            {"value": "painting", "count": 2},
+            {"value": "sculpture", "count": 1},
+        ]
+        assert response.data["sale_status"] == [
+            {"value": "available", "count": 2},
+            {"value": "not_for_sale", "count": 1},
+        ]
+        assert response.data["year_created"] == [
+            {"value": 2024, "count": 2},
+            {"value": 2023, "count": 1},
+        ]
+
+    def test_respects_filters(self, authenticated_client, artist, artwork_factory):
+        artwork_factory(artist, category="painting", sale_status="available")
+        artwork_factory(artist, category="sculpture", sale_status="sold")
+
+        response = authenticated_client.get(reverse("artworks-facets"), {"exclude_sold": True})
+
+        assert response.data["total"] == 1
+        assert response.data["category"] == [{"value": "painting", "count": 1}]
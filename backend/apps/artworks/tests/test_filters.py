@@ -0,0 +1,61 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from apps.artworks.models import Artwork
+
+
+@pytest.fixture(autouse=True)
+def clear_redis():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _ids(client, **params):
+    response = client.get(reverse("artworks-list"), params)
+    return sorted(item["id"] for item in response.data["results"])
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestArtworkFilter:
+    def test_dimensions_are_normalized_to_cm(self, artist, artwork_factory):
+        artwork = artwork_factory(artist, width=10, height=20, dimension_unit="inch")
+        assert artwork.width_cm == pytest.approx(25.4)
+        assert artwork.height_cm == pytest.approx(50.8)
+
+        artwork.dimension_unit = "cm"
+        artwork.save(update_fields=["dimension_unit"])
+        artwork.refresh_from_db()
+        assert artwork.width_cm == pytest.approx(10)
+
+    def test_size_filter_uses_normalized_columns(
+        self, authenticated_client, artist, artwork_factory
+    ):
+        small_inch = artwork_factory(artist, width=10, height=10, dimension_unit="inch")
+        large_cm = artwork_factory(artist, width=100, height=100)
+
+        assert _ids(authenticated_client, width_cm_min=20, width_cm_max=30) == [small_inch.id]
+        assert _ids(authenticated_client, height_cm_min=50) == [large_cm.id]
+
+    def test_price_year_and_like_ranges(self, authenticated_client, artist, artwork_factory):
+        cheap = artwork_factory(artist, price_krw=100000, year_created=2020)
+        pricey = artwork_factory(artist, price_krw=900000, year_created=2024)
+        Artwork.objects.filter(pk=pricey.pk).update(like_count=30)
+
+        assert _ids(authenticated_client, price_krw_max=500000) == [cheap.id]
+        assert _ids(authenticated_client, year_created_min=2022) == [pricey.id]
+        assert _ids(authenticated_client, like_count_min=10) == [pricey.id]
+
+    def test_category_in(self, authenticated_client, artist, artwork_factory):
+        painting = artwork_factory(artist, category="painting")
+        sculpture = artwork_factory(artist, category="sculpture")
+        artwork_factory(artist, category="ceramics")
+
+        ids = _ids(authenticated_client, category__in="painting,sculpture")
+        assert ids == sorted([painting.id, sculpture.id])
+
+    def test_deleted_artworks_are_hidden(self, authenticated_client, artist, artwork_factory):
+        artwork_factory(artist, is_deleted=True)
+        assert _ids(authenticated_client) == []
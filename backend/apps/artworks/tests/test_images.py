@@ -0,0 +1,209 @@
+import io
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+from django.core.cache import cache
+from django.urls import reverse
+from moto import mock_aws
+from PIL import ExifTags, Image
+
+from apps.artworks.images import (
+    MISSING_DERIVATIVES,
+    derivative_key,
+    original_key_from_derivative,
+    render_derivatives,
+)
+from apps.artworks.models import ArtworkImage
+from apps.artworks.tasks import generate_artwork_image_derivatives
+from apps.utils import s3_client
+
+BUCKET = "test-bucket"
+
+
+@pytest.fixture(autouse=True)
+def clear_redis():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _jpeg(width, height):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 30, 30)).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def s3(settings):
+    settings.AWS_S3_ARTWORK_BUCKET = BUCKET
+    settings.AWS_S3_ARTWORK_PUBLIC_URL = "https://cdn.example.com"
+    with mock_aws():
+        s3_client.reset_s3_clients()
+        client = s3_client.get_s3_client()
+        client.create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": settings.AWS_REGION},
+        )
+        yield client
+    s3_client.reset_s3_clients()
+
+
+@pytest.mark.unit
+class TestRenderDerivatives:
+    def test_renders_every_width_and_format(self):
+        size, rendered, preview = render_derivatives(_jpeg(2400, 1200), [320, 640, 1280])
+
+        assert size == (2400, 1200)
+        assert set(rendered) == {(w, f) for w in (320, 640, 1280) for f in ("webp", "jpeg")}
+        assert Image.open(io.BytesIO(rendered[(640, "webp")])).size == (640, 320)
+        assert Image.open(io.BytesIO(rendered[(640, "jpeg")])).format == "JPEG"
+
+        assert preview["placeholder"].startswith("data:image/webp;base64,")
+        assert len(preview["placeholder"]) < 1000
+        # 단색 (200, 30, 30) 원본 → JPEG 손실 감안해 근사 비교
+        r, g, b = (int(preview["dominant_color"][i : i + 2], 16) for i in (1, 3, 5))
+        assert abs(r - 200) < 8 and abs(g - 30) < 8 and abs(b - 30) < 8
+
+    def test_never_upscales(self):
+        _, rendered, _ = render_derivatives(_jpeg(500, 500), [320, 640, 1280])
+        assert {w for w, _ in rendered} == {320}
+
+        _, rendered, _ = render_derivatives(_jpeg(200, 100), [320, 640])
+        assert {w for w, _ in rendered} == {200}
+
+    def test_size_follows_exif_orientation(self):
+        buffer = io.BytesIO()
+        exif = Image.Exif()
+        exif[ExifTags.Base.Orientation] = 6  # 90도 회전해서 표시
+        Image.new("RGB", (1200, 800), (10, 20, 30)).save(buffer, "JPEG", exif=exif)
+        buffer.seek(0)
+
+        size, rendered, _ = render_derivatives(buffer, [320])
+        assert size == (800, 1200)
+        assert Image.open(io.BytesIO(rendered[(320, "webp")])).size == (320, 480)
+
+    def test_derivative_key_roundtrip(self):
+        key = derivative_key("artworks/1/images/2/a.jpg", 640, "webp")
+        assert key == "derivatives/artworks/1/images/2/a.jpg/w640.webp"
+        assert original_key_from_derivative(key) == "artworks/1/images/2/a.jpg"
+        assert original_key_from_derivative("artworks/1/images/2/a.jpg") is None
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestDerivativePipeline:
+    def test_generates_and_records_derivatives(
+        self, s3, settings, authenticated_client, artist, artwork_factory
+    ):
+        settings.ARTWORK_IMAGE_WIDTHS = [320, 640]
+        artwork = artwork_factory(artist)
+        key = f"artworks/{artist.user.id}/images/{artwork.id}/a.jpg"
+        s3.put_object(Bucket=BUCKET, Key=key, Body=_jpeg(1600, 1200))
+        image = ArtworkImage.objects.create(artwork=artwork, key=key)
+
+        with patch.object(s3, "get_object", wraps=s3.get_object) as get_object:
+            assert generate_artwork_image_derivatives([image.id]) == 1
+        assert get_object.call_count == 1
+
+        image.refresh_from_db()
+        assert (image.width, image.height) == (1600, 1200)
+        assert image.derivatives["webp"]["640"] == derivative_key(key, 640, "webp")
+        head = s3.head_object(Bucket=BUCKET, Key=image.derivatives["jpeg"]["320"])
+        assert head["ContentType"] == "image/jpeg"
+        assert "immutable" in head["CacheControl"]
+
+        # 이미 처리된 이미지는 건너뜀
+        assert generate_artwork_image_derivatives([image.id]) == 0
+
+        list_item = authenticated_client.get(reverse("artworks-list")).data["results"][0]
+        assert list_item["thumbnail_url"] == f"https://cdn.example.com/{key_640(key)}"
+        assert list_item["thumbnail_srcset"].endswith("w640.webp 640w")
+        assert (list_item["thumbnail_width"], list_item["thumbnail_height"]) == (1600, 1200)
+        assert list_item["placeholder"] == image.placeholder != ""
+        assert list_item["dominant_color"].startswith("#")
+
+        detail = authenticated_client.get(reverse("artworks-detail", args=[artwork.id])).data
+        assert detail["images"][0]["url"] == f"https://cdn.example.com/{key}"
+        assert "w320.jpg 320w" in detail["images"][0]["srcset"]["jpeg"]
+
+    def test_backfills_placeholder_for_processed_images(self, s3, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        key = f"artworks/{artist.user.id}/images/{artwork.id}/a.jpg"
+        s3.put_object(Bucket=BUCKET, Key=key, Body=_jpeg(400, 300))
+        # 미리보기 필드 도입 이전에 파생 이미지만 생성된 행
+        image = ArtworkImage.objects.create(
+            artwork=artwork, key=key, derivatives={"webp": {"320": "old"}}
+        )
+
+        assert generate_artwork_image_derivatives([image.id]) == 1
+        image.refresh_from_db()
+        assert image.placeholder.startswith("data:image/webp")
+        assert len(image.dominant_color) == 7
+
+    def test_unprocessed_image_has_no_thumbnail(
+        self, s3, authenticated_client, artist, artwork_factory
+    ):
+        """파생 이미지가 없으면 원본(수백 MB 가능)을 썸네일로 내보내지 않음"""
+        artwork = artwork_factory(artist)
+        ArtworkImage.objects.create(artwork=artwork, key="artworks/1/images/1/a.jpg")
+
+        item = authenticated_client.get(reverse("artworks-list")).data["results"][0]
+        assert item["thumbnail_url"] is None
+        assert item["thumbnail_srcset"] == ""
+
+    def test_undecodable_original_is_flagged_once(self, s3, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        key = f"artworks/{artist.user.id}/images/{artwork.id}/a.jpg"
+        s3.put_object(Bucket=BUCKET, Key=key, Body=b"\xff\xd8 not really a jpeg")
+        image = ArtworkImage.objects.create(artwork=artwork, key=key)
+
+        assert generate_artwork_image_derivatives([image.id]) == 0
+        image.refresh_from_db()
+        assert image.decode_failed
+        # 백필 대상에서 제외되어 다시 큐에 넣지 않음
+        assert not ArtworkImage.objects.filter(MISSING_DERIVATIVES).exists()
+
+    def test_failed_upload_skips_only_that_image(self, s3, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        prefix = f"artworks/{artist.user.id}/images/{artwork.id}/"
+        images = []
+        for name in ("a.jpg", "b.jpg"):
+            s3.put_object(Bucket=BUCKET, Key=prefix + name, Body=_jpeg(400, 300))
+            images.append(ArtworkImage.objects.create(artwork=artwork, key=prefix + name))
+        put_object = s3.put_object
+
+        def fail_for_first(**kwargs):
+            if original_key_from_derivative(kwargs["Key"]) == images[0].key:
+                raise ClientError({"Error": {"Code": "SlowDown"}}, "PutObject")
+            return put_object(**kwargs)
+
+        with patch.object(s3, "put_object", side_effect=fail_for_first):
+            assert generate_artwork_image_derivatives([img.id for img in images]) == 1
+
+        failed, done = (ArtworkImage.objects.get(pk=img.pk) for img in images)
+        assert failed.derivatives == {} and done.derivatives
+        # 실패한 이미지는 다음 백필에서 다시 처리
+        assert list(ArtworkImage.objects.filter(MISSING_DERIVATIVES)) == [failed]
+
+    def test_confirm_schedules_pipeline_after_commit(
+        self, s3, artist_client, artist, artwork_factory, django_capture_on_commit_callbacks
+    ):
+        artwork = artwork_factory(artist)
+        key = f"artworks/{artist.user.id}/images/{artwork.id}/a.jpg"
+        s3.put_object(Bucket=BUCKET, Key=key, Body=_jpeg(800, 600))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = artist_client.post(
+                reverse("my-artwork-images-batch", args=[artwork.id]),
+                {"upload_id": "u1", "items": [{"key": key}]},
+                format="json",
+            )
+
+        assert response.data["failed"] == []
+        image = ArtworkImage.objects.get(key=key)
+        assert set(image.derivatives["webp"]) == {"320", "640"}
+
+
+def key_640(key):
+    return derivative_key(key, 640, "webp")
@@ -0,0 +1,158 @@
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from moto import mock_aws
+
+from apps.artworks.ingestion import parse_image_key, records_from_message
+from apps.artworks.models import ArtworkImage, CompletedMultipartUpload
+from apps.artworks.tasks import ingest_artwork_upload_events
+from apps.utils import s3_client
+
+BUCKET = "test-bucket"
+# SOI + SOF0 (16x16)
+JPEG = b"\xff\xd8\xff\xc0\x00\x11\x08\x00\x10\x00\x10" + b"\0" * 16
+
+
+def s3_event(*keys, bucket=BUCKET, event="ObjectCreated:Put"):
+    return json.dumps(
+        {
+            "Records": [
+                {
+                    "eventName": event,
+                    "s3": {"bucket": {"name": bucket}, "object": {"key": key, "size": 1024}},
+                }
+                for key in keys
+            ]
+        }
+    )
+
+
+@pytest.fixture
+def sqs(settings):
+    settings.AWS_S3_ARTWORK_BUCKET = BUCKET
+    with mock_aws():
+        s3_client.reset_s3_clients()
+        client = s3_client.get_sqs_client()
+        settings.AWS_S3_EVENTS_QUEUE_URL = client.create_queue(QueueName="uploads")["QueueUrl"]
+        settings.AWS_S3_EVENTS_WAIT_SECONDS = 0
+        s3_client.get_s3_client().create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": settings.AWS_REGION},
+        )
+        yield client
+    s3_client.reset_s3_clients()
+
+
+@pytest.mark.unit
+class TestEventParsing:
+    def test_parse_image_key(self):
+        assert parse_image_key("artworks/3/images/7/abc.jpg") == (3, 7)
+        assert parse_image_key("profiles/3/abc.jpg") is None
+        assert parse_image_key("artworks/3/images/7/sub/abc.jpg") is None
+
+    def test_records_from_sns_wrapped_message(self):
+        body = json.dumps({"Message": s3_event("artworks/1/images/2/a+b.jpg")})
+        assert records_from_message(body) == [
+            {"bucket": BUCKET, "key": "artworks/1/images/2/a b.jpg", "size": 1024}
+        ]
+
+    def test_ignores_other_events(self):
+        assert records_from_message(s3_event("k", event="ObjectRemoved:Delete")) == []
+        assert records_from_message(json.dumps({"Event": "s3:TestEvent"})) == []
+        assert records_from_message("not json") == []
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestUploadEventIngestion:
+    def _put(self, key, body=JPEG):
+        s3_client.get_s3_client().put_object(Bucket=BUCKET, Key=key, Body=body)
+
+    def test_poll_creates_images_in_batch(self, sqs, settings, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        prefix = f"artworks/{artist.user.id}/images/{artwork.id}/"
+        queue_url = settings.AWS_S3_EVENTS_QUEUE_URL
+        for name in ("a.jpg", "b.jpg"):
+            self._put(f"{prefix}{name}")
+
+        sqs.send_message(QueueUrl=queue_url, MessageBody=s3_event(f"{prefix}a.jpg"))
+        sqs.send_message(
+            QueueUrl=queue_url,
+            MessageBody=s3_event(
+                f"{prefix}b.jpg",
+                f"artworks/999/images/{artwork.id}/x.jpg",  # 다른 사용자
+                f"{prefix}a.jpg",  # 중복 이벤트
+            ),
+        )
+        sqs.send_message(QueueUrl=queue_url, MessageBody=s3_event(f"{prefix}c.jpg", bucket="other"))
+
+        assert ingest_artwork_upload_events() == 2
+        assert set(ArtworkImage.objects.values_list("key", flat=True)) == {
+            f"{prefix}a.jpg",
+            f"{prefix}b.jpg",
+        }
+        assert sqs.receive_message(QueueUrl=queue_url).get("Messages", []) == []
+
+    def test_applies_confirm_checks(self, sqs, settings, artist, artwork_factory):
+        """S3 이벤트 수집도 confirm_batch 와 같은 검증을 거침"""
+        settings.AWS_S3_MAX_FILE_SIZE = 64
+        artwork = artwork_factory(artist)
+        deleted = artwork_factory(artist, is_deleted=True)
+        prefix = f"artworks/{artist.user.id}/images/{artwork.id}/"
+        big = JPEG.ljust(1024, b"\0")
+        bodies = {
+            f"{prefix}ok.jpg": JPEG,
+            f"{prefix}big.jpg": big,  # 단일 업로드 크기 제한 초과
+            f"{prefix}scan.jpg": big,  # 크기 검증을 마친 멀티파트 원본
+            f"{prefix}page.jpg": b"<html></html>",
+            f"{prefix}fake.png": JPEG,
+            f"artworks/{artist.user.id}/images/{deleted.id}/a.jpg": JPEG,
+        }
+        for key, body in bodies.items():
+            self._put(key, body)
+        CompletedMultipartUpload.objects.create(key=f"{prefix}scan.jpg", size=len(big))
+        sqs.send_message(QueueUrl=settings.AWS_S3_EVENTS_QUEUE_URL, MessageBody=s3_event(*bodies))
+
+        assert ingest_artwork_upload_events() == 2
+        assert set(ArtworkImage.objects.values_list("key", flat=True)) == {
+            f"{prefix}ok.jpg",
+            f"{prefix}scan.jpg",
+        }
+        assert not CompletedMultipartUpload.objects.exists()
+
+    def test_missing_object_is_ignored(self, sqs, settings, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        key = f"artworks/{artist.user.id}/images/{artwork.id}/gone.jpg"
+        sqs.send_message(QueueUrl=settings.AWS_S3_EVENTS_QUEUE_URL, MessageBody=s3_event(key))
+
+        assert ingest_artwork_upload_events() == 0
+        assert not ArtworkImage.objects.exists()
+
+    def test_confirm_finalizes_ingested_image(
+        self, sqs, settings, artist_client, artist, artwork_factory
+    ):
+        artwork = artwork_factory(artist)
+        key = f"artworks/{artist.user.id}/images/{artwork.id}/a.jpg"
+        self._put(key)
+        sqs.send_message(QueueUrl=settings.AWS_S3_EVENTS_QUEUE_URL, MessageBody=s3_event(key))
+        ingest_artwork_upload_events()
+        ingested = ArtworkImage.objects.get(key=key)
+
+        class FakeS3:
+            def get_object(self, Bucket, Key, Range):
+                return {"Body": io.BytesIO(JPEG), "ContentRange": f"bytes 0-26/{len(JPEG)}"}
+
+        with patch("apps.artworks.views.MyArtworkViewSet._get_s3_client", return_value=FakeS3()):
+            response = artist_client.post(
+                reverse("my-artwork-images-batch", args=[artwork.id]),
+                {"upload_id": "u1", "items": [{"key": key, "order": 3}]},
+                format="json",
+            )
+
+        assert response.data["created"][0]["id"] == ingested.id
+        ingested.refresh_from_db()
+        assert ingested.order == 3
+        assert ArtworkImage.objects.count() == 1
@@ -0,0 +1,174 @@
+import threading
+from datetime import timedelta
+
+import pytest
+from django.db import connection, connections, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.artworks.models import Artwork
+from apps.artworks.moderation import claim_artworks
+from apps.artworks.signals import artworks_moderated
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestBulkArtworkModeration:
+    def test_bulk_approve_by_ids(
+        self, admin_client, artist, artwork_factory, django_capture_on_commit_callbacks
+    ):
+        pending = [
+            artwork_factory(artist, approval_status=Artwork.ApprovalStatus.PENDING)
+            for _ in range(3)
+        ]
+        approved = artwork_factory(artist)
+        ids = [a.id for a in pending] + [approved.id, 999999]
+
+        received = []
+
+        def handler(sender, artwork_ids, action, **kwargs):
+            received.append((sorted(artwork_ids), action))
+
+        artworks_moderated.connect(handler)
+        try:
+            with django_capture_on_commit_callbacks(execute=True):
+                with CaptureQueriesContext(connection) as ctx:
+                    response = admin_client.post(
+                        reverse("admin-artwork-bulk-approve"), {"ids": ids}, format="json"
+                    )
+        finally:
+            artworks_moderated.disconnect(handler)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["updated"] == 3
+        statuses = {r["id"]: r["status"] for r in response.data["results"]}
+        assert statuses[approved.id] == "unchanged"
+        assert statuses[999999] == "not_found"
+        assert Artwork.objects.filter(approval_status="approved").count() == 4
+
+        updates = [q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        # 작품 일괄 UPDATE 1회 + 작가 작품 수 UPDATE 1회
+        assert len(updates) == 2
+        # 알림 fan-out 신호는 배치당 1회
+        assert received == [(sorted(a.id for a in pending), "approve")]
+
+    def test_bulk_feature_by_filters(self, admin_client, artist, artwork_factory):
+        painting = artwork_factory(artist, category="painting")
+        artwork_factory(artist, category="sculpture")
+
+        response = admin_client.post(
+            reverse("admin-artwork-bulk-feature"),
+            {"filters": {"category": "painting"}},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"] == [{"id": painting.id, "status": "updated"}]
+        painting.refresh_from_db()
+        assert painting.is_featured is True
+        assert painting.featured_at is not None
+
+    def test_requires_ids_or_filters(self, admin_client):
+        response = admin_client.post(reverse("admin-artwork-bulk-reject"), {}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_non_admin_forbidden(self, authenticated_client):
+        response = authenticated_client.post(
+            reverse("admin-artwork-bulk-approve"), {"ids": [1]}, format="json"
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestModerationQueue:
+    @pytest.fixture
+    def other_admin(self, django_user_model):
+        return django_user_model.objects.create_user(
+            email="admin2@example.com",
+            username="admin2",
+            password="admin1234",
+            user_type="ARTIST",
+            is_staff=True,
+        )
+
+    def _pending(self, artist, artwork_factory, n):
+        return [
+            artwork_factory(artist, approval_status=Artwork.ApprovalStatus.PENDING)
+            for _ in range(n)
+        ]
+
+    def test_claims_are_disjoint(
+        self, admin_client, admin_user, other_admin, artist, artwork_factory
+    ):
+        pending = self._pending(artist, artwork_factory, 3)
+        artwork_factory(artist)  # 승인된 작품은 큐에 없음
+        artwork_factory(  # 삭제된 작품도 큐에 없음
+            artist, approval_status=Artwork.ApprovalStatus.PENDING, is_deleted=True
+        )
+
+        response = admin_client.post(
+            reverse("admin-artwork-queue-claim"), {"limit": 2}, format="json"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        first = [item["id"] for item in response.data["results"]]
+        assert first == [pending[0].id, pending[1].id]
+
+        second, _ = claim_artworks(other_admin, 10)
+        assert second == [pending[2].id]
+        assert claim_artworks(other_admin, 10)[0] == []
+
+    def test_expired_lease_returns_to_queue(self, admin_user, other_admin, artist, artwork_factory):
+        (artwork,) = self._pending(artist, artwork_factory, 1)
+        claim_artworks(admin_user, 1)
+
+        Artwork.objects.filter(id=artwork.id).update(
+            review_claimed_until=timezone.now() - timedelta(seconds=1)
+        )
+
+        assert claim_artworks(other_admin, 1)[0] == [artwork.id]
+        artwork.refresh_from_db()
+        assert artwork.review_claimed_by == other_admin
+
+    def test_release_and_moderation_clear_claim(
+        self, admin_client, admin_user, artist, artwork_factory
+    ):
+        first, second = self._pending(artist, artwork_factory, 2)
+        claim_artworks(admin_user, 2)
+
+        response = admin_client.post(
+            reverse("admin-artwork-queue-release"), {"ids": [first.id]}, format="json"
+        )
+        assert response.data == {"released": 1}
+        admin_client.post(reverse("admin-artwork-approve", args=[second.id]))
+
+        assert not Artwork.objects.filter(review_claimed_by__isnull=False).exists()
+        assert claim_artworks(admin_user, 10)[0] == [first.id]
+
+
+@pytest.mark.unit
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_claim_skips_locked_rows(admin_user, artist, artwork_factory):
+    pending = [
+        artwork_factory(artist, approval_status=Artwork.ApprovalStatus.PENDING) for _ in range(3)
+    ]
+    result = {}
+
+    def claim_in_other_connection():
+        try:
+            result["ids"] = claim_artworks(admin_user, 10)[0]
+        finally:
+            connections.close_all()
+
+    # 첫 번째 점유 트랜잭션이 커밋되기 전에 다른 연결에서 점유 → 대기 없이 남은 행만 반환
+    with transaction.atomic():
+        claimed, _ = claim_artworks(admin_user, 2)
+        thread = threading.Thread(target=claim_in_other_connection)
+        thread.start()
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+
+    assert claimed == [pending[0].id, pending[1].id]
+    assert result["ids"] == [pending[2].id]
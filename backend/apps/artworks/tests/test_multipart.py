@@ -0,0 +1,147 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.urls import reverse
+from moto import mock_aws
+from rest_framework import status
+
+from apps.artworks.models import CompletedMultipartUpload
+from apps.artworks.tasks import abort_stale_artwork_multipart_uploads
+from apps.utils import s3_client
+
+BUCKET = "test-bucket"
+
+
+@pytest.fixture
+def s3(settings):
+    settings.AWS_S3_ARTWORK_BUCKET = BUCKET
+    with mock_aws():
+        s3_client.reset_s3_clients()
+        client = s3_client.get_s3_client()
+        client.create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": settings.AWS_REGION},
+        )
+        yield client
+    s3_client.reset_s3_clients()
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestMultipartUpload:
+    def _create(self, client, artwork, size=6 * 1024 * 1024):
+        response = client.post(
+            reverse("my-artwork-images-multipart", args=[artwork.id]),
+            {"filename": "scan.jpg", "content_type": "image/jpeg", "size": size},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        return response.data
+
+    def test_full_flow(self, s3, settings, artist_client, artist, artwork_factory):
+        # 멀티파트 원본은 단일 업로드 크기 제한보다 커도 확인됨
+        settings.AWS_S3_MAX_FILE_SIZE = 512
+        artwork = artwork_factory(artist)
+        upload = self._create(artist_client, artwork)
+        assert upload["key"].startswith(f"artworks/{artist.user.id}/images/{artwork.id}/")
+        assert upload["part_count"] == 1
+
+        parts_url = reverse("my-artwork-images-multipart-parts", args=[artwork.id])
+        response = artist_client.post(
+            parts_url,
+            {"key": upload["key"], "upload_id": upload["upload_id"], "part_numbers": [1]},
+            format="json",
+        )
+        assert response.data["parts"][0]["part_number"] == 1
+        assert "partNumber=1" in response.data["parts"][0]["url"]
+
+        # 클라이언트의 파트 업로드 (마지막 파트는 5MB 미만 허용)
+        etag = s3.upload_part(
+            Bucket=BUCKET,
+            Key=upload["key"],
+            UploadId=upload["upload_id"],
+            PartNumber=1,
+            # SOI + SOF0 (1200x800) 헤더, 나머지는 패딩
+            Body=(b"\xff\xd8\xff\xc0\x00\x11\x08\x03\x20\x04\xb0").ljust(1024, b"\0"),
+        )["ETag"]
+
+        response = artist_client.get(
+            parts_url, {"key": upload["key"], "upload_id": upload["upload_id"]}
+        )
+        assert response.data["parts"] == [{"part_number": 1, "etag": etag, "size": 1024}]
+
+        response = artist_client.post(
+            reverse("my-artwork-images-multipart-complete", args=[artwork.id]),
+            {
+                "key": upload["key"],
+                "upload_id": upload["upload_id"],
+                "parts": [{"part_number": 1, "etag": etag}],
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["file_size"] == 1024
+
+        confirm_url = reverse("my-artwork-images-batch", args=[artwork.id])
+        payload = {"upload_id": upload["upload_id"], "items": [{"key": upload["key"]}]}
+        # 일시적인 조회 실패 후 재시도해도 완료 기록이 남아 있어 크기 제한에 걸리지 않음
+        transient = ClientError({"Error": {"Code": "SlowDown"}}, "GetObject")
+        with patch("apps.artworks.uploads.probe_objects", return_value={upload["key"]: transient}):
+            response = artist_client.post(confirm_url, payload, format="json")
+        assert response.data["failed"][0]["reason"].startswith("not_found")
+        assert CompletedMultipartUpload.objects.filter(key=upload["key"]).exists()
+
+        response = artist_client.post(confirm_url, payload, format="json")
+        assert [c["key"] for c in response.data["created"]] == [upload["key"]]
+        assert not CompletedMultipartUpload.objects.exists()
+
+    def test_rejects_foreign_key(self, s3, artist_client, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        response = artist_client.post(
+            reverse("my-artwork-images-multipart-abort", args=[artwork.id]),
+            {"key": "artworks/999/images/1/a.jpg", "upload_id": "x"},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_rejects_oversize(self, s3, artist_client, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        response = artist_client.post(
+            reverse("my-artwork-images-multipart", args=[artwork.id]),
+            {
+                "filename": "scan.jpg",
+                "content_type": "image/jpeg",
+                "size": settings.AWS_S3_MULTIPART_MAX_FILE_SIZE + 1,
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_abort(self, s3, artist_client, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        upload = self._create(artist_client, artwork)
+
+        response = artist_client.post(
+            reverse("my-artwork-images-multipart-abort", args=[artwork.id]),
+            {"key": upload["key"], "upload_id": upload["upload_id"]},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert s3.list_multipart_uploads(Bucket=BUCKET).get("Uploads", []) == []
+
+    def test_sweeper_aborts_only_stale_uploads(self, s3, artist_client, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        self._create(artist_client, artwork)
+
+        initiated = s3.list_multipart_uploads(Bucket=BUCKET)["Uploads"][0]["Initiated"]
+
+        with patch("apps.utils.s3_multipart.timezone.now", return_value=initiated):
+            assert abort_stale_artwork_multipart_uploads() == 0
+
+        stale = initiated + timedelta(seconds=settings.AWS_S3_MULTIPART_STALE_SECONDS + 60)
+        with patch("apps.utils.s3_multipart.timezone.now", return_value=stale):
+            assert abort_stale_artwork_multipart_uploads() == 1
+        assert s3.list_multipart_uploads(Bucket=BUCKET).get("Uploads", []) == []
@@ -0,0 +1,137 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from moto import mock_aws
+
+from apps.artworks.models import Artwork, ArtworkImage, CompletedMultipartUpload
+from apps.artworks.orphans import collect_orphaned_uploads
+from apps.utils import s3_client
+
+ARTWORK_BUCKET = "artwork-bucket"
+PROFILE_BUCKET = "profile-bucket"
+
+
+@pytest.fixture
+def s3(settings):
+    settings.AWS_S3_ARTWORK_BUCKET = ARTWORK_BUCKET
+    settings.AWS_S3_PROFILE_BUCKET = PROFILE_BUCKET
+    with mock_aws():
+        s3_client.reset_s3_clients()
+        client = s3_client.get_s3_client()
+        for bucket in (ARTWORK_BUCKET, PROFILE_BUCKET):
+            client.create_bucket(
+                Bucket=bucket,
+                CreateBucketConfiguration={"LocationConstraint": settings.AWS_REGION},
+            )
+        yield client
+    s3_client.reset_s3_clients()
+
+
+def _keys(s3, bucket):
+    return {obj["Key"] for obj in s3.list_objects_v2(Bucket=bucket).get("Contents", [])}
+
+
+def _after_grace(settings):
+    later = timezone.now() + timedelta(seconds=settings.AWS_S3_ORPHAN_GRACE_SECONDS + 60)
+    return patch("apps.utils.s3_gc.timezone.now", return_value=later)
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestOrphanCollection:
+    @pytest.fixture
+    def objects(self, s3, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        user_id = artist.user.id
+        kept = f"artworks/{user_id}/images/{artwork.id}/kept.jpg"
+        ArtworkImage.objects.create(artwork=artwork, key=kept)
+
+        artist.user.profile_image_url = (
+            f"https://{PROFILE_BUCKET}.s3.amazonaws.com/profiles/{user_id}/me.jpg"
+        )
+        artist.user.save(update_fields=["profile_image_url"])
+        artist.main_image_url = f"https://cdn.example.com/profiles/{user_id}/artist_main/main.jpg"
+        artist.save(update_fields=["main_image_url"])
+
+        artwork_keys = [kept] + [
+            f"artworks/{user_id}/images/{artwork.id}/orphan{i}.jpg" for i in range(5)
+        ]
+        profile_keys = [
+            f"profiles/{user_id}/me.jpg",
+            f"profiles/{user_id}/artist_main/main.jpg",
+            f"profiles/{user_id}/old.jpg",
+        ]
+        for key in artwork_keys:
+            s3.put_object(Bucket=ARTWORK_BUCKET, Key=key, Body=b"x")
+        for key in profile_keys:
+            s3.put_object(Bucket=PROFILE_BUCKET, Key=key, Body=b"x")
+        return kept, user_id
+
+    def test_deletes_only_unreferenced_objects_in_batches(self, s3, settings, objects):
+        kept, user_id = objects
+
+        with _after_grace(settings), patch("apps.utils.s3_gc.DELETE_BATCH_SIZE", 2):
+            with patch.object(s3, "delete_objects", wraps=s3.delete_objects) as delete:
+                reports = collect_orphaned_uploads()
+
+        assert reports[f"{ARTWORK_BUCKET}/artworks/"].deleted == 5
+        assert reports[f"{PROFILE_BUCKET}/profiles/"].deleted == 1
+        # 6개 삭제 → 버킷별 2개씩 묶음: artworks 3회 + profiles 1회
+        assert delete.call_count == 4
+        assert _keys(s3, ARTWORK_BUCKET) == {kept}
+        assert _keys(s3, PROFILE_BUCKET) == {
+            f"profiles/{user_id}/me.jpg",
+            f"profiles/{user_id}/artist_main/main.jpg",
+        }
+
+    def test_deleted_artwork_images_are_kept_for_retention(self, s3, settings, objects):
+        kept, _ = objects
+        deleted_at = timezone.now()
+        Artwork.objects.filter(images__key=kept).update(is_deleted=True, deleted_at=deleted_at)
+
+        # 삭제 직후에는 복구할 수 있도록 보존
+        with _after_grace(settings):
+            collect_orphaned_uploads()
+        assert _keys(s3, ARTWORK_BUCKET) == {kept}
+
+        Artwork.objects.filter(images__key=kept).update(
+            deleted_at=deleted_at
+            - timedelta(seconds=settings.ARTWORK_DELETED_IMAGE_RETENTION_SECONDS + 60)
+        )
+        with _after_grace(settings):
+            reports = collect_orphaned_uploads()
+
+        assert reports[f"{ARTWORK_BUCKET}/artworks/"].deleted == 1
+        assert _keys(s3, ARTWORK_BUCKET) == set()
+
+    def test_prunes_stale_multipart_completion_records(self, s3, settings, objects):
+        kept, _ = objects
+        stale = CompletedMultipartUpload.objects.create(key=f"{kept}.stale", size=1)
+        recent = CompletedMultipartUpload.objects.create(key=f"{kept}.recent", size=1)
+        CompletedMultipartUpload.objects.filter(pk=stale.pk).update(
+            created_at=timezone.now() - timedelta(seconds=settings.AWS_S3_ORPHAN_GRACE_SECONDS + 60)
+        )
+
+        call_command("gc_orphaned_uploads", "--dry-run")
+        assert CompletedMultipartUpload.objects.count() == 2
+
+        collect_orphaned_uploads()
+        assert list(CompletedMultipartUpload.objects.all()) == [recent]
+
+    def test_grace_period_protects_recent_uploads(self, s3, objects):
+        reports = collect_orphaned_uploads()
+
+        assert all(report.orphaned == 0 for report in reports.values())
+        assert len(_keys(s3, ARTWORK_BUCKET)) == 6
+
+    def test_dry_run_command_reports_without_deleting(self, s3, settings, objects, capsys):
+        with _after_grace(settings):
+            call_command("gc_orphaned_uploads", "--dry-run")
+
+        out = capsys.readouterr().out
+        assert f"{ARTWORK_BUCKET}/artworks/: scanned 6, would delete 5 orphans" in out
+        assert "orphan0.jpg" in out
+        assert len(_keys(s3, ARTWORK_BUCKET)) == 6
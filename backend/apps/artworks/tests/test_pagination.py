@@ -0,0 +1,53 @@
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.artworks.models import Artwork
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestArtworkCursorPagination:
+    def _walk(self, client, url, link="next"):
+        ids = []
+        while url:
+            response = client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            assert "count" not in response.data
+            ids.extend(item["id"] for item in response.data["results"])
+            url = response.data[link]
+        return ids
+
+    def test_pages_follow_created_at_id_order(self, authenticated_client, artist, artwork_factory):
+        """(created_at, id) 순서로 중복/누락 없이 전체 순회"""
+        artworks = [artwork_factory(artist, title=f"artwork {i}") for i in range(7)]
+        # created_at 동률이어도 id로 순서가 고정되어야 함
+        Artwork.objects.update(created_at=timezone.now())
+
+        url = reverse("artworks-list") + "?page_size=3"
+        ids = self._walk(authenticated_client, url)
+
+        assert ids == sorted((a.id for a in artworks), reverse=True)
+
+    def test_previous_cursor_returns_prior_page(
+        self, authenticated_client, artist, artwork_factory
+    ):
+        """이전 커서로 돌아가면 직전 페이지와 동일"""
+        for i in range(5):
+            artwork_factory(artist, title=f"artwork {i}")
+
+        url = reverse("artworks-list") + "?page_size=2"
+        first = authenticated_client.get(url).data
+        assert first["previous"] is None
+
+        second = authenticated_client.get(first["next"]).data
+        back = authenticated_client.get(second["previous"]).data
+
+        assert [a["id"] for a in back["results"]] == [a["id"] for a in first["results"]]
+        assert back["previous"] is None
+
+    def test_invalid_cursor(self, authenticated_client):
+        url = reverse("artworks-list") + "?cursor=not-a-cursor"
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,65 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from apps.artists.models import Artist
+
+User = get_user_model()
+
+
+def _make_artists(n, start=0):
+    artists = []
+    for i in range(start, start + n):
+        user = User.objects.create_user(
+            email=f"artist{i}@example.com",
+            username=f"artist{i}",
+            password="pass1234",
+            user_type="ARTIST",
+        )
+        artist = Artist.objects.language("ko").create(user=user, artist_name=f"작가 {i}")
+        artist.set_current_language("en")
+        artist.artist_name = f"artist {i}"
+        artist.save()
+        artists.append(artist)
+    return artists
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestTranslationQueryCount:
+    def _count_queries(self, client, url):
+        # parler 번역 캐시를 비워 DB 조회 횟수만 비교
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        return len(ctx.captured_queries), response
+
+    def test_artwork_list_query_count_is_constant(self, authenticated_client, artwork_factory):
+        for i, artist in enumerate(_make_artists(10)):
+            artwork_factory(artist, title=f"작품 {i}")
+
+        small, _ = self._count_queries(
+            authenticated_client, reverse("artworks-list") + "?page_size=2"
+        )
+        large, response = self._count_queries(
+            authenticated_client, reverse("artworks-list") + "?page_size=10"
+        )
+
+        assert len(response.data["results"]) == 10
+        assert all(item["title"] and item["artist_name"] for item in response.data["results"])
+        assert small == large
+
+    def test_artist_list_query_count_is_constant(self, authenticated_client):
+        _make_artists(2)
+        small, _ = self._count_queries(authenticated_client, reverse("artists-list"))
+
+        _make_artists(8, start=2)
+        large, response = self._count_queries(authenticated_client, reverse("artists-list"))
+
+        assert len(response.data["results"]) == 10
+        assert small == large
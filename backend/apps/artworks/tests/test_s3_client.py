@@ -0,0 +1,56 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from apps.utils import s3_client
+from apps.utils.mixin import PresignedUploadMixin
+from apps.utils.s3_presigner import create_presigned_url
+
+
+@pytest.fixture(autouse=True)
+def fresh_clients(settings):
+    # 실행 환경의 AWS 설정과 무관하게 동작하도록 고정 (서명에는 자격증명이 필요)
+    settings.AWS_REGION = "ap-northeast-2"
+    settings.AWS_ENDPOINT = ""
+    settings.AWS_ACCESS_KEY_ID = "testing"
+    settings.AWS_SECRET_ACCESS_KEY = "testing"
+    s3_client.reset_s3_clients()
+    yield
+    s3_client.reset_s3_clients()
+
+
+@pytest.mark.unit
+class TestSharedS3Client:
+    def test_presign_batch_builds_one_client(self):
+        mixin = PresignedUploadMixin()
+        with patch.object(s3_client, "_create_client", wraps=s3_client._create_client) as create:
+            for i in range(10):
+                mixin._get_presigned_url(bucket="b", key=f"k{i}", content_type="image/jpeg")
+            create_presigned_url("b", "profile", "image/png")
+
+        assert create.call_count == 1
+
+    def test_cached_per_config(self, settings):
+        default = s3_client.get_s3_client()
+        assert s3_client.get_s3_client() is default
+        assert s3_client.get_s3_client(region="us-east-1") is not default
+        assert s3_client.get_s3_client(region="ap-northeast-2") is default
+
+        settings.AWS_S3_MAX_POOL_CONNECTIONS = 5
+        resized = s3_client.get_s3_client()
+        assert resized is not default
+        assert resized.meta.config.max_pool_connections == 5
+
+    def test_threads_share_one_client(self):
+        clients = []
+        threads = [
+            threading.Thread(target=lambda: clients.append(s3_client.get_s3_client()))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(c) for c in clients}) == 1
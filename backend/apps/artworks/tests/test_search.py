@@ -0,0 +1,57 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+
+
+@pytest.fixture(autouse=True)
+def clear_redis():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _search(client, q):
+    response = client.get(reverse("artworks-search"), {"q": q})
+    assert response.status_code == status.HTTP_200_OK
+    return [item["id"] for item in response.data["results"]]
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestArtworkSearch:
+    def test_matches_translated_title(self, authenticated_client, artist, artwork_factory):
+        artwork = artwork_factory(artist, title="푸른 바다의 기억")
+        artwork.set_current_language("en")
+        artwork.title = "Memory of the Blue Sea"
+        artwork.save()
+        artwork_factory(artist, title="붉은 산")
+
+        assert _search(authenticated_client, "memory") == [artwork.id]
+        # 복합어 내부 부분 일치(한국어)는 trigram으로 처리
+        assert _search(authenticated_client, "바다") == [artwork.id]
+
+    def test_matches_materials_and_artist_name(self, authenticated_client, artist, artwork_factory):
+        bronze = artwork_factory(artist, title="무제", materials="브론즈 주조")
+
+        assert _search(authenticated_client, "브론즈") == [bronze.id]
+        assert _search(authenticated_client, "test artist") == [bronze.id]
+
+    def test_title_match_ranks_above_description_match(
+        self, authenticated_client, artist, artwork_factory
+    ):
+        in_description = artwork_factory(artist, title="정물", description="landscape study")
+        in_title = artwork_factory(artist, title="landscape")
+
+        assert _search(authenticated_client, "landscape") == [in_title.id, in_description.id]
+
+    def test_artist_rename_reindexes_artworks(self, authenticated_client, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        artist.artist_name = "김새봄"
+        artist.save()
+
+        assert _search(authenticated_client, "새봄") == [artwork.id]
+
+    def test_query_is_required(self, authenticated_client):
+        response = authenticated_client.get(reverse("artworks-search"))
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
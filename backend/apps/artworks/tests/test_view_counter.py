@@ -0,0 +1,125 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+from rest_framework import status
+
+from apps.artworks import view_counter
+from apps.artworks.view_counter import (
+    FLUSH_BATCH_KEY,
+    FLUSH_LOCK_KEY,
+    FLUSHING_KEY,
+    flush_view_counts,
+    get_viewer_key,
+    record_view,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_redis():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestViewCounter:
+    def test_repeat_views_are_deduplicated(self, artist, artwork_factory):
+        """같은 뷰어의 재조회는 윈도우 내에서 한 번만 집계"""
+        artwork = artwork_factory(artist)
+
+        assert record_view(artwork.id, "u:1") is True
+        assert record_view(artwork.id, "u:1") is False
+        assert record_view(artwork.id, "ip:10.0.0.1") is True
+
+        flush_view_counts()
+
+        artwork.refresh_from_db()
+        assert artwork.view_count == 2
+
+    def test_flush_applies_increments_and_clears_buffer(self, artist, artwork_factory):
+        first = artwork_factory(artist, title="first")
+        second = artwork_factory(artist, title="second")
+        for viewer in ("u:1", "u:2", "u:3"):
+            record_view(first.id, viewer)
+        record_view(second.id, "u:1")
+
+        assert flush_view_counts() == 2
+        assert flush_view_counts() == 0
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert first.view_count == 3
+        assert second.view_count == 1
+
+    def test_detail_request_does_not_write_to_db(
+        self, authenticated_client, artist, artwork_factory
+    ):
+        """상세 조회는 DB에 쓰지 않고 Redis에만 기록"""
+        artwork = artwork_factory(artist)
+        url = reverse("artworks-detail", kwargs={"pk": artwork.id})
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not any(q["sql"].lstrip().upper().startswith("UPDATE") for q in ctx.captured_queries)
+
+        flush_view_counts()
+        artwork.refresh_from_db()
+        assert artwork.view_count == 1
+
+    def test_retry_after_crash_before_clearing_buffer_is_not_double_counted(
+        self, artist, artwork_factory
+    ):
+        artwork = artwork_factory(artist)
+        record_view(artwork.id, "u:1")
+        delete_if_owned = view_counter._delete_if_owned
+
+        def crash_on_batch(conn, key, *args):
+            if key == FLUSH_BATCH_KEY:
+                raise RedisError("connection lost")
+            delete_if_owned(conn, key, *args)
+
+        # 커밋 직후 Redis 정리 전에 실패
+        with patch.object(view_counter, "_delete_if_owned", side_effect=crash_on_batch):
+            with pytest.raises(RedisError):
+                flush_view_counts()
+        artwork.refresh_from_db()
+        assert artwork.view_count == 1
+
+        assert flush_view_counts() == 0
+        artwork.refresh_from_db()
+        assert artwork.view_count == 1
+        assert not get_redis_connection("default").exists(FLUSHING_KEY, FLUSH_BATCH_KEY)
+
+    def test_flush_skips_while_another_run_holds_the_lock(self, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        record_view(artwork.id, "u:1")
+        conn = get_redis_connection("default")
+        conn.set(FLUSH_LOCK_KEY, "other-run", ex=60)
+
+        assert flush_view_counts() == 0
+        assert conn.get(FLUSH_LOCK_KEY) == b"other-run"
+        conn.delete(FLUSH_LOCK_KEY)
+        assert flush_view_counts() == 1
+
+        artwork.refresh_from_db()
+        assert artwork.view_count == 1
+
+    def test_forwarded_for_is_ignored_without_trusted_proxy(self, settings):
+        request = RequestFactory().get(
+            "/", HTTP_X_FORWARDED_FOR="1.1.1.1, 10.0.0.5", REMOTE_ADDR="10.0.0.9"
+        )
+        settings.ARTWORK_VIEW_TRUSTED_PROXIES = 0
+        assert get_viewer_key(request) == "ip:10.0.0.9"
+        # 신뢰 프록시가 붙인 마지막 항목만 사용 (클라이언트가 앞에 넣은 값은 무시)
+        settings.ARTWORK_VIEW_TRUSTED_PROXIES = 1
+        assert get_viewer_key(request) == "ip:10.0.0.5"
@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.utils import timezone
+
+from apps.utils.image_sniff import image_rejection_reason, probe_objects
+
+from .models import CompletedMultipartUpload
+
+
+def validate_uploaded_objects(s3, bucket: str, keys) -> tuple[dict[str, int], dict[str, str]]:
+    """Probe uploaded objects and apply the checks every new ArtworkImage must pass.
+
+    Shared by `confirm_batch` and S3 event ingestion so neither path can
+    register an object the other would reject: the object must exist, stay
+    within AWS_S3_MAX_FILE_SIZE unless it is a completed multipart original of
+    the same size, and its sniffed header must match the key's extension and
+    the pixel limit. S3 round trips run concurrently; call it outside
+    transactions.
+
+    Returns:
+        tuple: ({key: file size} accepted, {key: reason} rejected)
+    """
+    keys = list(keys)
+    probes = probe_objects(s3, bucket, keys)
+    # 멀티파트 complete 에서 크기가 검증된 원본은 단일 업로드 크기 제한 생략 (대용량)
+    completed_sizes = dict(
+        CompletedMultipartUpload.objects.filter(key__in=keys).values_list("key", "size")
+    )
+
+    accepted, rejected = {}, {}
+    for key in keys:
+        probe = probes[key]
+        if isinstance(probe, ClientError):
+            rejected[key] = f"not_found: {str(probe)}"
+            continue
+
+        # complete 이후 같은 키가 덮어써졌다면 기록을 신뢰하지 않음
+        verified = completed_sizes.get(key) == probe.size
+        if not verified and probe.size > settings.AWS_S3_MAX_FILE_SIZE:
+            rejected[key] = "file_too_large"
+            continue
+
+        # 클라이언트가 선언한 content_type 대신 실제 헤더로 포맷 검증
+        reason = image_rejection_reason(key, probe.image)
+        if reason:
+            rejected[key] = reason
+            continue
+        accepted[key] = probe.size
+    return accepted, rejected
+
+
+def forget_completed_uploads(keys) -> None:
+    """Drop multipart completion records once their ArtworkImage rows exist."""
+    CompletedMultipartUpload.objects.filter(key__in=list(keys)).delete()
+
+
+def prune_completed_uploads(older_than_seconds: int) -> int:
+    """Drop multipart completion records that were never confirmed.
+
+    Past the orphan grace period their objects are reclaimed by the orphan GC,
+    so the records can no longer be used.
+
+    Returns:
+        int: number of records deleted
+    """
+    cutoff = timezone.now() - timedelta(seconds=older_than_seconds)
+    deleted, _ = CompletedMultipartUpload.objects.filter(created_at__lt=cutoff).delete()
+    return deleted
@@ -1,11 +1,12 @@
 from rest_framework.routers import DefaultRouter
 
-from .views import PublicArtworkViewset
+from .views import AdminArtworkViewSet, MyArtworkViewSet, PublicArtworkViewset
 
 router = DefaultRouter()
+# 빈 prefix의 상세 라우트({pk}/)보다 먼저 매칭되도록 고정 prefix를 먼저 등록
+router.register(r"my-artworks", MyArtworkViewSet, basename="my-artwork")
+router.register(r"admin", AdminArtworkViewSet, basename="admin-artwork")
 router.register(r"", PublicArtworkViewset, basename="artworks")
-# router.register(r'my-artworks', MyArtworkViewSet, basename='my-artwork')
-# router.register(r'admin', AdminArtworkViewSet, basename='admin-artwork')
 urlpatterns = []
 
 urlpatterns += router.urls
@@ -0,0 +1,154 @@
+import logging
+import uuid
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError, WatchError
+
+from .models import Artwork, ViewCountFlush
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "artwork_views:pending"
+FLUSHING_KEY = "artwork_views:flushing"
+FLUSH_BATCH_KEY = "artwork_views:flushing_batch"
+FLUSH_LOCK_KEY = "artwork_views:flush_lock"
+# 적용 기록 보관 기간 (flush 락 TTL 보다 충분히 길게)
+FLUSH_RECORD_RETENTION = timedelta(days=1)
+
+
+def _seen_key(artwork_id: int) -> str:
+    return f"artwork_views:seen:{artwork_id}"
+
+
+def get_viewer_key(request) -> str:
+    """Identify a viewer for deduplication: user id if logged in, otherwise client IP.
+
+    X-Forwarded-For is only honoured behind ARTWORK_VIEW_TRUSTED_PROXIES proxies,
+    and then only the entry added by the outermost trusted proxy is used, so a
+    client cannot rotate the header to dodge deduplication.
+    """
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return f"u:{user.pk}"
+
+    trusted = settings.ARTWORK_VIEW_TRUSTED_PROXIES
+    forwarded = request.META.get("HTTP_X_FORWARDED_FOR")
+    if trusted and forwarded:
+        addrs = [addr.strip() for addr in forwarded.split(",")]
+        return f"ip:{addrs[-min(trusted, len(addrs))]}"
+    return f"ip:{request.META.get('REMOTE_ADDR', '')}"
+
+
+def record_view(artwork_id: int, viewer_key: str) -> bool:
+    """Buffer one artwork view in Redis.
+
+    Repeat views from the same viewer within ARTWORK_VIEW_DEDUP_SECONDS are dropped
+    using a per-artwork set. Nothing is written to Postgres here; counts are applied
+    later by `flush_view_counts`.
+
+    Returns:
+        bool: True if the view was counted
+    """
+    conn = get_redis_connection("default")
+    seen_key = _seen_key(artwork_id)
+
+    try:
+        pipe = conn.pipeline()
+        pipe.sadd(seen_key, viewer_key)
+        # 첫 조회 시점부터 윈도우 시작, 이후 조회로 연장하지 않음
+        pipe.expire(seen_key, settings.ARTWORK_VIEW_DEDUP_SECONDS, nx=True)
+        added, _ = pipe.execute()
+
+        if not added:
+            return False
+
+        conn.hincrby(PENDING_KEY, str(artwork_id), 1)
+        return True
+    except RedisError as e:
+        logger.warning(f"Failed to record view for artwork {artwork_id}: {e}")
+        return False
+
+
+def _delete_if_owned(conn, key: str, token: str, *also: str) -> None:
+    # key 값이 token 일 때만 key 와 함께 지움 (다른 실행이 새로 쓴 값은 보존)
+    with conn.pipeline() as pipe:
+        try:
+            pipe.watch(key)
+            if pipe.get(key) == token.encode():
+                pipe.multi()
+                pipe.delete(key, *also)
+                pipe.execute()
+        except WatchError:
+            pass
+
+
+def _release_lock(conn, key: str, token: str) -> None:
+    # TTL 만료 후 다른 실행이 잡은 락은 지우지 않음
+    _delete_if_owned(conn, key, token)
+
+
+def flush_view_counts() -> int:
+    """Apply buffered view counts to `Artwork.view_count`.
+
+    The pending hash is renamed before reading so views recorded during the flush
+    land in a fresh hash. Artworks are grouped by increment so each batch is a single
+    `UPDATE ... SET view_count = view_count + n WHERE id IN (...)`.
+    A hash left over from a failed flush is retried on the next run.
+
+    Each renamed hash gets a batch id that is recorded in ViewCountFlush in the
+    same transaction as the UPDATEs, so a batch is applied at most once: a
+    retry after a crash between commit and clearing the hash, or a run that
+    overlaps after the Redis lock expired, finds the record and only clears
+    the hash.
+
+    Returns:
+        int: number of artworks updated
+    """
+    conn = get_redis_connection("default")
+    token = uuid.uuid4().hex
+    if not conn.set(FLUSH_LOCK_KEY, token, nx=True, ex=settings.ARTWORK_VIEW_FLUSH_LOCK_SECONDS):
+        logger.info("View count flush already running, skipping")
+        return 0
+
+    try:
+        if not conn.exists(FLUSHING_KEY):
+            if not conn.exists(PENDING_KEY):
+                return 0
+            conn.rename(PENDING_KEY, FLUSHING_KEY)
+        # 남아 있던 배치를 재시도할 때는 기존 배치 ID 유지
+        conn.set(FLUSH_BATCH_KEY, uuid.uuid4().hex, nx=True)
+        batch_id = conn.get(FLUSH_BATCH_KEY).decode()
+
+        pending = conn.hgetall(FLUSHING_KEY)
+
+        by_increment = defaultdict(list)
+        for artwork_id, count in pending.items():
+            by_increment[int(count)].append(int(artwork_id))
+
+        updated = 0
+        with transaction.atomic():
+            # 동시에 같은 배치를 적용하려는 실행은 유니크 제약에서 대기 후 기존 기록을 받음
+            _, created = ViewCountFlush.objects.get_or_create(batch_id=batch_id)
+            if created:
+                for increment, artwork_ids in by_increment.items():
+                    updated += Artwork.objects.filter(id__in=artwork_ids).update(
+                        view_count=F("view_count") + increment
+                    )
+                ViewCountFlush.objects.filter(
+                    created_at__lt=timezone.now() - FLUSH_RECORD_RETENTION
+                ).delete()
+            else:
+                logger.info(f"View count batch {batch_id} already applied")
+
+        # 겹친 실행이 이미 정리하고 새 배치를 시작했다면 그 배치는 건드리지 않음
+        _delete_if_owned(conn, FLUSH_BATCH_KEY, batch_id, FLUSHING_KEY)
+    finally:
+        _release_lock(conn, FLUSH_LOCK_KEY, token)
+    logger.info(f"Flushed view counts for {updated} artworks")
+    return updated
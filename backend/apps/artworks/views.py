@@ -1,39 +1,78 @@
 import logging
+import math
 
 from botocore.exceptions import ClientError
 from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from django_filters import rest_framework as filters
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import APIException, ValidationError
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 
 from apps.artists.models import Artist
-from apps.artworks.models import Artwork, ArtworkImage
+from apps.artworks.models import Artwork, ArtworkImage, CompletedMultipartUpload
+from apps.interactions.services import like_artwork, unlike_artwork
+from apps.utils.bulk import UPDATED
 from apps.utils.mixin import PresignedUploadMixin
 from apps.utils.permissions import IsSelf
-from apps.utils.serializers import ArtworkImageBatchSerializer, ConfirmBatchIn
+from apps.utils.s3_multipart import (
+    MAX_PART_NUMBER,
+    MIN_PART_SIZE,
+    abort_multipart_upload,
+    complete_multipart_upload,
+    create_multipart_upload,
+    list_uploaded_parts,
+    presign_upload_parts,
+)
+from apps.utils.serializers import (
+    ArtworkImageBatchSerializer,
+    BulkIdsSerializer,
+    ConfirmBatchIn,
+    ModerationClaimSerializer,
+    MultipartCompleteIn,
+    MultipartCreateIn,
+    MultipartPartsIn,
+    MultipartUploadIn,
+)
+from apps.utils.translations import prefetch_translations
 
 # TODO: 상대 경로 수정 필요 컨테이너 환경 유의
+from .artist_counts import track_artist_artwork_counts
+from .cache import detail_cache_key, invalidate_artworks, list_cache_key
+from .duplicates import duplicates_by_artwork, find_near_duplicates
+from .facets import facet_counts
 from .filters import ArtworkFilter
+from .moderation import (
+    APPROVE,
+    FEATURE,
+    REJECT,
+    UNFEATURE,
+    claim_artworks,
+    moderate_artworks,
+    release_artworks,
+)
+from .pagination import ArtworkCursorPagination, ArtworkPagination
+from .search import search_artworks
 from .serializers import (
     ArtworkAdminSerializer,
+    ArtworkBulkModerationSerializer,
     ArtworkDetailSerializer,
     ArtworkListSerializer,
+    ImageDuplicateQuerySerializer,
     MyArtworkSerializer,
 )
+from .tasks import generate_artwork_image_derivatives
+from .uploads import forget_completed_uploads, validate_uploaded_objects
+from .view_counter import get_viewer_key, record_view
 
 logger = logging.getLogger(__name__)
 
 
-class ArtworkPagination(PageNumberPagination):
-    page_size = 20
-    page_size_query_param = "page_size"
-    max_page_size = 100
-
-
 class PublicArtworkViewset(viewsets.ReadOnlyModelViewSet):
     serializer_class = ArtworkListSerializer
     permission_classes = [permissions.AllowAny]
@@ -41,7 +80,8 @@ class PublicArtworkViewset(viewsets.ReadOnlyModelViewSet):
     # TODO: 여러 필터 적용 기능 추가 필요
     filter_backends = [filters.DjangoFilterBackend]
     filterset_class = ArtworkFilter
-    pagination_class = ArtworkPagination
+    # 무한 스크롤 피드: COUNT/OFFSET 없는 (created_at, id) keyset 페이지네이션
+    pagination_class = ArtworkCursorPagination
 
     def get_queryset(self):
         qs = (
@@ -50,7 +90,9 @@ class PublicArtworkViewset(viewsets.ReadOnlyModelViewSet):
             .select_related("artist", "artist__user")
             .prefetch_related("images")
         )
-        qs = qs.filter(approval_status=Artwork.ApprovalStatus.APPROVED)
+        # 목록은 현재 언어 + fallback 번역만, 상세는 전체 번역(TranslatedFieldsField) 필요
+        qs = prefetch_translations(qs, "artist", all_languages=self.action == "retrieve")
+        qs = qs.filter(approval_status=Artwork.ApprovalStatus.APPROVED, is_deleted=False)
 
         user = self.request.user
         if user.is_authenticated:
@@ -59,13 +101,83 @@ class PublicArtworkViewset(viewsets.ReadOnlyModelViewSet):
             qs = qs.filter(display_status=Artwork.DisplayStatus.PUBLIC, is_featured=True)
         return qs
 
-    # TODO: 조회수 증가 로직 추가 필요
-    # @action(detail=True, methods=['post'])
-    # def increment_view(self, request, pk=None):
-    #     """조회수 증가 API"""
-    #     artwork = self.get_object()
-    #     artwork.increment_view_count()
-    #     return Response({'view_count': artwork.view_count})
+    def list(self, request, *args, **kwargs):
+        key = list_cache_key(request)
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, timeout=settings.ARTWORK_RESPONSE_CACHE_SECONDS)
+        return Response(data)
+
+    def retrieve(self, request, *args, **kwargs):
+        key = detail_cache_key(request, kwargs[self.lookup_field])
+        data = cache.get(key)
+        if data is None:
+            data = super().retrieve(request, *args, **kwargs).data
+            cache.set(key, data, timeout=settings.ARTWORK_RESPONSE_CACHE_SECONDS)
+        # 조회수는 Redis에 버퍼링 후 주기적으로 flush (상세 조회 시 DB 쓰기 없음)
+        record_view(data["id"], get_viewer_key(request))
+        return Response(data)
+
+    @action(detail=False, methods=["get"], url_path="search", url_name="search")
+    def search(self, request) -> Response:
+        """
+        Full-text search over translated titles/descriptions, materials and artist names.
+        Results are ranked, so page numbers are used instead of the feed cursor.
+        """
+        q = request.query_params.get("q", "").strip()
+        if not q:
+            raise ValidationError({"q": "검색어를 입력해주세요."})
+        if len(q) > 100:
+            raise ValidationError({"q": "검색어는 100자 이하로 입력해주세요."})
+
+        key = list_cache_key(request)
+        data = cache.get(key)
+        if data is None:
+            qs = search_artworks(self.filter_queryset(self.get_queryset()), q)
+            paginator = ArtworkPagination()
+            page = paginator.paginate_queryset(qs, request, view=self)
+            serializer = ArtworkListSerializer(
+                page, many=True, context=self.get_serializer_context()
+            )
+            data = paginator.get_paginated_response(serializer.data).data
+            cache.set(key, data, timeout=settings.ARTWORK_RESPONSE_CACHE_SECONDS)
+        return Response(data)
+
+    @action(detail=False, methods=["get"], url_path="facets", url_name="facets")
+    def facets(self, request) -> Response:
+        """
+        Facet counts (category, sale_status, year_created) for the current filter selection.
+        """
+        key = list_cache_key(request)
+        data = cache.get(key)
+        if data is None:
+            data = facet_counts(self.filter_queryset(self.get_queryset()))
+            cache.set(key, data, timeout=settings.ARTWORK_RESPONSE_CACHE_SECONDS)
+        return Response(data)
+
+    @action(
+        detail=True,
+        methods=["post", "delete"],
+        url_path="like",
+        url_name="like",
+        permission_classes=[IsAuthenticated],
+    )
+    def like(self, request, pk=None) -> Response:
+        """
+        Like (POST) or unlike (DELETE) an artwork.
+        A like is stored as a Wishlist row, so both share the same counter.
+        """
+        artwork = self.get_object()
+        if request.method == "POST":
+            like_artwork(request.user, artwork)
+            liked = True
+        else:
+            unlike_artwork(request.user, artwork)
+            liked = False
+
+        like_count = Artwork.objects.values_list("like_count", flat=True).get(pk=artwork.pk)
+        return Response({"liked": liked, "like_count": like_count}, status=status.HTTP_200_OK)
 
     def get_serializer_class(self):
         if getattr(self, "action", None) == "list":
@@ -83,14 +195,47 @@ class MyArtworkViewSet(PresignedUploadMixin, viewsets.ModelViewSet):
 
     def get_queryset(self):
         artist = self.get_artist_for_me(self.request.user)
-        return Artwork.objects.filter(artist=artist)
+        return Artwork.objects.filter(artist=artist, is_deleted=False)
 
     def perform_create(self, serializer):
         serializer.save(artist=self.get_artist_for_me(self.request.user))
 
+    def perform_update(self, serializer):
+        # 공개 여부 변경 시 작가 작품 수 반영
+        with transaction.atomic(), track_artist_artwork_counts([serializer.instance.id]):
+            artwork = serializer.save()
+        invalidate_artworks([artwork.id])
+
+    def perform_destroy(self, instance):
+        # 작가 삭제는 soft delete (문의/좋아요 이력 보존), 영구 삭제는 관리자 전용
+        with transaction.atomic(), track_artist_artwork_counts([instance.id]):
+            instance.is_deleted = True
+            instance.deleted_at = timezone.now()
+            instance.save(update_fields=["is_deleted", "deleted_at", "updated_at"])
+        invalidate_artworks([instance.id])
+
     def get_artist_for_me(self, user):
         return Artist.objects.get(user=user)
 
+    def _image_key_prefix(self, artwork) -> str:
+        return f"artworks/{artwork.artist.user.id}/images/{artwork.id}/"
+
+    def _get_artwork_bucket(self) -> str:
+        bucket = getattr(settings, "AWS_S3_ARTWORK_BUCKET", None)
+        if not bucket:
+            raise APIException("AWS_S3_ARTWORK_BUCKET not configured")
+        return bucket
+
+    def _validated_upload(self, serializer_class, data) -> tuple[Artwork, str, dict]:
+        """Validate a multipart request body against the artwork's key prefix."""
+        artwork = self.get_object()
+        serializer = serializer_class(data=data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data
+        if not upload["key"].startswith(self._image_key_prefix(artwork)):
+            raise ValidationError({"key": "invalid_prefix"})
+        return artwork, self._get_artwork_bucket(), upload
+
     @action(
         detail=True,
         methods=["post"],
@@ -100,6 +245,10 @@ class MyArtworkViewSet(PresignedUploadMixin, viewsets.ModelViewSet):
     def presigned_batch(self, request, pk=None) -> Response:
         """
         Generate presigned URLs for multiple images.
+        - upload_method "put": presigned PUT URL + headers
+        - upload_method "post": presigned POST policy (url + form fields); S3 also
+          enforces size/Content-Type at upload, but confirm_batch still verifies
+          existence, size and the real format of every key
         """
         artwork = self.get_object()
         if artwork.artist.user != request.user:
@@ -119,40 +268,46 @@ class MyArtworkViewSet(PresignedUploadMixin, viewsets.ModelViewSet):
             )
 
         items = []
+        upload_method = serializer.validated_data["upload_method"]
 
         for f in serializer.validated_data["files"]:
             original_ext = f["ext"]
+            # confirm_batch가 검증하는 prefix와 동일: artworks/{user_id}/images/{artwork_id}/
             key = self._build_s3_key(
                 category="artworks",
-                object_id=artwork.id,
+                object_id=artwork.artist.user.id,
                 ext=original_ext,
-                subdir="images",
+                subdir=f"images/{artwork.id}",
             )
+            if upload_method == "post":
+                post = self._get_presigned_post(
+                    bucket=bucket, key=key, content_type=f["content_type"]
+                )
+                items.append(
+                    {"method": "POST", "url": post["url"], "key": key, "fields": post["fields"]}
+                )
+                continue
+
             url, k = self._get_presigned_url(
                 bucket=bucket,
                 key=key,
                 content_type=f["content_type"],
             )
-            items.append(
-                {
-                    "url": url,
-                    "key": k,
-                    "headers": {
-                        "Content-Type": f["content_type"],
-                        "Content-Length": str(f["size"]),
-                    },
-                }
-            )
+            headers = {"Content-Type": f["content_type"]}
+            if "size" in f:
+                headers["Content-Length"] = str(f["size"])
+            items.append({"method": "PUT", "url": url, "key": k, "headers": headers})
 
         return Response({"items": items}, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=["post"], url_path="images/batch", url_name="images-batch")
-    @transaction.atomic
     def confirm_batch(self, request, pk=None) -> Response:
         """
         Confirm multiple images.
-        - Check for existence with HeadObject for each key
-        - create ArtworkImage only for passed items
+        - Probe all keys concurrently with ranged GETs (outside the transaction):
+          size, plus the real format/dimensions sniffed from the first few KB
+        - create ArtworkImage only for passed items with one bulk_create
+          (rows already ingested from S3 events are finalized instead)
         - Specify cover if necessary
         """
         artwork = self.get_object()
@@ -173,50 +328,180 @@ class MyArtworkViewSet(PresignedUploadMixin, viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-        created, failed = [], []
-        s3 = self._get_s3_client()
-
+        failed, candidates = [], []
+        expected_prefix = self._image_key_prefix(artwork)
         for item in data["items"]:
-            key = item["key"]
-            expected_prefix = f"artworks/{artwork.artist.user.id}/images/{artwork.id}/"
-
-            if not key.startswith(expected_prefix):
-                failed.append({"key": key, "reason": "invalid_prefix"})
+            if not item["key"].startswith(expected_prefix):
+                failed.append({"key": item["key"], "reason": "invalid_prefix"})
                 continue
+            candidates.append(item)
 
-            try:
-                response = s3.head_object(Bucket=bucket, Key=key)
-                file_size = response.get("ContentLength", 0)
-
-                # 크기 제한 검증
-                if file_size > settings.AWS_S3_MAX_FILE_SIZE:
-                    failed.append({"key": key, "reason": "file_too_large"})
-                    continue
-
-            except ClientError as e:
-                failed.append({"key": key, "reason": f"not_found: {str(e)}"})
+        # S3 왕복은 트랜잭션 밖에서 병렬로 처리 (DB 커넥션/락을 잡은 채 대기하지 않음)
+        accepted, rejected = validate_uploaded_objects(
+            self._get_s3_client(), bucket, [item["key"] for item in candidates]
+        )
+        failed += [{"key": key, "reason": reason} for key, reason in rejected.items()]
+        # 대체 텍스트를 보내지 않은 항목은 기존 값을 덮어쓰지 않도록 따로 upsert
+        with_alt, without_alt = [], []
+        for item in candidates:
+            if item["key"] not in accepted:
                 continue
-
-            img = ArtworkImage.objects.create(
+            image = ArtworkImage(
                 artwork=artwork,
-                key=key,
+                key=item["key"],
                 alt_text=item.get("alt_text", ""),
-                order=item.get("order", 0),
+                order=item["order"],
             )
-
-            created.append({"key": key, "id": img.id, "file_size": file_size})
+            (with_alt if "alt_text" in item else without_alt).append(image)
 
         cover = data.get("set_cover")
-        if cover and any(c["key"] == cover for c in created):
-            try:
-                cov = ArtworkImage.objects.get(artwork=artwork, key=cover)
-                artwork.cover_image = cov
+        with transaction.atomic():
+            # S3 이벤트 수집으로 이미 생성된 행은 클라이언트 메타데이터로 확정
+            images = []
+            for batch, update_fields in (
+                (with_alt, ["alt_text", "order"]),
+                (without_alt, ["order"]),
+            ):
+                if batch:
+                    images += ArtworkImage.objects.bulk_create(
+                        batch,
+                        update_conflicts=True,
+                        unique_fields=["key"],
+                        update_fields=update_fields,
+                    )
+            # 확인이 끝난 키만 완료 기록 정리 (실패한 키는 재시도 시 다시 사용)
+            forget_completed_uploads(img.key for img in images)
+            cover_image = next((img for img in images if img.key == cover), None)
+            if cover_image is not None:
+                artwork.cover_image = cover_image
                 artwork.save(update_fields=["cover_image"])
-            except ArtworkImage.DoesNotExist:
-                logger.warning(f"Cover image not found: {cover}")
+
+        created = [{"key": img.key, "id": img.id, "file_size": accepted[img.key]} for img in images]
+        if created:
+            invalidate_artworks([artwork.id])
+            # 썸네일/반응형 파생 이미지는 커밋 후 Celery에서 생성
+            image_ids = [img.id for img in images]
+            transaction.on_commit(lambda: generate_artwork_image_derivatives.delay(image_ids))
 
         return Response({"created": created, "failed": failed}, status=status.HTTP_200_OK)
 
+    @action(detail=True, methods=["post"], url_path="images/multipart", url_name="images-multipart")
+    def create_multipart(self, request, pk=None) -> Response:
+        """
+        Start a multipart upload for a large original image.
+
+        request data: {"filename": "scan.tif.jpg", "content_type": "image/jpeg", "size": 104857600}
+        response: {"key", "upload_id", "part_size", "part_count"}
+        Upload flow: parts (presign) -> PUT parts in parallel -> complete -> images/batch
+        """
+        artwork = self.get_object()
+        serializer = MultipartCreateIn(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        bucket = self._get_artwork_bucket()
+
+        key = self._build_s3_key(
+            category="artworks",
+            object_id=artwork.artist.user.id,
+            ext=data["ext"],
+            subdir=f"images/{artwork.id}",
+        )
+        try:
+            upload_id = create_multipart_upload(bucket, key, data["content_type"])
+        except ClientError as e:
+            logger.error(f"Failed to create multipart upload for artwork {artwork.id}: {e}")
+            return Response(
+                {"error": "S3 service error"}, status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        # 파트 수가 S3 한도(10000)를 넘지 않도록 파트 크기 조정
+        part_size = max(
+            settings.AWS_S3_MULTIPART_PART_SIZE,
+            MIN_PART_SIZE,
+            math.ceil(data["size"] / MAX_PART_NUMBER),
+        )
+        return Response(
+            {
+                "key": key,
+                "upload_id": upload_id,
+                "part_size": part_size,
+                "part_count": math.ceil(data["size"] / part_size),
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+    @action(
+        detail=True,
+        methods=["get", "post"],
+        url_path="images/multipart/parts",
+        url_name="images-multipart-parts",
+    )
+    def multipart_parts(self, request, pk=None) -> Response:
+        """
+        GET: parts already stored by S3 (resume after a partial failure)
+            query params: key, upload_id
+        POST: presigned UploadPart URLs for a batch of part numbers
+            request data: {"key", "upload_id", "part_numbers": [1, 2, 3]}
+        """
+        if request.method == "GET":
+            _, bucket, upload = self._validated_upload(MultipartUploadIn, request.query_params)
+            try:
+                parts = list_uploaded_parts(bucket, upload["key"], upload["upload_id"])
+            except ClientError as e:
+                raise ValidationError({"upload_id": str(e)})
+            return Response({"parts": parts})
+
+        _, bucket, upload = self._validated_upload(MultipartPartsIn, request.data)
+        parts = presign_upload_parts(
+            bucket, upload["key"], upload["upload_id"], upload["part_numbers"]
+        )
+        return Response({"parts": parts})
+
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="images/multipart/complete",
+        url_name="images-multipart-complete",
+    )
+    def complete_multipart(self, request, pk=None) -> Response:
+        """
+        Assemble the uploaded parts, then confirm the key through images/batch.
+
+        request data: {"key", "upload_id", "parts": [{"part_number": 1, "etag": "..."}]}
+        response: {"key", "file_size"}
+        """
+        _, bucket, upload = self._validated_upload(MultipartCompleteIn, request.data)
+        key = upload["key"]
+        s3 = self._get_s3_client()
+        try:
+            complete_multipart_upload(bucket, key, upload["upload_id"], upload["parts"])
+            file_size = s3.head_object(Bucket=bucket, Key=key)["ContentLength"]
+        except ClientError as e:
+            raise ValidationError({"upload_id": str(e)})
+
+        if file_size > settings.AWS_S3_MULTIPART_MAX_FILE_SIZE:
+            s3.delete_object(Bucket=bucket, Key=key)
+            raise ValidationError({"key": "file_too_large"})
+
+        # 크기 검증을 마친 원본으로 기록 (confirm_batch/S3 이벤트 수집에서 크기 제한 생략)
+        CompletedMultipartUpload.objects.update_or_create(key=key, defaults={"size": file_size})
+        return Response({"key": key, "file_size": file_size})
+
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="images/multipart/abort",
+        url_name="images-multipart-abort",
+    )
+    def abort_multipart(self, request, pk=None) -> Response:
+        """Abort a multipart upload. request data: {"key", "upload_id"}"""
+        _, bucket, upload = self._validated_upload(MultipartUploadIn, request.data)
+        try:
+            abort_multipart_upload(bucket, upload["key"], upload["upload_id"])
+        except ClientError as e:
+            raise ValidationError({"upload_id": str(e)})
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
 
 class AdminArtworkViewSet(viewsets.ModelViewSet):
     serializer_class = ArtworkAdminSerializer
@@ -229,39 +514,158 @@ class AdminArtworkViewSet(viewsets.ModelViewSet):
     filterset_class = ArtworkFilter
 
     def get_queryset(self):
-        return (
+        qs = (
             super()
             .get_queryset()
             .select_related("artist", "artist__user")
             .prefetch_related("images")
         )
+        return prefetch_translations(qs, all_languages=True)
+
+    def get_serializer(self, instance=None, *args, **kwargs):
+        # 조회 응답: 페이지의 모든 이미지 중복 후보를 한 번에 조회해 context로 전달
+        if instance is not None and "data" not in kwargs:
+            artworks = instance if kwargs.get("many") else [instance]
+            kwargs["context"] = {
+                **self.get_serializer_context(),
+                "duplicates": duplicates_by_artwork(artworks),
+            }
+        return super().get_serializer(instance, *args, **kwargs)
+
+    def perform_update(self, serializer):
+        with transaction.atomic(), track_artist_artwork_counts([serializer.instance.id]):
+            artwork = serializer.save()
+        invalidate_artworks([artwork.id])
+
+    def perform_destroy(self, instance):
+        artwork_id = instance.id
+        with transaction.atomic(), track_artist_artwork_counts([artwork_id]):
+            instance.delete()
+        invalidate_artworks([artwork_id])
 
     @action(detail=True, methods=["post"], url_path="approve", url_name="approve")
     def approve(self, request, pk=None) -> Response:
         artwork = self.get_object()
-        artwork.approval_status = Artwork.ApprovalStatus.APPROVED
-        artwork.save()
+        moderate_artworks([artwork.id], APPROVE)
         return Response({"detail": "Artwork approved successfully."})
 
     @action(detail=True, methods=["post"], url_path="reject", url_name="reject")
     def reject(self, request, pk=None) -> Response:
         artwork = self.get_object()
-        artwork.approval_status = Artwork.ApprovalStatus.REJECTED
-        artwork.save()
+        moderate_artworks([artwork.id], REJECT)
         return Response({"detail": "Artwork rejected successfully."})
 
     @action(detail=True, methods=["post"], url_path="featured", url_name="set-featured")
     def set_featured(self, request, pk=None) -> Response:
         artwork = self.get_object()
-        artwork.is_featured = True
-        artwork.save()
+        moderate_artworks([artwork.id], FEATURE)
         return Response({"detail": "Artwork set as featured successfully."})
 
     @action(detail=True, methods=["post"], url_path="unfeatured", url_name="set-unfeatured")
     def set_unfeatured(self, request, pk=None) -> Response:
         artwork = self.get_object()
-        artwork.is_featured = False
-        artwork.save()
+        moderate_artworks([artwork.id], UNFEATURE)
         return Response({"detail": "Artwork set as unfeatured successfully."})
 
-    # TODO: 강제 삭제, 일괄 승인/거부 로직 추가
+    def _bulk_moderate(self, request, action_name: str) -> Response:
+        """
+        Bulk moderation by id list or ArtworkFilter params.
+
+        request data:
+        {"ids": [1, 2, 3]} or {"filters": {"approval_status": "pending", "category": "painting"}}
+
+        response:
+        {"action": "approve", "updated": 2, "results": [{"id": 1, "status": "updated"}, ...]}
+        """
+        serializer = ArtworkBulkModerationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        ids = data.get("ids")
+        if ids is None:
+            filterset = ArtworkFilter(data=data["filters"], queryset=Artwork.objects.all())
+            if not filterset.is_valid():
+                raise ValidationError({"filters": filterset.errors})
+            limit = settings.BULK_MODERATION_MAX_ITEMS
+            ids = list(filterset.qs.order_by("id").values_list("id", flat=True)[: limit + 1])
+            if len(ids) > limit:
+                raise ValidationError({"filters": f"Matches more than {limit} artworks."})
+
+        outcomes = moderate_artworks(ids, action_name)
+        return Response(
+            {
+                "action": action_name,
+                "updated": sum(1 for outcome in outcomes.values() if outcome == UPDATED),
+                "results": [{"id": pk, "status": outcome} for pk, outcome in outcomes.items()],
+            }
+        )
+
+    @action(detail=False, methods=["post"], url_path="bulk-approve", url_name="bulk-approve")
+    def bulk_approve(self, request) -> Response:
+        return self._bulk_moderate(request, APPROVE)
+
+    @action(detail=False, methods=["post"], url_path="bulk-reject", url_name="bulk-reject")
+    def bulk_reject(self, request) -> Response:
+        return self._bulk_moderate(request, REJECT)
+
+    @action(detail=False, methods=["post"], url_path="bulk-feature", url_name="bulk-feature")
+    def bulk_feature(self, request) -> Response:
+        return self._bulk_moderate(request, FEATURE)
+
+    @action(detail=False, methods=["post"], url_path="bulk-unfeature", url_name="bulk-unfeature")
+    def bulk_unfeature(self, request) -> Response:
+        return self._bulk_moderate(request, UNFEATURE)
+
+    @action(detail=False, methods=["post"], url_path="queue/claim", url_name="queue-claim")
+    def claim(self, request) -> Response:
+        """
+        Claim the next pending artworks for review.
+
+        Rows claimed by another admin are skipped (SKIP LOCKED + lease),
+        so concurrent moderators never get the same artwork.
+
+        request data: {"limit": 10}
+        response: {"lease_expires_at": "...", "results": [ArtworkAdminSerializer, ...]}
+        """
+        serializer = ModerationClaimSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        ids, lease_until = claim_artworks(request.user, serializer.validated_data["limit"])
+        artworks = self.get_queryset().in_bulk(ids)
+        results = self.get_serializer([artworks[pk] for pk in ids], many=True).data
+        return Response({"lease_expires_at": lease_until, "results": results})
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"images/(?P<image_id>\d+)/duplicates",
+        url_name="image-duplicates",
+    )
+    def image_duplicates(self, request, image_id=None) -> Response:
+        """
+        Near-duplicate images (other artworks) within a Hamming radius of the perceptual hash.
+
+        query params: ?radius=6 (default ARTWORK_DUPLICATE_MAX_DISTANCE)
+        response: {"image_id", "radius", "results": [{"image_id", "artwork_id", "distance"}, ...]}
+        """
+        serializer = ImageDuplicateQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        radius = serializer.validated_data.get("radius", settings.ARTWORK_DUPLICATE_MAX_DISTANCE)
+
+        image = get_object_or_404(ArtworkImage, pk=image_id)
+        if image.phash is None:
+            raise ValidationError({"image_id": "Perceptual hash not computed yet."})
+
+        results = find_near_duplicates([image], radius)[image.id]
+        return Response({"image_id": image.id, "radius": radius, "results": results})
+
+    @action(detail=False, methods=["post"], url_path="queue/release", url_name="queue-release")
+    def release(self, request) -> Response:
+        """Return claimed artworks to the queue. request data: {"ids": [1, 2]}"""
+        serializer = BulkIdsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        released = release_artworks(request.user, serializer.validated_data["ids"])
+        return Response({"released": released})
+
+    # TODO: 강제 삭제 로직 추가
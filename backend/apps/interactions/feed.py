@@ -0,0 +1,197 @@
+import logging
+from collections import defaultdict
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+from apps.artworks.models import PUBLIC_LISTING, Artwork
+from apps.utils.translations import prefetch_translations
+
+from .models import Follow
+
+logger = logging.getLogger(__name__)
+
+
+def _timeline_key(user_id: int) -> str:
+    return f"feed:timeline:{user_id}"
+
+
+def _artist_key(artist_id: int) -> str:
+    # 작가별 최근 승인 작품: 팔로우 시 타임라인 백필과 인기 작가 읽기 시점 병합에 사용
+    return f"feed:artist:{artist_id}"
+
+
+def feed_score(approved_at_ms: int, artwork_id: int) -> int:
+    """Sort key of a feed entry: approval time (ms) with the artwork id's low digits.
+
+    Bulk approvals share one timestamp, so the low digits spread most of a
+    batch apart (fits in a double's 53-bit mantissa). Scores can still tie;
+    `read_feed` orders and pages on (score, artwork id).
+    """
+    return approved_at_ms * 1000 + artwork_id % 1000
+
+
+def is_celebrity(follower_count: int) -> bool:
+    return follower_count >= settings.FEED_CELEBRITY_FOLLOWERS
+
+
+def _add_entries(pipe, key: str, entries, cap: int) -> None:
+    pipe.zadd(key, {str(int(artwork_id)): score for artwork_id, score in entries})
+    # 최신 cap개만 유지
+    pipe.zremrangebyrank(key, 0, -(cap + 1))
+
+
+def prepare_fan_out(artwork_ids, approved_at_ms: int) -> list[tuple[int, list]]:
+    """Record newly approved artworks on their artists' lists.
+
+    Returns:
+        list: (artist_id, [[artwork_id, score], ...]) for artists whose followers
+            get the entries written into their timelines; popular artists are
+            left out and merged at read time instead
+    """
+    rows = Artwork.objects.filter(PUBLIC_LISTING, id__in=list(artwork_ids)).values_list(
+        "id", "artist_id", "artist__follower_count"
+    )
+    by_artist, follower_counts = defaultdict(list), {}
+    for artwork_id, artist_id, follower_count in rows:
+        by_artist[artist_id].append([artwork_id, feed_score(approved_at_ms, artwork_id)])
+        follower_counts[artist_id] = follower_count
+    if not by_artist:
+        return []
+
+    conn = get_redis_connection("default")
+    pipe = conn.pipeline(transaction=False)
+    for artist_id, entries in by_artist.items():
+        _add_entries(pipe, _artist_key(artist_id), entries, settings.FEED_ARTIST_TIMELINE_MAX)
+    pipe.execute()
+    return [
+        (artist_id, entries)
+        for artist_id, entries in by_artist.items()
+        if not is_celebrity(follower_counts[artist_id])
+    ]
+
+
+def push_to_followers(artist_id: int, entries, after_follow_id: int = 0) -> int | None:
+    """Write entries into one chunk of follower timelines (fan-out-on-write).
+
+    Followers are walked by Follow id so each chunk is one indexed query and
+    one pipelined round trip to Redis.
+
+    Returns:
+        int | None: last Follow id of a full chunk (more to do), None when finished
+    """
+    chunk_size = settings.FEED_FANOUT_CHUNK_SIZE
+    rows = list(
+        Follow.objects.filter(following_id=artist_id, id__gt=after_follow_id)
+        .order_by("id")
+        .values_list("id", "follower_id")[:chunk_size]
+    )
+    if not rows:
+        return None
+
+    conn = get_redis_connection("default")
+    pipe = conn.pipeline(transaction=False)
+    for _, follower_id in rows:
+        _add_entries(pipe, _timeline_key(follower_id), entries, settings.FEED_TIMELINE_MAX)
+    pipe.execute()
+    return rows[-1][0] if len(rows) == chunk_size else None
+
+
+def backfill_timeline(user_id: int, artist_id: int) -> None:
+    """Copy an artist's recent artworks into a new follower's timeline."""
+    try:
+        conn = get_redis_connection("default")
+        recent = conn.zrevrange(
+            _artist_key(artist_id), 0, settings.FEED_BACKFILL_SIZE - 1, withscores=True
+        )
+        if recent:
+            pipe = conn.pipeline(transaction=False)
+            _add_entries(pipe, _timeline_key(user_id), recent, settings.FEED_TIMELINE_MAX)
+            pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Failed to backfill feed of user {user_id}: {e}")
+
+
+def remove_artist_from_timeline(user_id: int, artist_id: int) -> None:
+    try:
+        conn = get_redis_connection("default")
+        members = conn.zrange(_artist_key(artist_id), 0, -1)
+        if members:
+            conn.zrem(_timeline_key(user_id), *members)
+    except RedisError as e:
+        logger.warning(f"Failed to prune feed of user {user_id}: {e}")
+
+
+def format_cursor(score: int, artwork_id: int) -> str:
+    return f"{score}:{artwork_id}"
+
+
+def parse_cursor(cursor: str) -> tuple[int, int]:
+    score, artwork_id = cursor.split(":")
+    return int(score), int(artwork_id)
+
+
+def read_feed(
+    user, limit: int, before: tuple[int, int] | None = None
+) -> tuple[list[Artwork], str | None]:
+    """One page of the user's feed, newest first.
+
+    The precomputed timeline gives at most `limit` entries; artists too popular
+    for fan-out-on-write are merged in at read time from their own capped
+    lists (`limit` entries each). Cost depends on the page size and the number
+    of followed popular artists, not on how many artists the user follows.
+
+    Entries are ordered by (score, artwork id) and the cursor carries both, so
+    entries sharing the boundary score are neither repeated nor skipped.
+
+    Args:
+        before: (score, artwork id) of the last entry of the previous page
+
+    Returns:
+        tuple: (artworks in feed order, cursor for the next page or None)
+    """
+    follows = Follow.objects.filter(follower=user)
+    celebrities = list(
+        follows.filter(
+            following__follower_count__gte=settings.FEED_CELEBRITY_FOLLOWERS
+        ).values_list("following_id", flat=True)
+    )
+
+    conn = get_redis_connection("default")
+    pipe = conn.pipeline(transaction=False)
+    keys = [_timeline_key(user.id), *map(_artist_key, celebrities)]
+    for key in keys:
+        if before is None:
+            pipe.zrevrangebyscore(key, "+inf", "-inf", start=0, num=limit, withscores=True)
+            continue
+        # 경계 점수와 같은 항목은 모두 읽고 작품 id 로 이어서 자름 (동점은 드묾)
+        pipe.zrevrangebyscore(key, f"({before[0]}", "-inf", start=0, num=limit, withscores=True)
+        pipe.zrangebyscore(key, before[0], before[0], withscores=True)
+    scores = {}
+    for entries in pipe.execute():
+        scores.update((int(member), int(score)) for member, score in entries)
+
+    page = sorted(
+        (
+            (score, artwork_id)
+            for artwork_id, score in scores.items()
+            if before is None or (score, artwork_id) < before
+        ),
+        reverse=True,
+    )[:limit]
+    next_cursor = format_cursor(*page[-1]) if len(page) == limit else None
+
+    # 타임라인 기록 이후 비공개/삭제된 작품, 언팔로우한 작가의 작품은 제외
+    # (언팔로우와 겹친 팬아웃 작업이 타임라인에 다시 쓸 수 있음)
+    ids = [artwork_id for _, artwork_id in page]
+    artworks = (
+        Artwork.objects.filter(
+            PUBLIC_LISTING, id__in=ids, artist_id__in=follows.values("following_id")
+        )
+        .select_related("artist", "artist__user")
+        .prefetch_related("images")
+    )
+    artworks = prefetch_translations(artworks, "artist")
+    by_id = {artwork.id: artwork for artwork in artworks}
+    return [by_id[pk] for pk in ids if pk in by_id], next_cursor
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.4 on 2026-10-18 15:05
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def drop_duplicate_announcements(apps, schema_editor):
+    """Keep the oldest artwork_upload row per (recipient, artwork) before the constraint."""
+    Notification = apps.get_model("interactions", "Notification")
+
+    announcements = Notification.objects.filter(notification_type="artwork_upload")
+    duplicates = (
+        announcements.values("recipient_id", "related_artwork_id")
+        .annotate(n=Count("id"), keep=Min("id"))
+        .filter(n__gt=1)
+    )
+    for row in duplicates.iterator():
+        announcements.filter(
+            recipient_id=row["recipient_id"], related_artwork_id=row["related_artwork_id"]
+        ).exclude(id=row["keep"]).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("interactions", "0002_notification_coalescing"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_announcements, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="notification",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("notification_type", "artwork_upload")),
+                fields=("recipient", "related_artwork"),
+                name="notification_artwork_upload_uniq",
+            ),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.4 on 2026-10-18 15:07
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_actors(apps, schema_editor):
+    """Seed actors of open coalesced rows from their sampled actor_ids."""
+    Notification = apps.get_model("interactions", "Notification")
+    NotificationActor = apps.get_model("interactions", "NotificationActor")
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+
+    rows = Notification.objects.filter(window_start__isnull=False).values_list("id", "actor_ids")
+    for notification_id, actor_ids in rows.iterator():
+        existing = User.objects.filter(pk__in=actor_ids).values_list("pk", flat=True)
+        NotificationActor.objects.bulk_create(
+            [NotificationActor(notification_id=notification_id, actor_id=pk) for pk in existing],
+            ignore_conflicts=True,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("interactions", "0003_artwork_upload_once"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationActor",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "actor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "notification",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="actors",
+                        to="interactions.notification",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "interactions_notification_actor",
+                "unique_together": {("notification", "actor")},
+            },
+        ),
+        migrations.RunPython(backfill_actors, migrations.RunPython.noop),
+    ]
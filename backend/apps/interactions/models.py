@@ -1,4 +1,5 @@
 from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
 from django.core.validators import RegexValidator
 from django.db import models
 from django.utils import timezone
@@ -130,6 +131,12 @@ class Notification(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     read_at = models.DateTimeField(blank=True, null=True)
     
+    # 같은 수신자/대상/유형의 이벤트를 윈도우 단위로 한 행에 합침 ("X님 외 N명")
+    coalesce_key = models.CharField(max_length=100, blank=True, default='')
+    window_start = models.DateTimeField(blank=True, null=True)
+    actor_count = models.PositiveIntegerField(default=1)
+    actor_ids = ArrayField(models.IntegerField(), default=list, blank=True)
+    
     # 관련 객체 참조 (Generic Foreign Key 대신 구체적인 FK 사용)
     related_artwork = models.ForeignKey(
         'artworks.Artwork', 
@@ -157,6 +164,19 @@ class Notification(models.Model):
             models.Index(fields=['recipient', 'is_read']),
             models.Index(fields=['recipient', 'created_at']),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['recipient', 'coalesce_key', 'window_start'],
+                condition=models.Q(window_start__isnull=False),
+                name='notification_coalesce_window_uniq',
+            ),
+            # 작품 공개 알림은 팔로워당 한 번 (동시 실행된 팬아웃 작업의 중복 방지)
+            models.UniqueConstraint(
+                fields=['recipient', 'related_artwork'],
+                condition=models.Q(notification_type='artwork_upload'),
+                name='notification_artwork_upload_uniq',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.recipient.username}"
@@ -167,3 +187,22 @@ class Notification(models.Model):
             self.is_read = True
             self.read_at = timezone.now()
             self.save()
+
+
+class NotificationActor(models.Model):
+    """합쳐진 알림에 참여한 행위자 (행위자별 한 행, actor_count 는 서로 다른 행위자 수)"""
+
+    notification = models.ForeignKey(
+        Notification,
+        on_delete=models.CASCADE,
+        related_name='actors'
+    )
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+
+    class Meta:
+        unique_together = ('notification', 'actor')
+        db_table = 'interactions_notification_actor'
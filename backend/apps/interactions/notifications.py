@@ -0,0 +1,222 @@
+from datetime import UTC, datetime
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from apps.artists.models import Artist
+from apps.artworks.models import PUBLIC_LISTING, Artwork
+
+from .models import Follow, Notification, NotificationActor
+
+User = get_user_model()
+
+
+def _window_start(now: datetime) -> datetime:
+    window = settings.NOTIFICATION_COALESCE_SECONDS
+    return datetime.fromtimestamp(int(now.timestamp()) // window * window, tz=UTC)
+
+
+def _actors_text(sender, actor_count: int) -> str:
+    if actor_count == 1:
+        return f"{sender.username}님이"
+    return f"{sender.username}님 외 {actor_count - 1}명이"
+
+
+def coalesce_notification(
+    recipient_id: int, sender, notification_type: str, coalesce_key: str, render, **related
+) -> Notification:
+    """Upsert the recipient's notification for `coalesce_key` in the current window.
+
+    The first event of a window inserts a row; later events by other actors
+    lock that row and bump `actor_count`, keep the most recent actor ids
+    (NOTIFICATION_ACTOR_SAMPLE_SIZE) and re-render the message, so row count
+    grows with distinct targets per window rather than with events. The row
+    moves back to the top of the inbox as unread. Every actor is recorded once
+    in NotificationActor, so repeat events (e.g. unlike then like again) are
+    ignored even after the actor has left the sample.
+
+    Args:
+        coalesce_key: target identity within the type (e.g. "like:artwork:12")
+        render: callable(sender, actor_count) -> (title, message)
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        title, message = render(sender, 1)
+        notification, created = Notification.objects.select_for_update().get_or_create(
+            recipient_id=recipient_id,
+            coalesce_key=coalesce_key,
+            window_start=_window_start(now),
+            defaults={
+                "sender": sender,
+                "notification_type": notification_type,
+                "title": title,
+                "message": message,
+                "actor_ids": [sender.id],
+                **related,
+            },
+        )
+        # 행 잠금 아래에서 기록하므로 같은 행위자는 한 번만 집계됨
+        _, new_actor = NotificationActor.objects.get_or_create(
+            notification=notification, actor=sender
+        )
+        if created or not new_actor:
+            return notification
+
+        notification.actor_count += 1
+        notification.actor_ids = [sender.id, *notification.actor_ids][
+            : settings.NOTIFICATION_ACTOR_SAMPLE_SIZE
+        ]
+        notification.sender = sender
+        notification.title, notification.message = render(sender, notification.actor_count)
+        notification.is_read = False
+        notification.read_at = None
+        notification.created_at = now
+        notification.save(
+            update_fields=[
+                "actor_count",
+                "actor_ids",
+                "sender",
+                "title",
+                "message",
+                "is_read",
+                "read_at",
+                "created_at",
+            ]
+        )
+    return notification
+
+
+def create_follow_notification(user_id: int, artist_id: int) -> Notification | None:
+    artist = Artist.objects.filter(pk=artist_id).first()
+    if artist is None or artist.user_id == user_id:
+        return None
+    sender = User.objects.filter(pk=user_id).first()
+    if sender is None:
+        return None
+    return coalesce_notification(
+        artist.user_id,
+        sender,
+        "follow",
+        f"follow:artist:{artist.id}",
+        lambda sender, count: (
+            "새 팔로워",
+            f"{_actors_text(sender, count)} 회원님을 팔로우했습니다.",
+        ),
+        related_artist=artist,
+    )
+
+
+def create_like_notification(user_id: int, artwork_id: int) -> Notification | None:
+    artwork = Artwork.objects.filter(pk=artwork_id).select_related("artist").first()
+    if artwork is None or artwork.artist.user_id == user_id:
+        return None
+    sender = User.objects.filter(pk=user_id).first()
+    if sender is None:
+        return None
+    title = artwork.safe_translation_getter("title", any_language=True)
+    return coalesce_notification(
+        artwork.artist.user_id,
+        sender,
+        "like",
+        f"like:artwork:{artwork.id}",
+        lambda sender, count: (
+            "작품 좋아요",
+            f"{_actors_text(sender, count)} '{title}' 작품을 좋아합니다.",
+        ),
+        related_artwork=artwork,
+    )
+
+
+def create_artwork_upload_notifications(artwork_id: int) -> int:
+    """Write an `artwork_upload` notification for every follower of the artist.
+
+    Followers are read through a server-side cursor in
+    NOTIFICATION_FANOUT_CHUNK_SIZE chunks and each chunk is written with one
+    `bulk_create`, so memory stays flat and no long transaction is held no
+    matter how many followers the artist has. An artwork is announced once:
+    re-approval after a rejection does not notify again, and the
+    `notification_artwork_upload_uniq` constraint drops rows a concurrent run
+    already wrote for the same follower.
+
+    Returns:
+        int: number of notifications stored for the artwork
+    """
+    artwork = Artwork.objects.filter(PUBLIC_LISTING, pk=artwork_id).select_related("artist").first()
+    if artwork is None:
+        return 0
+    if Notification.objects.filter(
+        notification_type="artwork_upload", related_artwork=artwork
+    ).exists():
+        return 0
+
+    artist = artwork.artist
+    title = f"{artist}님의 새 작품"
+    message = (
+        f"'{artwork.safe_translation_getter('title', any_language=True)}' 작품이 공개되었습니다."
+    )
+    chunk_size = settings.NOTIFICATION_FANOUT_CHUNK_SIZE
+
+    follower_ids = (
+        Follow.objects.filter(following=artist)
+        .order_by()
+        .values_list("follower_id", flat=True)
+        .iterator(chunk_size=chunk_size)
+    )
+    batch = []
+    for follower_id in follower_ids:
+        batch.append(
+            Notification(
+                recipient_id=follower_id,
+                sender_id=artist.user_id,
+                notification_type="artwork_upload",
+                actor_ids=[artist.user_id],
+                title=title,
+                message=message,
+                related_artwork=artwork,
+                related_artist=artist,
+            )
+        )
+        if len(batch) == chunk_size:
+            Notification.objects.bulk_create(batch, batch_size=chunk_size, ignore_conflicts=True)
+            batch = []
+    if batch:
+        Notification.objects.bulk_create(batch, batch_size=chunk_size, ignore_conflicts=True)
+    return Notification.objects.filter(
+        notification_type="artwork_upload", related_artwork=artwork
+    ).count()
+
+
+def create_artist_review_notifications(artist_ids, approval_status: str) -> int:
+    """Tell artists that their profile review finished (one `system` row each).
+
+    Returns:
+        int: number of notifications created
+    """
+    messages = {
+        Artist.ApprovalStatus.APPROVED: "작가 프로필이 승인되었습니다.",
+        Artist.ApprovalStatus.REJECTED: "작가 프로필이 반려되었습니다.",
+    }
+    message = messages.get(approval_status)
+    if message is None:
+        return 0
+
+    rows = Artist.objects.filter(
+        pk__in=list(artist_ids), approval_status=approval_status
+    ).values_list("id", "user_id")
+    notifications = [
+        Notification(
+            recipient_id=user_id,
+            notification_type="system",
+            title="작가 프로필 심사 결과",
+            message=message,
+            related_artist_id=artist_id,
+        )
+        for artist_id, user_id in rows
+    ]
+    return len(
+        Notification.objects.bulk_create(
+            notifications, batch_size=settings.NOTIFICATION_FANOUT_CHUNK_SIZE
+        )
+    )
@@ -0,0 +1,37 @@
+from django.conf import settings
+from rest_framework import serializers
+
+from apps.artworks.models import Artwork
+from apps.artworks.serializers import ArtworkListSerializer
+
+from .feed import parse_cursor
+from .models import Wishlist
+
+
+class WishlistSerializer(serializers.ModelSerializer):
+    artwork = ArtworkListSerializer(read_only=True)
+    artwork_id = serializers.PrimaryKeyRelatedField(
+        source="artwork",
+        write_only=True,
+        queryset=Artwork.objects.filter(
+            approval_status=Artwork.ApprovalStatus.APPROVED,
+            display_status=Artwork.DisplayStatus.PUBLIC,
+            is_deleted=False,
+        ),
+    )
+
+    class Meta:
+        model = Wishlist
+        fields = ["id", "artwork", "artwork_id", "created_at"]
+        read_only_fields = ["id", "artwork", "created_at"]
+
+
+class FeedQuerySerializer(serializers.Serializer):
+    # "<score>:<artwork id>" (이전 응답의 next_cursor)
+    cursor = serializers.RegexField(r"^\d+:\d+$", required=False)
+    page_size = serializers.IntegerField(
+        required=False, min_value=1, max_value=100, default=settings.FEED_PAGE_SIZE
+    )
+
+    def validate_cursor(self, value):
+        return parse_cursor(value)
@@ -0,0 +1,72 @@
+from django.db import transaction
+from django.db.models import F
+
+from apps.artists.models import Artist
+from apps.artworks.models import Artwork
+
+from .feed import backfill_timeline, remove_artist_from_timeline
+from .models import Follow, Wishlist
+from .tasks import send_follow_notification, send_like_notification
+
+
+def like_artwork(user, artwork: Artwork) -> bool:
+    """Add an artwork to the user's wishlist and bump `like_count`.
+
+    The (user, artwork) unique constraint decides who wins a race, and the counter
+    is adjusted with an F() expression only when a row was actually inserted.
+
+    Returns:
+        bool: True if a new like was created
+    """
+    with transaction.atomic():
+        _, created = Wishlist.objects.get_or_create(user=user, artwork=artwork)
+        if created:
+            Artwork.objects.filter(pk=artwork.pk).update(like_count=F("like_count") + 1)
+            transaction.on_commit(lambda: send_like_notification.delay(user.id, artwork.id))
+    return created
+
+
+def unlike_artwork(user, artwork: Artwork) -> bool:
+    """Remove an artwork from the user's wishlist and decrement `like_count`.
+
+    Returns:
+        bool: True if an existing like was removed
+    """
+    with transaction.atomic():
+        deleted, _ = Wishlist.objects.filter(user=user, artwork=artwork).delete()
+        if deleted:
+            Artwork.objects.filter(pk=artwork.pk, like_count__gt=0).update(
+                like_count=F("like_count") - 1
+            )
+    return bool(deleted)
+
+
+def follow_artist(user, artist: Artist) -> bool:
+    """Follow an artist and bump `follower_count` in the same transaction.
+
+    Returns:
+        bool: True if a new follow was created
+    """
+    with transaction.atomic():
+        _, created = Follow.objects.get_or_create(follower=user, following=artist)
+        if created:
+            Artist.objects.filter(pk=artist.pk).update(follower_count=F("follower_count") + 1)
+            transaction.on_commit(lambda: backfill_timeline(user.id, artist.id))
+            transaction.on_commit(lambda: send_follow_notification.delay(user.id, artist.id))
+    return created
+
+
+def unfollow_artist(user, artist: Artist) -> bool:
+    """Unfollow an artist and decrement `follower_count`.
+
+    Returns:
+        bool: True if an existing follow was removed
+    """
+    with transaction.atomic():
+        deleted, _ = Follow.objects.filter(follower=user, following=artist).delete()
+        if deleted:
+            Artist.objects.filter(pk=artist.pk, follower_count__gt=0).update(
+                follower_count=F("follower_count") - 1
+            )
+            transaction.on_commit(lambda: remove_artist_from_timeline(user.id, artist.id))
+    return bool(deleted)
@@ -0,0 +1,28 @@
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.artists.signals import artists_moderated
+from apps.artworks.moderation import APPROVE
+from apps.artworks.signals import artworks_moderated
+
+from .tasks import (
+    fan_out_approved_artworks,
+    fan_out_artwork_upload_notifications,
+    send_artist_review_notifications,
+)
+
+
+@receiver(artworks_moderated)
+def artworks_approved(sender, artwork_ids, action, **kwargs):
+    if action != APPROVE:
+        return
+    approved_at_ms = int(timezone.now().timestamp() * 1000)
+    fan_out_approved_artworks.delay(list(artwork_ids), approved_at_ms)
+    # 요청에서는 작업 하나만 큐에 넣고, 작품별 팔로워 알림 작업은 워커가 분기
+    # (팔로워가 많은 작가도 요청/다른 작품을 막지 않도록)
+    fan_out_artwork_upload_notifications.delay(list(artwork_ids))
+
+
+@receiver(artists_moderated)
+def artists_reviewed(sender, artist_ids, approval_status, **kwargs):
+    send_artist_review_notifications.delay(list(artist_ids), approval_status)
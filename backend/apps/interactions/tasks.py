@@ -0,0 +1,55 @@
+from celery import shared_task
+
+from .feed import prepare_fan_out, push_to_followers
+from .notifications import (
+    create_artist_review_notifications,
+    create_artwork_upload_notifications,
+    create_follow_notification,
+    create_like_notification,
+)
+
+
+@shared_task
+def fan_out_approved_artworks(artwork_ids, approved_at_ms: int) -> int:
+    """Push approved artworks to follower timelines, one chunk task per artist."""
+    targets = prepare_fan_out(artwork_ids, approved_at_ms)
+    for artist_id, entries in targets:
+        fan_out_feed_chunk.delay(artist_id, entries)
+    return len(targets)
+
+
+@shared_task
+def fan_out_feed_chunk(artist_id: int, entries, after_follow_id: int = 0) -> None:
+    # 청크 하나를 처리하고 남은 팔로워는 다음 작업으로 넘김 (작업 하나가 오래 점유하지 않도록)
+    last_id = push_to_followers(artist_id, entries, after_follow_id)
+    if last_id is not None:
+        fan_out_feed_chunk.delay(artist_id, entries, last_id)
+
+
+@shared_task
+def fan_out_artwork_upload_notifications(artwork_ids) -> int:
+    """Queue one follower-notification task per approved artwork."""
+    artwork_ids = list(artwork_ids)
+    for artwork_id in artwork_ids:
+        send_artwork_upload_notifications.delay(artwork_id)
+    return len(artwork_ids)
+
+
+@shared_task
+def send_artwork_upload_notifications(artwork_id: int) -> int:
+    return create_artwork_upload_notifications(artwork_id)
+
+
+@shared_task
+def send_follow_notification(user_id: int, artist_id: int) -> None:
+    create_follow_notification(user_id, artist_id)
+
+
+@shared_task
+def send_like_notification(user_id: int, artwork_id: int) -> None:
+    create_like_notification(user_id, artwork_id)
+
+
+@shared_task
+def send_artist_review_notifications(artist_ids, approval_status: str) -> int:
+    return create_artist_review_notifications(artist_ids, approval_status)
@@ -1,2 +1,454 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
 
-# Create your tests here.
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import QuerySet
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django_redis import get_redis_connection
+from rest_framework import status
+
+from apps.artists.models import Artist
+from apps.artworks.models import Artwork
+from apps.interactions.models import Follow, Notification, Wishlist
+from apps.interactions.notifications import (
+    create_artwork_upload_notifications,
+    create_follow_notification,
+    create_like_notification,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestArtworkLike:
+    def test_like_and_unlike(self, authenticated_client, user, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        url = reverse("artworks-like", kwargs={"pk": artwork.id})
+
+        response = authenticated_client.post(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"liked": True, "like_count": 1}
+
+        # 중복 좋아요는 카운터를 올리지 않음
+        response = authenticated_client.post(url)
+        assert response.data["like_count"] == 1
+        assert Wishlist.objects.filter(user=user, artwork=artwork).count() == 1
+
+        response = authenticated_client.delete(url)
+        assert response.data == {"liked": False, "like_count": 0}
+
+        response = authenticated_client.delete(url)
+        assert response.data["like_count"] == 0
+
+    def test_like_requires_login(self, api_client, artist, artwork_factory):
+        artwork = artwork_factory(artist, is_featured=True)
+        url = reverse("artworks-like", kwargs={"pk": artwork.id})
+        response = api_client.post(url)
+        assert response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+
+    def test_wishlist_add_list_remove(self, authenticated_client, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+
+        response = authenticated_client.post(reverse("wishlist-list"), {"artwork_id": artwork.id})
+        assert response.status_code == status.HTTP_201_CREATED
+
+        response = authenticated_client.get(reverse("wishlist-list"))
+        assert response.status_code == status.HTTP_200_OK
+        assert [w["artwork"]["id"] for w in response.data["results"]] == [artwork.id]
+
+        url = reverse("wishlist-detail", kwargs={"artwork_id": artwork.id})
+        response = authenticated_client.delete(url)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        artwork.refresh_from_db()
+        assert artwork.like_count == 0
+
+    def test_wishlist_skips_deleted_artworks(
+        self, authenticated_client, user, artist, artwork_factory
+    ):
+        artwork = artwork_factory(artist)
+        Wishlist.objects.create(user=user, artwork=artwork)
+        Artwork.objects.filter(pk=artwork.pk).update(is_deleted=True)
+
+        response = authenticated_client.get(reverse("wishlist-list"))
+        assert response.data["results"] == []
+
+        deleted = artwork_factory(artist, is_deleted=True)
+        response = authenticated_client.post(reverse("wishlist-list"), {"artwork_id": deleted.id})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_wishlist_list_query_count_is_constant(
+        self, authenticated_client, user, artist, artwork_factory
+    ):
+        def list_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                response = authenticated_client.get(reverse("wishlist-list"))
+            assert response.status_code == status.HTTP_200_OK
+            return len(ctx.captured_queries)
+
+        Wishlist.objects.create(user=user, artwork=artwork_factory(artist))
+        single = list_queries()
+        for _ in range(9):
+            Wishlist.objects.create(user=user, artwork=artwork_factory(artist))
+        assert list_queries() == single
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestReconcileLikeCounts:
+    def test_fixes_drifted_counts(self, user, admin_user, artist, artwork_factory):
+        liked = artwork_factory(artist, title="liked")
+        unliked = artwork_factory(artist, title="unliked")
+        Wishlist.objects.create(user=user, artwork=liked)
+        Wishlist.objects.create(user=admin_user, artwork=liked)
+        Artwork.objects.filter(pk=liked.pk).update(like_count=7)
+        Artwork.objects.filter(pk=unliked.pk).update(like_count=3)
+
+        out = StringIO()
+        call_command("reconcile_like_counts", "--chunk-size", "1", stdout=out)
+
+        liked.refresh_from_db()
+        unliked.refresh_from_db()
+        assert liked.like_count == 2
+        assert unliked.like_count == 0
+        assert "fixed 2" in out.getvalue()
+
+    def test_dry_run_does_not_update(self, user, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        Artwork.objects.filter(pk=artwork.pk).update(like_count=5)
+
+        call_command("reconcile_like_counts", "--dry-run", stdout=StringIO())
+
+        artwork.refresh_from_db()
+        assert artwork.like_count == 5
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestArtistFollow:
+    def test_follow_and_unfollow(self, authenticated_client, user, artist):
+        url = reverse("artists-follow", kwargs={"pk": artist.id})
+
+        response = authenticated_client.post(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"following": True, "follower_count": 1}
+
+        # 중복 팔로우는 카운터를 올리지 않음
+        response = authenticated_client.post(url)
+        assert response.data["follower_count"] == 1
+        assert Follow.objects.filter(follower=user, following=artist).count() == 1
+
+        response = authenticated_client.delete(url)
+        assert response.data == {"following": False, "follower_count": 0}
+
+        response = authenticated_client.delete(url)
+        assert response.data["follower_count"] == 0
+
+    def test_cannot_follow_self(self, artist_client, artist):
+        response = artist_client.post(reverse("artists-follow", kwargs={"pk": artist.id}))
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Follow.objects.exists()
+
+    def test_popular_ordering_uses_counter(self, authenticated_client, artist, admin_user):
+        popular = Artist.objects.language("ko").create(user=admin_user, artist_name="popular")
+        Artist.objects.filter(pk=popular.pk).update(follower_count=10)
+
+        response = authenticated_client.get(reverse("artists-list"), {"ordering": "popular"})
+        results = response.data["results"] if "results" in response.data else response.data
+        assert [a["id"] for a in results] == [popular.id, artist.id]
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestReconcileFollowerCounts:
+    def test_fixes_drifted_counts(self, user, admin_user, artist):
+        Follow.objects.create(follower=user, following=artist)
+        Follow.objects.create(follower=admin_user, following=artist)
+        Artist.objects.filter(pk=artist.pk).update(follower_count=9)
+
+        out = StringIO()
+        call_command("reconcile_follower_counts", "--chunk-size", "1", stdout=out)
+
+        artist.refresh_from_db()
+        assert artist.follower_count == 2
+        assert "fixed 1" in out.getvalue()
+
+        call_command("reconcile_follower_counts", "--dry-run", stdout=out)
+        assert "would fix 0" in out.getvalue()
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestFollowerFeed:
+    @pytest.fixture(autouse=True)
+    def clear_redis(self):
+        cache.clear()
+        yield
+        cache.clear()
+
+    def _follow(self, users, artist):
+        for u in users:
+            Follow.objects.create(follower=u, following=artist)
+        Artist.objects.filter(pk=artist.pk).update(follower_count=len(users))
+
+    def _approve(self, admin_client, artworks, capture):
+        with capture(execute=True):
+            admin_client.post(
+                reverse("admin-artwork-bulk-approve"),
+                {"ids": [a.id for a in artworks]},
+                format="json",
+            )
+
+    def _pending(self, artist, artwork_factory, n):
+        return [
+            artwork_factory(artist, approval_status=Artwork.ApprovalStatus.PENDING)
+            for _ in range(n)
+        ]
+
+    def test_fan_out_in_chunks_and_paginate(
+        self,
+        settings,
+        api_client,
+        admin_client,
+        user,
+        artist,
+        artwork_factory,
+        django_capture_on_commit_callbacks,
+    ):
+        settings.FEED_FANOUT_CHUNK_SIZE = 2
+        followers = [user] + [
+            get_user_model().objects.create_user(
+                email=f"f{i}@example.com", username=f"f{i}", password="pw123456"
+            )
+            for i in range(2)
+        ]
+        self._follow(followers, artist)
+        artworks = self._pending(artist, artwork_factory, 3)
+        self._approve(admin_client, artworks, django_capture_on_commit_callbacks)
+
+        conn = get_redis_connection("default")
+        assert all(conn.zcard(f"feed:timeline:{f.id}") == 3 for f in followers)
+
+        api_client.force_authenticate(user)
+        page = api_client.get(reverse("feed-list"), {"page_size": 2}).data
+        assert len(page["results"]) == 2
+        rest = api_client.get(
+            reverse("feed-list"), {"page_size": 2, "cursor": page["next_cursor"]}
+        ).data
+        assert rest["next_cursor"] is None
+        ids = [a["id"] for a in page["results"] + rest["results"]]
+        assert sorted(ids) == sorted(a.id for a in artworks)
+
+    def test_tied_scores_at_page_boundary_are_not_skipped(
+        self, api_client, user, artist, artwork_factory
+    ):
+        self._follow([user], artist)
+        newest, *tied = [artwork_factory(artist) for _ in range(3)]
+        # 같은 밀리초에 승인되고 id 하위 자리가 같은 작품은 점수가 같음
+        get_redis_connection("default").zadd(
+            f"feed:timeline:{user.id}",
+            {str(newest.id): 2000, **{str(a.id): 1000 for a in tied}},
+        )
+
+        api_client.force_authenticate(user)
+        seen, cursor = [], None
+        while True:
+            params = {"page_size": 2, **({"cursor": cursor} if cursor else {})}
+            page = api_client.get(reverse("feed-list"), params).data
+            seen += [a["id"] for a in page["results"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        assert seen == [newest.id, *sorted((a.id for a in tied), reverse=True)]
+
+    def test_unfollowed_artist_is_filtered_on_read(self, api_client, user, artist, artwork_factory):
+        artwork = artwork_factory(artist)
+        # 언팔로우 이후 끝난 팬아웃 작업이 남긴 항목
+        get_redis_connection("default").zadd(f"feed:timeline:{user.id}", {str(artwork.id): 1})
+
+        api_client.force_authenticate(user)
+        assert api_client.get(reverse("feed-list")).data["results"] == []
+
+    def test_timeline_is_trimmed(
+        self,
+        settings,
+        admin_client,
+        user,
+        artist,
+        artwork_factory,
+        django_capture_on_commit_callbacks,
+    ):
+        settings.FEED_TIMELINE_MAX = 2
+        self._follow([user], artist)
+        self._approve(
+            admin_client,
+            self._pending(artist, artwork_factory, 4),
+            django_capture_on_commit_callbacks,
+        )
+        assert get_redis_connection("default").zcard(f"feed:timeline:{user.id}") == 2
+
+    def test_popular_artist_is_merged_on_read(
+        self,
+        settings,
+        api_client,
+        admin_client,
+        user,
+        artist,
+        artwork_factory,
+        django_capture_on_commit_callbacks,
+    ):
+        settings.FEED_CELEBRITY_FOLLOWERS = 1
+        self._follow([user], artist)
+        artworks = self._pending(artist, artwork_factory, 2)
+        self._approve(admin_client, artworks, django_capture_on_commit_callbacks)
+
+        assert not get_redis_connection("default").exists(f"feed:timeline:{user.id}")
+        api_client.force_authenticate(user)
+        results = api_client.get(reverse("feed-list")).data["results"]
+        assert sorted(a["id"] for a in results) == sorted(a.id for a in artworks)
+
+    def test_follow_backfills_and_unfollow_prunes(
+        self,
+        authenticated_client,
+        admin_client,
+        artist,
+        artwork_factory,
+        django_capture_on_commit_callbacks,
+    ):
+        artworks = self._pending(artist, artwork_factory, 2)
+        self._approve(admin_client, artworks, django_capture_on_commit_callbacks)
+        follow_url = reverse("artists-follow", kwargs={"pk": artist.id})
+
+        with django_capture_on_commit_callbacks(execute=True):
+            authenticated_client.post(follow_url)
+        assert len(authenticated_client.get(reverse("feed-list")).data["results"]) == 2
+
+        with django_capture_on_commit_callbacks(execute=True):
+            authenticated_client.delete(follow_url)
+        assert authenticated_client.get(reverse("feed-list")).data["results"] == []
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestNotifications:
+    @pytest.fixture(autouse=True)
+    def clear_redis(self):
+        cache.clear()
+        yield
+        cache.clear()
+
+    def test_artwork_upload_fans_out_to_followers_in_batches(
+        self,
+        settings,
+        admin_client,
+        artist,
+        artwork_factory,
+        django_capture_on_commit_callbacks,
+        django_assert_max_num_queries,
+    ):
+        settings.NOTIFICATION_FANOUT_CHUNK_SIZE = 2
+        followers = [
+            get_user_model().objects.create_user(
+                email=f"n{i}@example.com", username=f"n{i}", password="pw123456"
+            )
+            for i in range(5)
+        ]
+        Follow.objects.bulk_create(Follow(follower=u, following=artist) for u in followers)
+        artwork = artwork_factory(artist, approval_status=Artwork.ApprovalStatus.PENDING)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            admin_client.post(
+                reverse("admin-artwork-bulk-approve"), {"ids": [artwork.id]}, format="json"
+            )
+
+        notifications = Notification.objects.filter(notification_type="artwork_upload")
+        assert sorted(notifications.values_list("recipient_id", flat=True)) == sorted(
+            u.id for u in followers
+        )
+        assert all(n.related_artwork_id == artwork.id for n in notifications)
+        # 재승인 시 중복 알림 없음, 팔로워 수와 무관하게 청크당 INSERT 1회
+        assert create_artwork_upload_notifications(artwork.id) == 0
+        # 확인 이후 동시에 실행된 팬아웃도 팔로워당 한 행만 남김
+        notifications.filter(recipient__in=followers[:2]).delete()
+        with patch.object(QuerySet, "exists", return_value=False):
+            assert create_artwork_upload_notifications(artwork.id) == 5
+        Notification.objects.all().delete()
+        with django_assert_max_num_queries(8):
+            assert create_artwork_upload_notifications(artwork.id) == 5
+
+    def test_bulk_approve_enqueues_one_notification_task(
+        self, admin_client, artist, artwork_factory, django_capture_on_commit_callbacks
+    ):
+        ids = [
+            artwork_factory(artist, approval_status=Artwork.ApprovalStatus.PENDING).id
+            for _ in range(3)
+        ]
+        target = "apps.interactions.signals.fan_out_artwork_upload_notifications.delay"
+        with patch(target) as delay, django_capture_on_commit_callbacks(execute=True):
+            admin_client.post(reverse("admin-artwork-bulk-approve"), {"ids": ids}, format="json")
+
+        delay.assert_called_once()
+        assert sorted(delay.call_args.args[0]) == sorted(ids)
+
+    def test_follow_and_like_notify_artist(
+        self,
+        authenticated_client,
+        user,
+        artist,
+        artwork_factory,
+        django_capture_on_commit_callbacks,
+    ):
+        artwork = artwork_factory(artist)
+        with django_capture_on_commit_callbacks(execute=True):
+            authenticated_client.post(reverse("artists-follow", kwargs={"pk": artist.id}))
+            authenticated_client.post(reverse("artworks-like", kwargs={"pk": artwork.id}))
+
+        received = Notification.objects.filter(recipient=artist.user)
+        assert sorted(received.values_list("notification_type", flat=True)) == ["follow", "like"]
+        assert all(n.sender_id == user.id for n in received)
+        # 자기 작품 좋아요는 알림 없음
+        assert create_like_notification(artist.user_id, artwork.id) is None
+
+    def test_likes_coalesce_per_target_and_window(self, settings, artist, artwork_factory):
+        settings.NOTIFICATION_ACTOR_SAMPLE_SIZE = 2
+        artwork, other = artwork_factory(artist), artwork_factory(artist)
+        fans = [
+            get_user_model().objects.create_user(
+                email=f"fan{i}@example.com", username=f"fan{i}", password="pw123456"
+            )
+            for i in range(3)
+        ]
+        for fan in fans:
+            create_like_notification(fan.id, artwork.id)
+        create_like_notification(fans[2].id, artwork.id)  # 같은 행위자 반복은 무시
+        create_like_notification(fans[0].id, artwork.id)  # 샘플에서 밀려난 행위자도 무시
+        create_like_notification(fans[0].id, other.id)
+        create_follow_notification(fans[0].id, artist.id)
+
+        rows = Notification.objects.filter(recipient=artist.user)
+        assert rows.count() == 3
+        liked = rows.get(related_artwork=artwork)
+        assert liked.actor_count == 3
+        assert liked.actor_ids == [fans[2].id, fans[1].id]
+        assert liked.sender_id == fans[2].id
+        assert "fan2님 외 2명이" in liked.message
+
+        # 읽은 뒤 새 이벤트가 오면 다시 안 읽음, 윈도우가 지나면 새 행
+        liked.mark_as_read()
+        viewer = get_user_model().objects.create_user(
+            email="late@example.com", username="late", password="pw123456"
+        )
+        create_like_notification(viewer.id, artwork.id)
+        liked.refresh_from_db()
+        assert not liked.is_read and liked.actor_count == 4
+
+        Notification.objects.filter(pk=liked.pk).update(
+            window_start=liked.window_start - timedelta(days=2)
+        )
+        create_like_notification(fans[0].id, artwork.id)
+        assert rows.filter(related_artwork=artwork).count() == 2
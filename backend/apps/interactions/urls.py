@@ -0,0 +1,10 @@
+from rest_framework.routers import DefaultRouter
+
+from .views import FeedViewSet, WishlistViewSet
+
+router = DefaultRouter()
+router.register(r"wishlist", WishlistViewSet, basename="wishlist")
+router.register(r"feed", FeedViewSet, basename="feed")
+urlpatterns = []
+
+urlpatterns += router.urls
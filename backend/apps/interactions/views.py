@@ -1,2 +1,75 @@
+from django.db.models import Prefetch
+from django.shortcuts import get_object_or_404
+from rest_framework import mixins, status, viewsets
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
-# Create your views here.
+from apps.artworks.models import Artwork
+from apps.artworks.serializers import ArtworkListSerializer
+from apps.utils.translations import prefetch_translations
+
+from .feed import read_feed
+from .models import Wishlist
+from .serializers import FeedQuerySerializer, WishlistSerializer
+from .services import like_artwork, unlike_artwork
+
+
+class WishlistViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    """
+    Wishlist of the current user.
+    Adding/removing goes through the same service as artwork likes,
+    so `Artwork.like_count` stays in sync.
+    """
+
+    serializer_class = WishlistSerializer
+    permission_classes = [IsAuthenticated]
+    lookup_field = "artwork_id"
+
+    def get_queryset(self):
+        # 작품/작가 번역과 이미지를 페이지 단위로 prefetch (행마다 추가 쿼리 없음)
+        artworks = prefetch_translations(
+            Artwork.objects.select_related("artist").prefetch_related("images"), "artist"
+        )
+        return (
+            Wishlist.objects.filter(user=self.request.user, artwork__is_deleted=False)
+            .prefetch_related(Prefetch("artwork", queryset=artworks))
+            .order_by("-created_at", "-id")
+        )
+
+    def create(self, request, *args, **kwargs) -> Response:
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        artwork = serializer.validated_data["artwork"]
+
+        created = like_artwork(request.user, artwork)
+        return Response(
+            {"artwork_id": artwork.id, "created": created},
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+    def destroy(self, request, artwork_id=None) -> Response:
+        artwork = get_object_or_404(Artwork, pk=artwork_id)
+        unlike_artwork(request.user, artwork)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class FeedViewSet(viewsets.GenericViewSet):
+    """
+    New artworks from followed artists, newest first.
+
+    query params: ?cursor=<next_cursor>&page_size=20
+    response: {"next_cursor": str | null, "results": [ArtworkListSerializer, ...]}
+    """
+
+    serializer_class = ArtworkListSerializer
+    permission_classes = [IsAuthenticated]
+
+    def list(self, request) -> Response:
+        query = FeedQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        artworks, next_cursor = read_feed(
+            request.user, query.validated_data["page_size"], query.validated_data.get("cursor")
+        )
+        results = self.get_serializer(artworks, many=True).data
+        return Response({"next_cursor": next_cursor, "results": results})
@@ -0,0 +1,43 @@
+from django.db import transaction
+
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+NOT_FOUND = "not_found"
+
+
+def bulk_set_fields(model, ids, values: dict, extra: dict | None = None):
+    """Set `values` on many rows with one locking SELECT and one UPDATE.
+
+    Only rows whose current `values` differ are updated; `extra` fields
+    (timestamps etc.) are written alongside but not compared.
+    Behaves like `save(update_fields=...)` without loading full rows or firing per-row signals.
+
+    Returns:
+        tuple[list[int], dict[int, str]]: changed ids, outcome per requested id
+            (updated / unchanged / not_found)
+    """
+    ids = list(dict.fromkeys(ids))
+    fields = list(values)
+    target = tuple(values[field] for field in fields)
+
+    with transaction.atomic():
+        current = (
+            model.objects.filter(id__in=ids)
+            .select_for_update()
+            .order_by("id")
+            .values_list("id", *fields)
+        )
+        found, changed = set(), []
+        for pk, *row in current:
+            found.add(pk)
+            if tuple(row) != target:
+                changed.append(pk)
+
+        if changed:
+            model.objects.filter(id__in=changed).update(**values, **(extra or {}))
+
+    changed_set = set(changed)
+    outcomes = {
+        pk: UPDATED if pk in changed_set else UNCHANGED if pk in found else NOT_FOUND for pk in ids
+    }
+    return changed, outcomes
@@ -0,0 +1,71 @@
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def reconcile_counter(
+    model,
+    field: str,
+    related_model,
+    related_field: str,
+    chunk_size: int = 1000,
+    dry_run: bool = False,
+    related_filter=None,
+) -> tuple[int, int]:
+    """Recompute a denormalized counter from its source rows in chunks and fix drift.
+
+    Rows of `model` are walked by id (keyset); each chunk costs one grouped
+    COUNT over `related_model`, and only drifted rows are updated.
+
+    Args:
+        field: counter column on `model` (e.g. "like_count")
+        related_field: FK on `related_model` pointing at `model` (e.g. "artwork")
+        related_filter: Q limiting which related rows are counted
+
+    Returns:
+        tuple: (rows checked, rows with drift)
+    """
+    related = related_model.objects.all()
+    if related_filter is not None:
+        related = related.filter(related_filter)
+    fk = f"{related_field}_id"
+
+    counted = (
+        related.filter(**{related_field: OuterRef("pk")})
+        .order_by()
+        .values(related_field)
+        .annotate(n=Count("id"))
+        .values("n")
+    )
+
+    last_id = 0
+    checked = fixed = 0
+    while True:
+        # id 기준 keyset 순회: 청크마다 집계 1회
+        rows = list(
+            model.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .values_list("id", field)[:chunk_size]
+        )
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        checked += len(rows)
+
+        ids = [pk for pk, _ in rows]
+        actual = dict(
+            related.filter(**{f"{fk}__in": ids})
+            .order_by()
+            .values(fk)
+            .annotate(n=Count("id"))
+            .values_list(fk, "n")
+        )
+        drifted = [pk for pk, stored in rows if stored != actual.get(pk, 0)]
+        if not drifted:
+            continue
+
+        fixed += len(drifted)
+        if not dry_run:
+            # 집계와 갱신 사이의 변경도 반영되도록 UPDATE 시점에 서브쿼리로 재계산
+            model.objects.filter(id__in=drifted).update(**{field: Coalesce(Subquery(counted), 0)})
+
+    return checked, fixed
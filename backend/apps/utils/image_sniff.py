@@ -0,0 +1,173 @@
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from botocore.exceptions import ClientError
+from django.conf import settings
+
+# 업로드 키 확장자 -> 실제 포맷
+EXTENSION_FORMATS = {
+    ".jpg": "jpeg",
+    ".jpeg": "jpeg",
+    ".png": "png",
+    ".gif": "gif",
+    ".webp": "webp",
+}
+# JPEG은 EXIF/ICC 세그먼트 뒤에 SOF가 오므로 추가 Range 요청 허용 (총 수신량 상한)
+SNIFF_MAX_BYTES = 1024 * 1024
+# SOF0~SOF15 중 DHT(C4), JPG(C8), DAC(CC) 제외
+JPEG_SOF_MARKERS = {0xC0 + n for n in range(16)} - {0xC4, 0xC8, 0xCC}
+
+
+@dataclass(frozen=True)
+class ImageInfo:
+    format: str
+    width: int
+    height: int
+
+
+@dataclass(frozen=True)
+class ObjectProbe:
+    size: int
+    image: ImageInfo | None
+
+
+class IncompleteHeader(Exception):
+    """The header continues past the fetched bytes; `needed` is the offset to read up to."""
+
+    def __init__(self, needed: int):
+        super().__init__(needed)
+        self.needed = needed
+
+
+def _jpeg_info(data: bytes) -> ImageInfo | None:
+    # 세그먼트 길이만 따라가며 SOF 마커를 찾음 (엔트로피 데이터 이전에 위치)
+    i = 2
+    while True:
+        if i + 4 > len(data):
+            raise IncompleteHeader(i + 4)
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:  # fill byte
+            i += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:  # 길이 없는 마커
+            i += 2
+            continue
+        if marker in (0xD9, 0xDA):  # SOF 이전에 EOI/SOS → 손상된 파일
+            return None
+        if marker in JPEG_SOF_MARKERS:
+            if i + 9 > len(data):
+                raise IncompleteHeader(i + 9)
+            height, width = struct.unpack(">HH", data[i + 5 : i + 9])
+            return ImageInfo("jpeg", width, height)
+        (length,) = struct.unpack(">H", data[i + 2 : i + 4])
+        i += 2 + length
+
+
+def _webp_info(data: bytes) -> ImageInfo | None:
+    if len(data) < 30:
+        return None
+    chunk = data[12:16]
+    if chunk == b"VP8 " and data[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", data[26:30])
+        return ImageInfo("webp", width & 0x3FFF, height & 0x3FFF)
+    if chunk == b"VP8L" and data[20] == 0x2F:
+        (bits,) = struct.unpack("<I", data[21:25])
+        return ImageInfo("webp", (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+    if chunk == b"VP8X":
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        return ImageInfo("webp", width, height)
+    return None
+
+
+def sniff_image(data: bytes) -> ImageInfo | None:
+    """Detect the real format and pixel size from the leading bytes of a file.
+
+    Only magic bytes and headers are parsed, nothing is decoded. Returns None
+    for anything that is not a well-formed JPEG, PNG, GIF or WebP header.
+
+    Raises:
+        IncompleteHeader: a JPEG whose frame header lies beyond `data`
+    """
+    if data[:3] == b"\xff\xd8\xff":
+        return _jpeg_info(data)
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        if len(data) < 24 or data[12:16] != b"IHDR":
+            return None
+        width, height = struct.unpack(">II", data[16:24])
+        return ImageInfo("png", width, height)
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        if len(data) < 10:
+            return None
+        width, height = struct.unpack("<HH", data[6:10])
+        return ImageInfo("gif", width, height)
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return _webp_info(data)
+    return None
+
+
+def _object_size(response: dict) -> int:
+    # Range 응답의 Content-Range: "bytes 0-16383/<전체 크기>"
+    content_range = response.get("ContentRange")
+    if content_range and "/" in content_range:
+        return int(content_range.rsplit("/", 1)[1])
+    return response["ContentLength"]
+
+
+def probe_object(s3, bucket: str, key: str, sniff_bytes: int | None = None) -> ObjectProbe:
+    """Read the object size and image header with ranged GETs (usually one).
+
+    Raises:
+        ClientError: missing object or S3 failure
+    """
+    sniff_bytes = sniff_bytes or settings.AWS_S3_SNIFF_BYTES
+    data, end = b"", sniff_bytes
+    while True:
+        response = s3.get_object(Bucket=bucket, Key=key, Range=f"bytes={len(data)}-{end - 1}")
+        data += response["Body"].read()
+        size = _object_size(response)
+        try:
+            return ObjectProbe(size, sniff_image(data))
+        except IncompleteHeader as e:
+            if len(data) >= size or e.needed > SNIFF_MAX_BYTES:
+                return ObjectProbe(size, None)
+            end = min(e.needed + sniff_bytes, SNIFF_MAX_BYTES)
+
+
+def probe_objects(s3, bucket: str, keys, max_workers: int | None = None) -> dict:
+    """Run `probe_object` for many keys concurrently on a bounded thread pool.
+
+    A ranged GET costs the same round trip as HeadObject but also returns the
+    file header, at a few KB instead of the full download per image.
+
+    Returns:
+        dict: key -> ObjectProbe, or the ClientError raised for that key
+    """
+    keys = list(dict.fromkeys(keys))
+    if not keys:
+        return {}
+
+    def probe(key):
+        try:
+            return probe_object(s3, bucket, key)
+        except ClientError as e:
+            return e
+
+    workers = min(len(keys), max_workers or settings.AWS_S3_HEAD_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(keys, executor.map(probe, keys), strict=True))
+
+
+def image_rejection_reason(key: str, image: ImageInfo | None) -> str | None:
+    """Why a sniffed upload cannot be accepted under `key`, None if it is fine."""
+    if image is None or not image.width or not image.height:
+        return "unsupported_format"
+    if EXTENSION_FORMATS.get(os.path.splitext(key.lower())[1]) != image.format:
+        return "format_mismatch"
+    if image.width * image.height > settings.ARTWORK_IMAGE_MAX_PIXELS:
+        return "dimensions_too_large"
+    return None
@@ -1,11 +1,12 @@
 import logging
 from uuid import uuid4
 
-import boto3
-from botocore.client import Config
 from botocore.exceptions import ClientError
 from django.conf import settings
 
+from .s3_client import get_s3_client
+from .s3_presigner import create_presigned_post
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,18 +14,8 @@ class PresignedUploadMixin:
     PRESIGNED_EXPIRES = settings.AWS_PRESIGNED_EXPIRES
 
     def _get_s3_client(self):
-        cfg = Config(
-            signature_version="s3v4",  # 권장 서명 버전
-            s3={"addressing_style": "path"},  # LocalStack 호환성 ↑
-        )
-        return boto3.client(
-            "s3",
-            region_name=settings.AWS_REGION,
-            endpoint_url=settings.AWS_ENDPOINT or None,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            config=cfg,
-        )
+        # 프로세스 공유 클라이언트 (요청/파일마다 새로 만들지 않음)
+        return get_s3_client()
 
     def _build_s3_key(
         self, category: str, object_id: int, ext: str, subdir: str | None = None
@@ -69,3 +60,11 @@ class PresignedUploadMixin:
         except Exception as e:
             logger.error(f"Failed to generate presigned URL: {str(e)}")
             raise
+
+    def _get_presigned_post(
+        self, *, bucket: str, key: str, content_type: str, expires: int | None = None
+    ) -> dict:
+        """Generate a presigned POST policy (size/type enforced by S3, see create_presigned_post)."""
+        return create_presigned_post(
+            bucket=bucket, key=key, content_type=content_type, expires=expires
+        )
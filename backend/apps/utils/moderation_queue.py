@@ -0,0 +1,52 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+
+def claimable(now=None) -> Q:
+    """Rows nobody holds a live lease on (never claimed or lease expired)."""
+    now = now or timezone.now()
+    return Q(review_claimed_until__isnull=True) | Q(review_claimed_until__lt=now)
+
+
+def claim_pending(queryset, user, limit: int, lease_seconds: int | None = None):
+    """Claim up to `limit` pending rows for `user` with a lease.
+
+    Rows are picked in queue order with `FOR UPDATE SKIP LOCKED`, so concurrent
+    moderators never block on or receive the same rows. Expired leases are
+    claimable again without a sweeper.
+
+    Args:
+        queryset: pending rows of a model with `review_claimed_by`/`review_claimed_until`
+        user: moderator taking the rows
+        limit: max rows to claim
+        lease_seconds: lease length, defaults to MODERATION_LEASE_SECONDS
+
+    Returns:
+        tuple[list[int], datetime]: claimed ids in queue order, lease expiry
+    """
+    now = timezone.now()
+    lease_until = now + timedelta(seconds=lease_seconds or settings.MODERATION_LEASE_SECONDS)
+
+    with transaction.atomic():
+        ids = list(
+            queryset.filter(claimable(now))
+            .order_by("created_at", "id")
+            .select_for_update(skip_locked=True, of=("self",))
+            .values_list("id", flat=True)[:limit]
+        )
+        if ids:
+            queryset.model.objects.filter(id__in=ids).update(
+                review_claimed_by=user, review_claimed_until=lease_until
+            )
+    return ids, lease_until
+
+
+def release_claims(model, ids, user) -> int:
+    """Return the user's claimed rows to the queue before their lease expires."""
+    return model.objects.filter(id__in=list(ids), review_claimed_by=user).update(
+        review_claimed_by=None, review_claimed_until=None
+    )
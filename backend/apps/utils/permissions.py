@@ -16,5 +16,10 @@ class IsSelf(BasePermission):
         if hasattr(obj, 'user'):
             user = getattr(obj, 'user', None)
             return user is not None and user == request.user
+
+        # 작품처럼 작가를 통해 소유자가 정해지는 객체
+        if hasattr(obj, 'artist'):
+            artist = getattr(obj, 'artist', None)
+            return artist is not None and artist.user_id == request.user.id
             
         return False
\ No newline at end of file
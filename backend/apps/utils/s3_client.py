@@ -1,18 +1,82 @@
+import os
+import threading
+
 import boto3
 from botocore.client import Config
 from django.conf import settings
 
+# 프로세스 단위 클라이언트 캐시: (서비스, pid, 설정) -> client
+# boto3 client는 스레드 안전하므로 gunicorn 스레드끼리 공유, fork 후에는 pid가 달라 새로 생성
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _client_config_key(service: str, region: str | None, endpoint_url: str | None) -> tuple:
+    return (
+        service,
+        os.getpid(),
+        region or settings.AWS_REGION,
+        endpoint_url or settings.AWS_ENDPOINT or None,
+        settings.AWS_ACCESS_KEY_ID,
+        settings.AWS_SECRET_ACCESS_KEY,
+        settings.AWS_S3_MAX_POOL_CONNECTIONS,
+    )
+
 
-def get_s3_client():
+def _create_client(
+    service, pid, region, endpoint_url, access_key, secret_key, max_pool_connections
+):
     cfg = Config(
-        signature_version="s3v4",  # 권장 서명 버전
-        s3={"addressing_style": "path"},  # LocalStack 호환성 ↑
+        signature_version="s3v4" if service == "s3" else None,  # 권장 서명 버전
+        s3={"addressing_style": "path"} if service == "s3" else None,  # LocalStack 호환성 ↑
+        max_pool_connections=max_pool_connections,
     )
-    return boto3.client(
-        "s3",
-        region_name=settings.AWS_REGION,
-        endpoint_url=settings.AWS_ENDPOINT or None,
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+    # 기본 세션은 스레드 안전하지 않으므로 클라이언트마다 세션 생성
+    return boto3.session.Session().client(
+        service,
+        region_name=region,
+        endpoint_url=endpoint_url,
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
         config=cfg,
     )
+
+
+def get_aws_client(service: str, region: str | None = None, endpoint_url: str | None = None):
+    """Return the shared boto3 client for this process, service and configuration.
+
+    Built once per (service, process, region, endpoint, credentials, pool size)
+    and reused by every request thread and Celery task.
+    """
+    key = _client_config_key(service, region, endpoint_url)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = _create_client(*key)
+    return client
+
+
+def get_s3_client(region: str | None = None, endpoint_url: str | None = None):
+    """Return the shared S3 client; pass `region` for buckets living outside AWS_REGION."""
+    return get_aws_client("s3", region, endpoint_url)
+
+
+def get_sqs_client(region: str | None = None, endpoint_url: str | None = None):
+    return get_aws_client("sqs", region, endpoint_url)
+
+
+def public_object_url(key: str, bucket: str | None = None) -> str:
+    """Public URL of an artwork-bucket object (AWS_S3_ARTWORK_PUBLIC_URL, e.g. a CDN, if set)."""
+    base = settings.AWS_S3_ARTWORK_PUBLIC_URL
+    if not base or bucket:
+        bucket = bucket or settings.AWS_S3_ARTWORK_BUCKET
+        base = f"https://{bucket}.s3.{settings.AWS_REGION}.amazonaws.com"
+    return f"{base.rstrip('/')}/{key}"
+
+
+def reset_s3_clients() -> None:
+    """Drop cached clients (credential rotation, tests)."""
+    with _clients_lock:
+        _clients.clear()
@@ -0,0 +1,91 @@
+import logging
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.utils import timezone
+
+from .s3_client import get_s3_client
+
+logger = logging.getLogger(__name__)
+
+# DeleteObjects 1회 요청당 최대 키 수
+DELETE_BATCH_SIZE = 1000
+
+
+@dataclass
+class OrphanReport:
+    scanned: int = 0
+    orphaned: int = 0
+    orphaned_bytes: int = 0
+    deleted: int = 0
+    errors: list[dict] = field(default_factory=list)
+    keys: list[str] = field(default_factory=list)
+
+
+def _delete_batch(s3, bucket: str, keys: list[str], report: OrphanReport) -> None:
+    response = s3.delete_objects(
+        Bucket=bucket,
+        Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+    )
+    # Quiet 모드: 실패한 키만 반환됨
+    errors = response.get("Errors", [])
+    report.deleted += len(keys) - len(errors)
+    report.errors += [{"key": e.get("Key"), "code": e.get("Code")} for e in errors]
+
+
+def collect_orphans(
+    bucket: str,
+    prefix: str,
+    referenced,
+    grace_seconds: int,
+    dry_run: bool = False,
+    collect_keys: bool = False,
+) -> OrphanReport:
+    """Delete objects under `prefix` that nothing in the database references.
+
+    ListObjectsV2 pages (up to 1000 keys) are streamed and each page is checked
+    with one `referenced(keys) -> set` call, so memory stays bounded by a page
+    plus one pending delete batch. Objects younger than `grace_seconds` are kept
+    (uploads still waiting for confirmation). Orphans are removed with
+    DeleteObjects in batches of 1000.
+
+    Args:
+        referenced: callable returning the subset of the given keys still in use
+        dry_run: report only, delete nothing
+        collect_keys: keep the orphaned keys on the report (dry-run listing)
+    """
+    s3 = get_s3_client()
+    cutoff = timezone.now() - timedelta(seconds=grace_seconds)
+    report = OrphanReport()
+    pending = []
+
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        objects = [obj for obj in page.get("Contents", []) if obj["LastModified"] < cutoff]
+        report.scanned += page.get("KeyCount", len(page.get("Contents", [])))
+        if not objects:
+            continue
+
+        in_use = referenced([obj["Key"] for obj in objects])
+        for obj in objects:
+            if obj["Key"] in in_use:
+                continue
+            report.orphaned += 1
+            report.orphaned_bytes += obj.get("Size", 0)
+            if collect_keys:
+                report.keys.append(obj["Key"])
+            if not dry_run:
+                pending.append(obj["Key"])
+
+        while len(pending) >= DELETE_BATCH_SIZE:
+            _delete_batch(s3, bucket, pending[:DELETE_BATCH_SIZE], report)
+            pending = pending[DELETE_BATCH_SIZE:]
+
+    if pending:
+        _delete_batch(s3, bucket, pending, report)
+
+    logger.info(
+        f"Orphan GC {bucket}/{prefix}: scanned={report.scanned} orphaned={report.orphaned} "
+        f"deleted={report.deleted} errors={len(report.errors)} dry_run={dry_run}"
+    )
+    return report
@@ -0,0 +1,119 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .s3_client import get_s3_client
+
+logger = logging.getLogger(__name__)
+
+# S3 제약: 파트는 1~10000번, 마지막 파트를 제외하고 최소 5MB
+MAX_PART_NUMBER = 10000
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+def create_multipart_upload(bucket: str, key: str, content_type: str) -> str:
+    """Start a multipart upload and return its UploadId."""
+    response = get_s3_client().create_multipart_upload(
+        Bucket=bucket, Key=key, ContentType=content_type
+    )
+    return response["UploadId"]
+
+
+def presign_upload_parts(
+    bucket: str, key: str, upload_id: str, part_numbers, expires: int | None = None
+) -> list[dict]:
+    """Presign UploadPart URLs so the client can PUT parts in parallel.
+
+    Signing is local (no S3 round trip), so a batch costs no network time.
+
+    Returns:
+        list[dict]: [{"part_number": 1, "url": "..."}, ...]
+    """
+    s3 = get_s3_client()
+    expires = expires or settings.AWS_PRESIGNED_EXPIRES
+    return [
+        {
+            "part_number": part_number,
+            "url": s3.generate_presigned_url(
+                ClientMethod="upload_part",
+                Params={
+                    "Bucket": bucket,
+                    "Key": key,
+                    "UploadId": upload_id,
+                    "PartNumber": part_number,
+                },
+                ExpiresIn=expires,
+            ),
+        }
+        for part_number in part_numbers
+    ]
+
+
+def list_uploaded_parts(bucket: str, key: str, upload_id: str) -> list[dict]:
+    """Parts S3 already has for an upload, so an interrupted client can resume.
+
+    Returns:
+        list[dict]: [{"part_number": 1, "etag": "...", "size": 5242880}, ...]
+    """
+    paginator = get_s3_client().get_paginator("list_parts")
+    parts = []
+    for page in paginator.paginate(Bucket=bucket, Key=key, UploadId=upload_id):
+        parts += [
+            {"part_number": part["PartNumber"], "etag": part["ETag"], "size": part["Size"]}
+            for part in page.get("Parts", [])
+        ]
+    return parts
+
+
+def complete_multipart_upload(bucket: str, key: str, upload_id: str, parts) -> None:
+    """Assemble the uploaded parts into the final object.
+
+    Args:
+        parts: [{"part_number": 1, "etag": "..."}, ...] in any order
+    """
+    get_s3_client().complete_multipart_upload(
+        Bucket=bucket,
+        Key=key,
+        UploadId=upload_id,
+        MultipartUpload={
+            "Parts": [
+                {"PartNumber": part["part_number"], "ETag": part["etag"]}
+                for part in sorted(parts, key=lambda part: part["part_number"])
+            ]
+        },
+    )
+
+
+def abort_multipart_upload(bucket: str, key: str, upload_id: str) -> None:
+    """Abort an upload and let S3 discard its stored parts."""
+    get_s3_client().abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+
+
+def abort_stale_multipart_uploads(
+    bucket: str, prefix: str = "", older_than: int | None = None
+) -> int:
+    """Abort incomplete multipart uploads initiated more than `older_than` seconds ago.
+
+    Parts of abandoned uploads are billed until aborted, and they never show up
+    as objects, so they have to be found via ListMultipartUploads.
+
+    Returns:
+        int: number of uploads aborted
+    """
+    s3 = get_s3_client()
+    older_than = older_than or settings.AWS_S3_MULTIPART_STALE_SECONDS
+    cutoff = timezone.now() - timedelta(seconds=older_than)
+
+    aborted = 0
+    paginator = s3.get_paginator("list_multipart_uploads")
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        for upload in page.get("Uploads", []):
+            if upload["Initiated"] >= cutoff:
+                continue
+            s3.abort_multipart_upload(Bucket=bucket, Key=upload["Key"], UploadId=upload["UploadId"])
+            aborted += 1
+
+    logger.info(f"Aborted {aborted} stale multipart uploads in {bucket}/{prefix}")
+    return aborted
@@ -48,3 +48,38 @@ def create_presigned_url(
     except Exception as e:
         logger.error(f"Failed to generate presigned URL: {str(e)}")
         raise
+
+
+def create_presigned_post(
+    bucket: str,
+    key: str,
+    content_type: str,
+    max_size: int | None = None,
+    expires: int | None = None,
+) -> dict:
+    """Generate a presigned POST policy for uploading a file to S3.
+
+    The signed policy pins the exact key, the Content-Type and a
+    content-length-range, so S3 itself rejects oversize or mistyped uploads.
+
+    Returns:
+        dict: {"url": form action URL, "fields": form fields to send with the file}
+    """
+    s3 = get_s3_client()
+    expires = expires or settings.AWS_PRESIGNED_EXPIRES
+    try:
+        post = s3.generate_presigned_post(
+            Bucket=bucket,
+            Key=key,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, max_size or settings.AWS_S3_MAX_FILE_SIZE],
+            ],
+            ExpiresIn=expires,
+        )
+    except Exception as e:
+        logger.error(f"Failed to generate presigned POST: {str(e)}")
+        raise
+
+    return post
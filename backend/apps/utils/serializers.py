@@ -1,14 +1,22 @@
 import os
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
 User = get_user_model()
 
+# put: presigned PUT URL (기존 방식), post: 크기/타입 조건이 서명된 presigned POST 정책
+UPLOAD_METHOD_CHOICES = ("put", "post")
+
 
 class S3ImageUploadSerializer(serializers.Serializer):
     filename = serializers.CharField(max_length=255)
     content_type = serializers.CharField(max_length=50)
+    size = serializers.IntegerField(
+        required=False, min_value=1, max_value=settings.AWS_S3_MAX_FILE_SIZE
+    )
+    upload_method = serializers.ChoiceField(choices=UPLOAD_METHOD_CHOICES, default="put")
 
     def validate(self, attrs):
         filename = attrs.get("filename")
@@ -41,15 +49,65 @@ class S3ImageUploadSerializer(serializers.Serializer):
 
 class ArtworkImageBatchSerializer(serializers.Serializer):
     files = S3ImageUploadSerializer(many=True, max_length=10)
+    upload_method = serializers.ChoiceField(choices=UPLOAD_METHOD_CHOICES, default="put")
 
 
 class ConfirmItemIn(serializers.Serializer):
     key = serializers.CharField()
-    caption = serializers.CharField(required=False, allow_blank=True)
+    alt_text = serializers.CharField(required=False, allow_blank=True, max_length=200)
     order = serializers.IntegerField(required=False, default=0)
 
 
 class ConfirmBatchIn(serializers.Serializer):
     upload_id = serializers.CharField()
     items = ConfirmItemIn(many=True)
-    set_cover_from = serializers.IntegerField(required=False)
+    # 커버로 지정할 이미지 키 (이번 배치에서 확인된 키만 반영)
+    set_cover = serializers.CharField(required=False)
+
+    def validate_items(self, items):
+        # 같은 키가 두 번 오면 upsert(ON CONFLICT DO UPDATE)가 한 행을 두 번 갱신하려다 실패함
+        keys = [item["key"] for item in items]
+        if len(set(keys)) != len(keys):
+            raise serializers.ValidationError("Duplicate keys")
+        return items
+
+
+class MultipartCreateIn(S3ImageUploadSerializer):
+    size = serializers.IntegerField(min_value=1, max_value=settings.AWS_S3_MULTIPART_MAX_FILE_SIZE)
+    upload_method = None
+
+
+class MultipartUploadIn(serializers.Serializer):
+    key = serializers.CharField()
+    upload_id = serializers.CharField()
+
+
+class MultipartPartsIn(MultipartUploadIn):
+    part_numbers = serializers.ListField(
+        child=serializers.IntegerField(min_value=1, max_value=10000),
+        allow_empty=False,
+        max_length=settings.AWS_S3_MULTIPART_PARTS_PER_REQUEST,
+    )
+
+
+class MultipartPartIn(serializers.Serializer):
+    part_number = serializers.IntegerField(min_value=1, max_value=10000)
+    etag = serializers.CharField()
+
+
+class MultipartCompleteIn(MultipartUploadIn):
+    parts = MultipartPartIn(many=True, allow_empty=False)
+
+
+class BulkIdsSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=settings.BULK_MODERATION_MAX_ITEMS,
+    )
+
+
+class ModerationClaimSerializer(serializers.Serializer):
+    limit = serializers.IntegerField(
+        min_value=1, max_value=settings.MODERATION_CLAIM_MAX_ITEMS, default=10
+    )
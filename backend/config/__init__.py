@@ -0,0 +1,4 @@
+# Django 기동 시 Celery 앱을 로드해 shared_task 가 설정(브로커, eager 모드 등)을 사용하도록 함
+from .celery import app as celery_app
+
+__all__ = ("celery_app",)
@@ -47,6 +47,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "apps.accounts",
     "apps.artists",
     "apps.artworks",
@@ -220,6 +221,57 @@ CACHES = {
 
 CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL", "redis://127.0.0.1:6379/0")
 
+CELERY_BEAT_SCHEDULE = {
+    "flush-artwork-view-counts": {
+        "task": "apps.artworks.tasks.flush_artwork_view_counts",
+        "schedule": 60.0,
+    },
+    "ingest-s3-upload-events": {
+        "task": "apps.artworks.tasks.ingest_artwork_upload_events",
+        "schedule": 30.0,
+    },
+    "abort-stale-multipart-uploads": {
+        "task": "apps.artworks.tasks.abort_stale_artwork_multipart_uploads",
+        "schedule": 60.0 * 60,
+    },
+    "collect-orphaned-uploads": {
+        "task": "apps.artworks.tasks.collect_orphaned_uploads_task",
+        "schedule": 60.0 * 60 * 24,
+    },
+}
+
+# 조회수 중복 제거 윈도우 (같은 유저/IP의 재조회는 이 시간 동안 무시)
+ARTWORK_VIEW_DEDUP_SECONDS = int(os.environ.get("ARTWORK_VIEW_DEDUP_SECONDS", 1800))
+# 앞단 신뢰 프록시 수: 0이면 X-Forwarded-For 를 무시하고 REMOTE_ADDR 사용
+ARTWORK_VIEW_TRUSTED_PROXIES = int(os.environ.get("ARTWORK_VIEW_TRUSTED_PROXIES", 0))
+# 조회수 flush 동시 실행 방지 락 TTL(초)
+ARTWORK_VIEW_FLUSH_LOCK_SECONDS = int(os.environ.get("ARTWORK_VIEW_FLUSH_LOCK_SECONDS", 300))
+
+# 공개 작품 목록/상세 응답 캐시 TTL (무효화는 버전 카운터로 처리)
+ARTWORK_RESPONSE_CACHE_SECONDS = int(os.environ.get("ARTWORK_RESPONSE_CACHE_SECONDS", 300))
+
+# 팔로우 피드: 유저별 타임라인/작가별 최근 작품 보관 개수, fan-out 청크 크기, 팔로우 시 백필 개수
+FEED_TIMELINE_MAX = int(os.environ.get("FEED_TIMELINE_MAX", 800))
+FEED_ARTIST_TIMELINE_MAX = int(os.environ.get("FEED_ARTIST_TIMELINE_MAX", 200))
+FEED_FANOUT_CHUNK_SIZE = int(os.environ.get("FEED_FANOUT_CHUNK_SIZE", 1000))
+FEED_BACKFILL_SIZE = int(os.environ.get("FEED_BACKFILL_SIZE", 20))
+# 팔로워가 이 수 이상인 작가는 fan-out 대신 읽기 시점에 병합
+FEED_CELEBRITY_FOLLOWERS = int(os.environ.get("FEED_CELEBRITY_FOLLOWERS", 10000))
+FEED_PAGE_SIZE = int(os.environ.get("FEED_PAGE_SIZE", 20))
+
+# 팔로워 알림 fan-out: 서버 사이드 커서로 읽는 팔로워 청크이자 bulk_create 1회 배치 크기
+NOTIFICATION_FANOUT_CHUNK_SIZE = int(os.environ.get("NOTIFICATION_FANOUT_CHUNK_SIZE", 1000))
+# 좋아요/팔로우 알림 병합 윈도우(초)와 행마다 보관하는 최근 행위자 수
+NOTIFICATION_COALESCE_SECONDS = int(os.environ.get("NOTIFICATION_COALESCE_SECONDS", 60 * 60 * 24))
+NOTIFICATION_ACTOR_SAMPLE_SIZE = int(os.environ.get("NOTIFICATION_ACTOR_SAMPLE_SIZE", 5))
+
+# 관리자 일괄 승인/거절 1회 요청당 최대 처리 건수
+BULK_MODERATION_MAX_ITEMS = int(os.environ.get("BULK_MODERATION_MAX_ITEMS", 10000))
+
+# 검수 큐 점유(lease) 유지 시간(초)과 1회 점유 최대 건수, 만료된 항목은 다시 큐로 반환
+MODERATION_LEASE_SECONDS = int(os.environ.get("MODERATION_LEASE_SECONDS", 600))
+MODERATION_CLAIM_MAX_ITEMS = int(os.environ.get("MODERATION_CLAIM_MAX_ITEMS", 50))
+
 # S3 기본 설정
 AWS_ACCESS_KEY_ID = os.environ.get("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.environ.get("AWS_SECRET_ACCESS_KEY")
@@ -230,6 +282,44 @@ AWS_S3_PROFILE_BUCKET = os.environ.get("AWS_S3_PROFILE_BUCKET")
 AWS_S3_MAX_FILE_SIZE = int(os.environ.get("AWS_S3_MAX_FILE_SIZE", "10485760"))  # 10MB
 AWS_ENDPOINT = os.environ.get("AWS_ENDPOINT")  # LocalStack!
 AWS_PRESIGNED_EXPIRES = int(os.getenv("AWS_PRESIGNED_EXPIRES", "600"))
+# 업로드 확인 시 S3 동시 요청 수
+AWS_S3_HEAD_MAX_WORKERS = int(os.getenv("AWS_S3_HEAD_MAX_WORKERS", "10"))
+# 공유 S3 클라이언트의 HTTP 커넥션 풀 크기 (업로드 확인 동시 요청 수 이상)
+AWS_S3_MAX_POOL_CONNECTIONS = int(os.getenv("AWS_S3_MAX_POOL_CONNECTIONS", "20"))
+# 고해상도 원본용 멀티파트 업로드: 최대 파일 크기(500MB), 기본 파트 크기(최소 5MB), 요청당 presign 파트 수
+AWS_S3_MULTIPART_MAX_FILE_SIZE = int(os.getenv("AWS_S3_MULTIPART_MAX_FILE_SIZE", "524288000"))
+AWS_S3_MULTIPART_PART_SIZE = int(os.getenv("AWS_S3_MULTIPART_PART_SIZE", "8388608"))  # 8MB
+AWS_S3_MULTIPART_PARTS_PER_REQUEST = int(os.getenv("AWS_S3_MULTIPART_PARTS_PER_REQUEST", "100"))
+# 이 시간(초)보다 오래된 미완료 멀티파트 업로드는 sweeper가 abort
+AWS_S3_MULTIPART_STALE_SECONDS = int(os.getenv("AWS_S3_MULTIPART_STALE_SECONDS", "86400"))
+# 작품 버킷 ObjectCreated 이벤트를 받는 SQS 큐 (미설정 시 이벤트 수집 비활성화)
+AWS_S3_EVENTS_QUEUE_URL = os.getenv("AWS_S3_EVENTS_QUEUE_URL")
+AWS_S3_EVENTS_MAX_BATCHES = int(os.getenv("AWS_S3_EVENTS_MAX_BATCHES", "10"))
+AWS_S3_EVENTS_WAIT_SECONDS = int(os.getenv("AWS_S3_EVENTS_WAIT_SECONDS", "1"))
+# 작품 이미지 공개 URL 베이스 (CDN 도메인 등, 미설정 시 S3 버킷 URL)
+AWS_S3_ARTWORK_PUBLIC_URL = os.getenv("AWS_S3_ARTWORK_PUBLIC_URL")
+# 파생 이미지(썸네일/반응형) 가로 크기(px)와 목록 썸네일 기준 폭
+ARTWORK_IMAGE_WIDTHS = [
+    int(w) for w in os.getenv("ARTWORK_IMAGE_WIDTHS", "320,640,1280,1920").split(",")
+]
+ARTWORK_LIST_THUMBNAIL_WIDTH = int(os.getenv("ARTWORK_LIST_THUMBNAIL_WIDTH", "640"))
+# 파생 이미지 생성 시 원본을 메모리에 두는 최대 바이트 (초과분은 임시 파일로)
+ARTWORK_IMAGE_SPOOL_BYTES = int(os.getenv("ARTWORK_IMAGE_SPOOL_BYTES", str(32 * 1024 * 1024)))
+# 참조되지 않는 업로드 객체 정리 유예 시간(초), confirm 대기 중인 업로드 보호 (기본 2일)
+AWS_S3_ORPHAN_GRACE_SECONDS = int(os.getenv("AWS_S3_ORPHAN_GRACE_SECONDS", "172800"))
+# 소프트 삭제된 작품의 이미지를 보존하는 기간(초), 삭제 시점 기준 (기본 30일, 이후 GC 대상)
+ARTWORK_DELETED_IMAGE_RETENTION_SECONDS = int(
+    os.getenv("ARTWORK_DELETED_IMAGE_RETENTION_SECONDS", str(30 * 24 * 3600))
+)
+# 업로드 확인 시 포맷/크기 판별용으로 Range GET 하는 선두 바이트 수
+AWS_S3_SNIFF_BYTES = int(os.getenv("AWS_S3_SNIFF_BYTES", "16384"))
+# 허용 최대 픽셀 수 (고해상도 스캔 허용, 디코딩 폭탄 차단)
+ARTWORK_IMAGE_MAX_PIXELS = int(os.getenv("ARTWORK_IMAGE_MAX_PIXELS", "150000000"))
+# 중복 업로드로 표시할 지각 해시 해밍 거리 (64비트 중), 관리자 검색 시 허용 최대 거리
+ARTWORK_DUPLICATE_MAX_DISTANCE = int(os.getenv("ARTWORK_DUPLICATE_MAX_DISTANCE", "6"))
+ARTWORK_DUPLICATE_SEARCH_MAX_DISTANCE = int(
+    os.getenv("ARTWORK_DUPLICATE_SEARCH_MAX_DISTANCE", "12")
+)
 
 # GOOGLE
 GOOGLE_CLIENT_ID = os.environ.get("GOOGLE_CLIENT_ID")
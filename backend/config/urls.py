@@ -24,6 +24,7 @@ urlpatterns = [
     path("api/v1/accounts/", include("apps.accounts.urls")),
     path("api/v1/artists/", include("apps.artists.urls")),
     path("api/v1/artworks/", include("apps.artworks.urls")),
+    path("api/v1/interactions/", include("apps.interactions.urls")),
     # path("api/v1/tags/", include('tags.urls')),
     # path("api/v1/ai_intergration/", include('ai_intergration.urls')),
 ]
@@ -98,4 +98,20 @@ def admin_user(db):
 def admin_client(api_client, admin_user):
     refresh = RefreshToken.for_user(admin_user)
     api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
-    return api_client
\ No newline at end of file
+    return api_client
+""" 작품 """
+@pytest.fixture
+def artwork_factory(db):
+    from apps.artworks.models import Artwork
+
+    def create(artist, **kwargs):
+        kwargs.setdefault("title", "test artwork")
+        kwargs.setdefault("year_created", 2024)
+        kwargs.setdefault("materials", "캔버스에 아크릴")
+        kwargs.setdefault("width", 50.0)
+        kwargs.setdefault("height", 70.0)
+        kwargs.setdefault("category", "painting")
+        kwargs.setdefault("approval_status", Artwork.ApprovalStatus.APPROVED)
+        return Artwork.objects.language('ko').create(artist=artist, **kwargs)
+
+    return create